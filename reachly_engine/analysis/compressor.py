@@ -0,0 +1,261 @@
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from reachly_engine.config import PROFILE_TOKEN_BUDGET
+from reachly_engine.llm.tokenizer import estimate_tokens
+from reachly_engine.logger import get_logger
+
+logger = get_logger("compressor")
+
+# Section headings as they appear in page text ("Experience") and in
+# Profile.render() ("Experience:"), with how much their content is worth
+SECTION_WEIGHTS = {
+    "": 1.2,  # intro: name, headline, location
+    "about": 1.1,
+    "experience": 1.4,
+    "education": 0.9,
+    "skills": 0.8,
+    "licenses & certifications": 0.6,
+    "certifications": 0.6,
+    "projects": 0.6,
+    "volunteering": 0.4,
+    "honors & awards": 0.4,
+    "publications": 0.4,
+    "languages": 0.4,
+    "recommendations": 0.3,
+    "interests": 0.3,
+    "activity": 0.3,
+}
+OTHER_SECTION_WEIGHT = 0.5
+
+_HEADING = re.compile(
+    r"^(" + "|".join(re.escape(s) for s in SECTION_WEIGHTS if s) + r")\s*:?$",
+    re.IGNORECASE,
+)
+
+# The first lines of a profile (name, headline, location) are always kept
+PINNED_LINES = 3
+
+# Lines longer than this are split into sentences, sentences longer than
+# UNIT_MAX_CHARS into word runs, so one paragraph cannot eat the budget
+SPLIT_LINE_CHARS = 300
+UNIT_MAX_CHARS = 400
+
+_SENTENCE = re.compile(r"(?<=[.!?])\s+(?=[A-Z0-9\"'(])")
+_TERM = re.compile(r"[a-z][a-z0-9+#.&-]{2,}")
+
+_ROLE = re.compile(
+    r"\b(founder|co-founder|owner|ceo|cto|cfo|coo|cmo|chief|president|vp|"
+    r"vice president|head|director|partner|principal|manager|lead|staff|"
+    r"senior|engineer|consultant|recruiter|architect)\b",
+    re.IGNORECASE,
+)
+_CURRENT = re.compile(r"\b(present|current|currently|now)\b", re.IGNORECASE)
+
+STOPWORDS = set(
+    """
+    the and for with that this from are was were have has had will would can
+    our your their his her its you they them who what which when where how
+    all any been being into over more most other some such than too very
+    just also about not but out off per via
+    """.split()
+)
+
+
+@dataclass
+class _Unit:
+    index: int
+    line: int
+    text: str
+    section: str
+    rank: int  # position among the section's units
+    tokens: float = 0.0
+    score: float = 0.0
+    pinned: bool = False
+
+
+def _pieces(line: str) -> list[str]:
+    if len(line) <= SPLIT_LINE_CHARS:
+        return [line]
+
+    pieces = []
+    for sentence in _SENTENCE.split(line):
+        while len(sentence) > UNIT_MAX_CHARS:
+            cut = sentence.rfind(" ", 0, UNIT_MAX_CHARS)
+            cut = cut if cut > 0 else UNIT_MAX_CHARS
+            pieces.append(sentence[:cut])
+            sentence = sentence[cut:].lstrip()
+        if sentence:
+            pieces.append(sentence)
+    return pieces
+
+
+def _split(text: str) -> tuple[list[_Unit], dict[int, str]]:
+    """
+    Units in reading order, plus the heading shown before each line
+    index that opens a section.
+    """
+    units: list[_Unit] = []
+    headings: dict[int, str] = {}
+    section = ""
+    ranks: Counter = Counter()
+    content_lines = 0
+
+    for number, line in enumerate(text.splitlines()):
+        line = line.strip()
+        if not line:
+            continue
+
+        heading = _HEADING.match(line)
+        if heading:
+            section = heading.group(1).lower()
+            headings[number] = line
+            continue
+
+        for piece in _pieces(line):
+            units.append(
+                _Unit(
+                    index=len(units),
+                    line=number,
+                    text=piece,
+                    section=section,
+                    rank=ranks[section],
+                    pinned=section == "" and content_lines < PINNED_LINES,
+                )
+            )
+            ranks[section] += 1
+        content_lines += 1
+
+    return units, headings
+
+
+def _terms(text: str) -> list[str]:
+    return [t for t in _TERM.findall(text.lower()) if t not in STOPWORDS]
+
+
+def _score(units: list[_Unit]):
+    """
+    Salience = section weight x recency within the section x TF-IDF
+    informativeness, plus bonuses for role titles and current positions.
+    Markup-heavy units (JSON, URNs) are pushed to the bottom.
+    """
+    docs = [_terms(u.text) for u in units]
+    df = Counter()
+    for terms in docs:
+        df.update(set(terms))
+    n = len(units)
+
+    raw = []
+    for terms in docs:
+        if not terms:
+            raw.append(0.0)
+            continue
+        tf = Counter(terms)
+        weight = sum(c * math.log((n + 1) / (df[t] + 0.5)) for t, c in tf.items())
+        raw.append(weight / math.sqrt(len(terms)))
+    top = max(raw, default=0.0) or 1.0
+
+    for unit, info in zip(units, raw):
+        section = SECTION_WEIGHTS.get(unit.section, OTHER_SECTION_WEIGHT)
+        recency = 1.0 / (1.0 + unit.rank / 8)
+        score = section * recency * (0.5 + info / top)
+
+        if _ROLE.search(unit.text):
+            score += 0.4
+        if _CURRENT.search(unit.text):
+            score += 0.4
+
+        letters = sum(ch.isalnum() or ch.isspace() for ch in unit.text)
+        if letters < 0.7 * len(unit.text):
+            score *= 0.2
+
+        unit.score = score
+
+
+def _render(units: list[_Unit], headings: dict[int, str]) -> str:
+    lines: list[str] = []
+    heading_lines = sorted(headings)
+    current_line = None
+
+    for unit in units:
+        if unit.line != current_line:
+            # Heading of the section this line belongs to, once
+            opened = [h for h in heading_lines if h < unit.line]
+            if opened and headings.get(opened[-1]) is not None:
+                if lines:
+                    lines.append("")
+                lines.append(headings.pop(opened[-1]))
+            lines.append(unit.text)
+            current_line = unit.line
+        else:
+            lines[-1] += " " + unit.text
+
+    return "\n".join(lines)
+
+
+def compress_profile(
+    text: str,
+    max_tokens: int = PROFILE_TOKEN_BUDGET,
+    count: Optional[Callable[[str], int]] = None,
+) -> str:
+    """
+    Extractive compression of profile text into `max_tokens` (by `count`,
+    the model tokenizer when given). Lines and sentences are ranked by
+    salience and the best ones packed into the budget, then emitted in
+    their original order under their section headings. Text that already
+    fits is returned unchanged.
+    """
+    count = count or estimate_tokens
+    if not text:
+        return ""
+
+    total = count(text)
+    if total <= max_tokens:
+        return text
+
+    units, headings = _split(text)
+    if not units:
+        return ""
+    _score(units)
+
+    # Per-unit sizes from the cheap estimate, calibrated once against the
+    # real count; the assembled text is checked with `count` below
+    ratio = total / max(estimate_tokens(text), 1)
+    for unit in units:
+        unit.tokens = estimate_tokens(unit.text) * ratio
+
+    heading_tokens = 2 * ratio * len(headings)
+    used = heading_tokens
+    chosen: list[_Unit] = []
+    for unit in sorted(units, key=lambda u: (not u.pinned, -u.score)):
+        if used + unit.tokens <= max_tokens:
+            chosen.append(unit)
+            used += unit.tokens
+
+    # Drop the least salient units until the real count fits
+    chosen.sort(key=lambda u: u.index)
+    result = _render(chosen, dict(headings))
+    while chosen and count(result) > max_tokens:
+        chosen.remove(min(chosen, key=lambda u: (u.pinned, u.score)))
+        result = _render(chosen, dict(headings))
+
+    logger.info(
+        f"Compressed profile: {total} → {count(result)} tokens "
+        f"({len(chosen)}/{len(units)} units)"
+    )
+    return result
+
+
+def compress_for_llm(
+    text: str, llm, max_tokens: int = PROFILE_TOKEN_BUDGET
+) -> str:
+    """
+    compress_profile() counting with the client's tokenizer when it has a
+    context budgeter, otherwise with the chars/token estimate.
+    """
+    budgeter = getattr(llm, "budgeter", None)
+    count = budgeter.tokenizer.count if budgeter is not None else None
+    return compress_profile(text, max_tokens=max_tokens, count=count)
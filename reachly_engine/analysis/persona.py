@@ -1,47 +1,227 @@
-from dataclasses import dataclass
+import json
+from typing import Optional
 
-from reachly_engine.analysis.style import infer_style
-from reachly_engine.analysis.summarizer import summarize_profile
+from pydantic import BaseModel, Field, ValidationError, field_validator
+
+from reachly_engine.analysis.compressor import compress_for_llm
+from reachly_engine.analysis.style import infer_style, infer_style_in_session
+from reachly_engine.analysis.summarizer import (
+    summarize_profile,
+    summarize_in_session,
+)
+from reachly_engine.constants import TONE_FORMAL, TONE_CASUAL, TONE_MIXED
 from reachly_engine.llm.ollama_client import OllamaClient
-from reachly_engine.llm.prompts import SYSTEM_ANALYSIS, PERSONA_ANALYSIS_PROMPT
+from reachly_engine.llm.session import ProfileSession
+from reachly_engine.llm.prompts import (
+    SYSTEM_ANALYSIS,
+    PERSONA_ANALYSIS_PROMPT,
+    PERSONA_ANALYSIS_QUESTION,
+    PERSONA_JSON_PROMPT,
+)
 from reachly_engine.logger import get_logger
+from reachly_engine.models.persona import Persona
 
 logger = get_logger("persona")
 
+SENIORITY_LEVELS = ["junior", "mid", "senior", "lead", "executive"]
+
+_BLANK_VALUES = {"", "n/a", "na", "none", "null", "unknown", "not available"}
+
+# JSON schema for Ollama's `format`; mirrors PersonaExtraction below
+PERSONA_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "summary": {"type": "string"},
+        "name": {"type": "string"},
+        "role": {"type": "string"},
+        "company": {"type": "string"},
+        "industry": {"type": "string"},
+        "seniority": {"type": "string", "enum": SENIORITY_LEVELS + [""]},
+        "interests": {"type": "array", "items": {"type": "string"}},
+        "style": {
+            "type": "object",
+            "properties": {
+                "tone": {
+                    "type": "string",
+                    "enum": [TONE_FORMAL, TONE_CASUAL, TONE_MIXED],
+                },
+                "emoji_usage": {"type": "string", "enum": ["none", "low", "high"]},
+                "slang": {"type": "boolean"},
+                "sentence_length": {
+                    "type": "string",
+                    "enum": ["short", "medium", "long"],
+                },
+                "vibe": {"type": "string"},
+            },
+            "required": ["tone", "emoji_usage", "slang", "sentence_length", "vibe"],
+        },
+    },
+    "required": [
+        "summary",
+        "name",
+        "role",
+        "company",
+        "industry",
+        "seniority",
+        "interests",
+        "style",
+    ],
+}
+
+
+class StyleDescriptors(BaseModel):
+    tone: str = TONE_MIXED
+    emoji_usage: str = "none"
+    slang: bool = False
+    sentence_length: str = "medium"
+    vibe: str = "professional"
+
+    def render(self) -> str:
+        """
+        Same bullet layout the standalone style prompt produces.
+        """
+        return "\n".join(
+            [
+                f"- Tone: {self.tone}",
+                f"- Emoji usage: {self.emoji_usage}",
+                f"- Slang or abbreviations: {'yes' if self.slang else 'no'}",
+                f"- Sentence length: {self.sentence_length}",
+                f"- Overall vibe: {self.vibe}",
+            ]
+        )
+
+
+class PersonaExtraction(BaseModel):
+    """
+    Validated reply of the single-pass persona call.
+    """
+
+    summary: str = Field(min_length=1)
+    style: StyleDescriptors = Field(default_factory=StyleDescriptors)
+
+    name: Optional[str] = None
+    role: Optional[str] = None
+    company: Optional[str] = None
+    industry: Optional[str] = None
+    seniority: Optional[str] = None
+    interests: list[str] = Field(default_factory=list)
+
+    @field_validator("name", "role", "company", "industry", "seniority", mode="before")
+    @classmethod
+    def _blank_to_none(cls, value):
+        if isinstance(value, str):
+            value = value.strip()
+            return None if value.lower() in _BLANK_VALUES else value
+        return value
+
+    @field_validator("interests", mode="before")
+    @classmethod
+    def _clean_interests(cls, value):
+        if isinstance(value, str):
+            value = value.split(",")
+        return [v.strip() for v in value or [] if isinstance(v, str) and v.strip()]
+
+    def analysis(self) -> str:
+        fields = [
+            ("Name", self.name),
+            ("Current role", self.role),
+            ("Company", self.company),
+            ("Industry", self.industry),
+            ("Seniority level", self.seniority),
+            ("Interests", ", ".join(self.interests) or None),
+        ]
+        return "\n".join(f"- {label}: {value or '—'}" for label, value in fields)
+
+    def to_persona(self) -> Persona:
+        return Persona(
+            summary=self.summary.strip(),
+            style=self.style.render(),
+            analysis=self.analysis(),
+            name=self.name,
+            role=self.role,
+            company=self.company,
+            industry=self.industry,
+            seniority=self.seniority.lower() if self.seniority else None,
+            interests=self.interests,
+        )
+
 
-@dataclass
-class Persona:
-    summary: str
-    style: str
-    raw_analysis: str
+def parse_persona(raw: str) -> Optional[Persona]:
+    """
+    Validate a single-pass JSON reply into a Persona; None if unusable.
+    """
+    try:
+        return PersonaExtraction.model_validate(json.loads(raw)).to_persona()
+    except (json.JSONDecodeError, ValidationError, TypeError) as e:
+        logger.error(f"Invalid persona JSON: {e}")
+        return None
 
 
 def infer_persona(profile_text: str, llm: OllamaClient) -> Persona:
     """
-    Perform full persona inference:
-    - Structured persona analysis
-    - Communication style
-    - Concise summary
+    Single-pass persona inference: one JSON-mode call returns the summary,
+    style descriptors and typed fields. Falls back to the three-call path
+    if the reply cannot be validated. Long profiles are first compressed
+    to PROFILE_TOKEN_BUDGET.
     """
 
     logger.info("Starting persona inference")
+    profile_text = compress_for_llm(profile_text, llm)
 
-    analysis = llm.generate(
+    raw = llm.generate(
         system_prompt=SYSTEM_ANALYSIS,
-        user_prompt=PERSONA_ANALYSIS_PROMPT.format(
-            profile_text=profile_text
-        ),
+        user_prompt=PERSONA_JSON_PROMPT.format(profile_text=profile_text),
         temperature=0.2,
+        format=PERSONA_SCHEMA,
+        stage="persona",
     )
 
-    style = infer_style(profile_text, llm)
-    summary = summarize_profile(profile_text, llm)
+    persona = parse_persona(raw)
+    if persona is None:
+        logger.info("Falling back to multi-call persona inference")
+        return infer_persona_multi_call(profile_text, llm)
+
+    logger.info("Persona inference complete")
+    return persona
+
+
+def infer_persona_multi_call(
+    profile_text: str, llm: OllamaClient, use_session: bool = True
+) -> Persona:
+    """
+    Original free-text inference:
+    - Structured persona analysis
+    - Communication style
+    - Concise summary
+    Typed fields are left empty.
+
+    With `use_session` the three questions share one ProfileSession, so the
+    server evaluates the profile once and serves the rest from its KV cache.
+    """
+
+    if use_session:
+        session = ProfileSession(llm, profile_text)
+        analysis = session.ask(
+            PERSONA_ANALYSIS_QUESTION, temperature=0.2, stage="analysis"
+        )
+        style = infer_style_in_session(session)
+        summary = summarize_in_session(session)
+    else:
+        analysis = llm.generate(
+            system_prompt=SYSTEM_ANALYSIS,
+            user_prompt=PERSONA_ANALYSIS_PROMPT.format(
+                profile_text=profile_text
+            ),
+            temperature=0.2,
+            stage="analysis",
+        )
+        style = infer_style(profile_text, llm)
+        summary = summarize_profile(profile_text, llm)
 
     logger.info("Persona inference complete")
 
     return Persona(
         summary=summary,
         style=style,
-        raw_analysis=analysis,
+        analysis=analysis,
     )
-
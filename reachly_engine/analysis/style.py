@@ -1,14 +1,12 @@
 from reachly_engine.llm.ollama_client import OllamaClient
+from reachly_engine.llm.session import ProfileSession
 from reachly_engine.llm.prompts import SYSTEM_ANALYSIS
 from reachly_engine.logger import get_logger
 
 logger = get_logger("style")
 
 
-STYLE_PROMPT = """
-TEXT SAMPLE:
-{text}
-
+STYLE_QUESTION = """
 Infer the communication style:
 
 Return:
@@ -21,6 +19,11 @@ Return:
 Respond in bullet points only.
 """
 
+STYLE_PROMPT = """
+TEXT SAMPLE:
+{text}
+""" + STYLE_QUESTION
+
 
 def infer_style(text: str, llm: OllamaClient) -> str:
     logger.info("Inferring communication style")
@@ -30,5 +33,11 @@ def infer_style(text: str, llm: OllamaClient) -> str:
         system_prompt=SYSTEM_ANALYSIS,
         user_prompt=prompt,
         temperature=0.3,
+        stage="style",
     )
 
+
+def infer_style_in_session(session: ProfileSession) -> str:
+    logger.info("Inferring communication style (session)")
+
+    return session.ask(STYLE_QUESTION, temperature=0.3, stage="style")
@@ -1,14 +1,12 @@
 from reachly_engine.llm.ollama_client import OllamaClient
+from reachly_engine.llm.session import ProfileSession
 from reachly_engine.llm.prompts import SYSTEM_ANALYSIS
 from reachly_engine.logger import get_logger
 
 logger = get_logger("summarizer")
 
 
-SUMMARY_PROMPT = """
-PROFILE TEXT:
-{text}
-
+SUMMARY_QUESTION = """
 Create a concise factual summary including:
 - Name (if available)
 - Current role and company
@@ -20,6 +18,11 @@ Max 6 bullet points.
 No speculation.
 """
 
+SUMMARY_PROMPT = """
+PROFILE TEXT:
+{text}
+""" + SUMMARY_QUESTION
+
 
 def summarize_profile(text: str, llm: OllamaClient) -> str:
     logger.info("Summarizing profile")
@@ -28,5 +31,11 @@ def summarize_profile(text: str, llm: OllamaClient) -> str:
         system_prompt=SYSTEM_ANALYSIS,
         user_prompt=SUMMARY_PROMPT.format(text=text),
         temperature=0.2,
+        stage="summary",
     )
 
+
+def summarize_in_session(session: ProfileSession) -> str:
+    logger.info("Summarizing profile (session)")
+
+    return session.ask(SUMMARY_QUESTION, temperature=0.2, stage="summary")
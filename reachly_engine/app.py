@@ -1,17 +1,47 @@
+import asyncio
 import re
-from typing import Optional
+from dataclasses import dataclass
+from typing import AsyncIterator, Iterable, Iterator, Optional, Union
 
 from reachly_engine.scraping.linkedin import (
-    fetch_linkedin_profile_text,
+    fetch_linkedin_profile,
     save_profile_text,
 )
+from reachly_engine.scraping.bulk import BulkResult, iter_bulk_profiles
+from reachly_engine.scraping.http_cache import close_http_cache
+from reachly_engine.scraping.session import close_session
+from reachly_engine.scraping.urls import canonicalize_url
 from reachly_engine.analysis.persona import infer_persona
-from reachly_engine.generation.email import generate_email
-from reachly_engine.generation.whatsapp import generate_whatsapp
-from reachly_engine.generation.linkedin_dm import generate_linkedin_dm
-from reachly_engine.generation.instagram_dm import generate_instagram_dm
-from reachly_engine.llm.ollama_client import OllamaClient
+from reachly_engine.generation.channels import (
+    ASYNC_CHANNEL_GENERATORS,
+    ASYNC_CHANNEL_STREAMS,
+)
+from reachly_engine.llm.ollama_client import OllamaClient, AsyncOllamaClient
+from reachly_engine.generation.bundle import agenerate_bundle
+from reachly_engine.generation.cta import get_cta, aget_cta, adapt_cta
+from reachly_engine.llm.budget import ContextBudgeter
+from reachly_engine.llm.cache import ResponseCache
+from reachly_engine.llm.tokenizer import Tokenizer
+from reachly_engine.config import (
+    OLLAMA_NUM_PARALLEL,
+    LLM_CACHE_ENABLED,
+    GENERATION_MODE,
+    CTA_ADAPT_PER_CHANNEL,
+    CONTEXT_BUDGETING,
+    SCRAPE_CONCURRENCY,
+    OLLAMA_BASE_URLS,
+    OLLAMA_MODEL,
+)
+from reachly_engine.constants import (
+    ALL_CHANNELS,
+    CHANNEL_LABELS,
+    GENERATION_MODE_BUNDLE,
+)
+from reachly_engine.memory.fingerprint import content_fingerprint
+from reachly_engine.memory.embeddings import get_embedder
+from reachly_engine.memory.retrieval import ProspectIndex
 from reachly_engine.memory.store import MemoryStore
+from reachly_engine.models.profile import Profile
 from reachly_engine.logger import get_logger
 from reachly_engine.auth.linkedin_auth import authenticate_linkedin
 from reachly_engine.auth.store import load_linkedin_cookie
@@ -19,6 +49,18 @@ from reachly_engine.auth.store import load_linkedin_cookie
 logger = get_logger("app")
 
 
+PROFILE_NEW = "new"
+PROFILE_UPDATED = "updated"
+PROFILE_UNCHANGED = "unchanged"
+
+
+@dataclass
+class StoredProfile:
+    prospect_id: int
+    status: str  # PROFILE_NEW | PROFILE_UPDATED | PROFILE_UNCHANGED
+    summary: str
+
+
 def _extract_field(pattern: str, text: str) -> Optional[str]:
     if not text:
         return None
@@ -27,76 +69,309 @@ def _extract_field(pattern: str, text: str) -> Optional[str]:
 
 
 class ReachlyApp:
-    def __init__(self):
-        self.llm = OllamaClient()
+    def __init__(
+        self,
+        num_parallel: int = OLLAMA_NUM_PARALLEL,
+        use_cache: bool = LLM_CACHE_ENABLED,
+        generation_mode: str = GENERATION_MODE,
+        adapt_cta_per_channel: bool = CTA_ADAPT_PER_CHANNEL,
+        context_budgeting: bool = CONTEXT_BUDGETING,
+    ):
+        self.cache = ResponseCache() if use_cache else None
+
+        self.tokenizer = None
+        self.budgeter = None
+        if context_budgeting:
+            # Every backend serves the same model; count against the first
+            self.tokenizer = Tokenizer(OLLAMA_BASE_URLS[0], OLLAMA_MODEL)
+            self.budgeter = ContextBudgeter(self.tokenizer)
+
+        self.llm = OllamaClient(
+            cache=self.cache,
+            budgeter=self.budgeter,
+            base_urls=OLLAMA_BASE_URLS,
+        )
+        self.num_parallel = num_parallel
+        self.generation_mode = generation_mode
+        self.adapt_cta_per_channel = adapt_cta_per_channel
         self.memory = MemoryStore()
+        self.similar = ProspectIndex(self.memory, get_embedder(self.llm))
 
         if not self.llm.health_check():
+            self.close()
             raise RuntimeError("Ollama not running or model missing")
 
+    # -------- Lifecycle --------
+
+    def close(self):
+        self.llm.close()
+        if self.tokenizer is not None:
+            self.tokenizer.close()
+        if self.cache is not None:
+            self.cache.close()
+        self.similar.close()
+        self.memory.close()
+        close_http_cache()
+        close_session()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
     # -------- Ingestion --------
 
-    def ingest_linkedin(self, url: str) -> str:
+    def ingest_linkedin(self, url: str) -> Profile:
+        if not load_linkedin_cookie():
+            authenticate_linkedin()
+
+        # One spelling per profile, so re-adds find the stored prospect
+        profile = fetch_linkedin_profile(canonicalize_url(url) or url)
+        save_profile_text(profile.raw_text, "linkedin", profile.source_url or url)
+        return profile
+
+    def ingest_linkedin_bulk(
+        self, urls: Iterable[str], concurrency: int = SCRAPE_CONCURRENCY
+    ) -> Iterator[BulkResult]:
+        """
+        Fetch many profiles concurrently (deduplicated, rate limited per
+        host) and yield each result as it arrives, so the caller can
+        analyze one profile while the others are still downloading.
+        """
         if not load_linkedin_cookie():
             authenticate_linkedin()
 
-        text = fetch_linkedin_profile_text(url)
-        save_profile_text(text, "linkedin")
-        return text
+        for result in iter_bulk_profiles(urls, concurrency=concurrency):
+            if result.ok:
+                save_profile_text(result.profile.raw_text, "linkedin", result.url)
+            yield result
 
     # -------- Analysis --------
 
-    def analyze_persona(self, profile_text: str):
-        return infer_persona(profile_text, self.llm)
+    def analyze_persona(self, profile: Union[Profile, str]):
+        # Parsed profiles go in as their compact rendering, not page text
+        if isinstance(profile, Profile):
+            profile = profile.prompt_text()
+        return infer_persona(profile, self.llm)
 
     # -------- Generation --------
 
-    def generate_messages(self, persona_block: str) -> dict:
+    def _async_llm(self, fresh: bool = False) -> AsyncOllamaClient:
+        return AsyncOllamaClient(
+            base_url=self.llm.base_url,
+            model=self.llm.model,
+            timeout=self.llm.timeout,
+            max_concurrency=self.num_parallel,
+            cache=self.cache,
+            seed=self.llm.seed,
+            cache_bypass=fresh,
+            budgeter=self.budgeter,
+            pool=self.llm.pool,
+            resilience=self.llm.resilience,
+        )
+
+    def resolve_cta(
+        self, prospect: dict, persona_block: str, fresh: bool = False
+    ) -> str:
+        """
+        CTA stage: reuse the CTA stored on the prospect, otherwise generate
+        it once for the persona block and store it for later regenerations.
+        """
+        cta = None if fresh else prospect.get("cta")
+        if not cta:
+            cta = get_cta(persona_block, self.llm, fresh=fresh)
+            self.memory.save_cta(prospect["id"], cta)
+        return cta
+
+    def _channel_cta(self, cta: str, channel: str) -> str:
+        if self.adapt_cta_per_channel:
+            return adapt_cta(cta, channel)
+        return cta
+
+    def generate_messages(
+        self,
+        persona_block: str,
+        fresh: bool = False,
+        cta: Optional[str] = None,
+    ) -> dict:
+        return asyncio.run(
+            self.agenerate_messages(persona_block, fresh=fresh, cta=cta)
+        )
+
+    async def agenerate_messages(
+        self,
+        persona_block: str,
+        fresh: bool = False,
+        cta: Optional[str] = None,
+    ) -> dict:
+        """
+        Generate every channel concurrently; wall-clock is roughly the
+        slowest channel instead of the sum of all of them.
+        The CTA is computed once (unless given) and shared by all channels.
+        `fresh` skips cached responses and regenerates.
+        """
+        async with self._async_llm(fresh) as allm:
+            if self.generation_mode == GENERATION_MODE_BUNDLE:
+                bundle = await agenerate_bundle(persona_block, allm, cta=cta)
+                results = [bundle[channel] for channel in ALL_CHANNELS]
+            else:
+                if cta is None:
+                    cta = await aget_cta(persona_block, allm, fresh=fresh)
+
+                results = await asyncio.gather(
+                    *(
+                        ASYNC_CHANNEL_GENERATORS[channel](
+                            persona_block,
+                            allm,
+                            cta=self._channel_cta(cta, channel),
+                        )
+                        for channel in ALL_CHANNELS
+                    )
+                )
+
         return {
-            "Email": generate_email(persona_block, self.llm),
-            "WhatsApp": generate_whatsapp(persona_block, self.llm),
-            "LinkedIn DM": generate_linkedin_dm(persona_block, self.llm),
-            "Instagram DM": generate_instagram_dm(persona_block, self.llm),
+            CHANNEL_LABELS[channel]: text
+            for channel, text in zip(ALL_CHANNELS, results)
         }
 
+    async def astream_messages(
+        self,
+        persona_block: str,
+        fresh: bool = False,
+        cta: Optional[str] = None,
+    ) -> AsyncIterator[tuple[str, str]]:
+        """
+        Stream all channels concurrently as (channel label, delta) events,
+        interleaved in arrival order. Bundle mode has no per-channel token
+        stream, so each channel arrives as one event.
+        """
+        if self.generation_mode == GENERATION_MODE_BUNDLE:
+            messages = await self.agenerate_messages(
+                persona_block, fresh=fresh, cta=cta
+            )
+            for event in messages.items():
+                yield event
+            return
+
+        queue: asyncio.Queue = asyncio.Queue()
+        done = object()
+
+        async def pump(channel, stream):
+            try:
+                async for delta in stream(
+                    persona_block, allm, cta=self._channel_cta(cta, channel)
+                ):
+                    await queue.put((CHANNEL_LABELS[channel], delta))
+            finally:
+                await queue.put(done)
+
+        async with self._async_llm(fresh) as allm:
+            if cta is None:
+                cta = await aget_cta(persona_block, allm, fresh=fresh)
+
+            tasks = [
+                asyncio.create_task(pump(channel, stream))
+                for channel, stream in ASYNC_CHANNEL_STREAMS.items()
+            ]
+
+            try:
+                remaining = len(tasks)
+                while remaining:
+                    event = await queue.get()
+                    if event is done:
+                        remaining -= 1
+                        continue
+                    yield event
+
+                # Surface the first channel failure, if any
+                await asyncio.gather(*tasks)
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+
     # -------- Persistence --------
 
-    def save_persona_only(self, *, persona, raw_profile: str, source: str) -> int:
+    def save_persona_only(
+        self,
+        *,
+        persona,
+        raw_profile: str,
+        source: str,
+        profile: Optional[Profile] = None,
+    ) -> int:
         summary = persona.summary or ""
 
-        # 1. Prefer LinkedIn page title for name
-        name_from_profile = _extract_field(
-            r"\n([A-Z][A-Z\s]+)\s+\|\s+LinkedIn",
-            raw_profile,
-        )
+        # Fields parsed from the page's JSON are authoritative; then the
+        # typed fields of the structured persona call. The regexes below
+        # only fill gaps (e.g. multi-call fallback).
+        parsed = profile or Profile(source=source, raw_text=raw_profile)
+        name = parsed.name or persona.name
 
-        # 2. Fallback: name from LLM summary
-        name_from_summary = _extract_field(
-            r"([A-Z][A-Za-z]+(?:\s+[A-Z][A-Za-z]+)+)\s+is\s+",
-            summary,
-        )
+        if not name:
+            # 1. Prefer LinkedIn page title for name
+            name = _extract_field(
+                r"\n([A-Z][A-Z\s]+)\s+\|\s+LinkedIn",
+                raw_profile,
+            )
 
-        name = name_from_profile or name_from_summary
+        if not name:
+            # 2. Fallback: name from LLM summary
+            name = _extract_field(
+                r"([A-Z][A-Za-z]+(?:\s+[A-Z][A-Za-z]+)+)\s+is\s+",
+                summary,
+            )
 
         # Best-effort role & company
-        role = _extract_field(
+        role = parsed.role or persona.role or _extract_field(
             r"is a[n]?\s+(.+?)\s+at\s+",
             summary,
         )
-        company = _extract_field(
+        company = parsed.company or persona.company or _extract_field(
             r"at\s+(.+?)[\.,]",
             summary,
         )
 
-        return self.memory.save_prospect(
+        prospect_id = self.memory.save_prospect(
             name=name,
             role=role,
             company=company,
-            industry=None,
-            seniority=None,
+            industry=parsed.industry or persona.industry,
+            seniority=persona.seniority,
+            interests=", ".join(persona.interests) or None,
             summary=persona.summary,
             style=persona.style,
             raw_profile=raw_profile,
             source=source,
+            source_url=parsed.source_url,
+            content_hash=content_fingerprint(parsed.prompt_text()),
         )
+        self.similar.add(prospect_id)
+        return prospect_id
 
+    def store_profile(self, profile: Profile, source: str = "linkedin") -> StoredProfile:
+        """
+        Analyze and store a fetched profile, skipping the LLM entirely when
+        the stored prospect for the same URL (or, without a URL, the same
+        content) has an identical fingerprint. A changed profile is
+        re-analyzed and its row updated in place.
+        """
+        fingerprint = content_fingerprint(profile.prompt_text())
+        existing = self.memory.find_prospect(
+            source_url=profile.source_url, content_hash=fingerprint
+        )
+
+        if existing and existing.get("content_hash") == fingerprint:
+            logger.info(f"Profile unchanged, reusing prospect {existing['id']}")
+            return StoredProfile(existing["id"], PROFILE_UNCHANGED, existing["summary"])
+
+        persona = self.analyze_persona(profile)
+        prospect_id = self.save_persona_only(
+            persona=persona,
+            raw_profile=profile.raw_text,
+            source=source,
+            profile=profile,
+        )
+        status = PROFILE_UPDATED if existing else PROFILE_NEW
+        return StoredProfile(prospect_id, status, persona.summary)
@@ -1,24 +1,56 @@
+import asyncio
+import time
+from pathlib import Path
+from typing import Optional
+
 from rich.console import Console
 from rich.table import Table
 from rich.prompt import Prompt, Confirm
 
-from reachly_engine.cli.prompts import ask_linkedin_url, pause
+from reachly_engine.cli.prompts import (
+    ask_linkedin_url,
+    ask_url_file,
+    ask_search_query,
+    ask_page_action,
+    ask_prospect_filters,
+    pause,
+)
 from reachly_engine.cli.render import (
     render_info,
     render_error,
-    render_multi_channel,
+    render_multi_channel_live,
+    render_llm_stats,
+    render_prospect_page,
+    render_search_results,
+    render_similar_prospects,
+)
+from reachly_engine.app import (
+    ReachlyApp,
+    PROFILE_NEW,
+    PROFILE_UPDATED,
+    PROFILE_UNCHANGED,
 )
-from reachly_engine.app import ReachlyApp
+from reachly_engine.config import DATA_DIR
+from reachly_engine.constants import CHANNEL_LABELS
+from reachly_engine.llm.telemetry import TELEMETRY
+from reachly_engine.memory.store import ProspectFilters, SNIPPET_START, SNIPPET_END
+from reachly_engine.scraping.bulk import read_url_file
 from reachly_engine.logger import get_logger
 
 logger = get_logger("cli")
 console = Console()
 
+# Rows per page in persona listings
+PAGE_SIZE = 20
+
 
 class CLIMenu:
     def __init__(self):
         self.app = ReachlyApp()
 
+    def close(self):
+        self.app.close()
+
     # ---------------- Menu ----------------
 
     def show_main(self) -> str:
@@ -26,10 +58,13 @@ class CLIMenu:
         table.add_row("1.", "Add LinkedIn profile (analyze & store persona)")
         table.add_row("2.", "Generate outreach messages (from stored personas)")
         table.add_row("3.", "View stored personas")
-        table.add_row("4.", "Exit")
+        table.add_row("4.", "LLM performance stats")
+        table.add_row("5.", "Bulk add LinkedIn profiles (file of URLs)")
+        table.add_row("6.", "Search personas & messages")
+        table.add_row("7.", "Exit")
 
         console.print(table)
-        return console.input("\nSelect option [1-4]: ").strip()
+        return console.input("\nSelect option [1-7]: ").strip()
 
     # ---------------- Actions ----------------
 
@@ -39,59 +74,131 @@ class CLIMenu:
             render_error("No URL provided.")
             return
 
-        profile_text = self.app.ingest_linkedin(url)
+        profile = self.app.ingest_linkedin(url)
 
         render_info(
             "Profile Ingested",
-            f"Profile fetched successfully.\n\nPreview:\n{profile_text[:600]}...",
+            f"Profile fetched successfully.\n\nPreview:\n{profile.prompt_text()[:600]}...",
         )
 
-        persona = self.app.analyze_persona(profile_text)
+        stored = self.app.store_profile(profile)
 
-        prospect_id = self.app.save_persona_only(
-            persona=persona,
-            raw_profile=profile_text,
-            source="linkedin",
-        )
+        if stored.status == PROFILE_UNCHANGED:
+            title, note = "Persona Unchanged", "Profile unchanged; existing persona reused."
+        elif stored.status == PROFILE_UPDATED:
+            title, note = "Persona Updated", "Profile changed; persona re-analyzed and updated."
+        else:
+            title, note = "Persona Stored", "Persona analyzed and saved."
 
         render_info(
-            "Persona Stored",
-            f"Persona analyzed and saved.\n\nID: {prospect_id}\n\nSummary:\n{persona.summary}",
+            title,
+            f"{note}\n\nID: {stored.prospect_id}\n\nSummary:\n{stored.summary}",
         )
 
         if Confirm.ask("Generate outreach messages now?", default=False):
-            self.generate_for_prospect(prospect_id)
+            self.generate_for_prospect(stored.prospect_id)
 
         pause()
 
-    def generate_outreach(self):
-        prospects = self.app.memory.list_prospects()
-        if not prospects:
-            render_error("No stored personas available.")
+    def bulk_add_linkedin_profiles(self):
+        path = Path(ask_url_file()).expanduser()
+        if not path.is_file():
+            render_error(f"File not found: {path}")
             return
 
-        table = Table(title="Stored Personas")
-        table.add_column("ID", justify="right")
-        table.add_column("Name")
-        table.add_column("Role")
-        table.add_column("Company")
-
-        for p in prospects:
-            table.add_row(
-                str(p["id"]),
-                p.get("name") or "—",
-                p.get("role") or "—",
-                p.get("company") or "—",
+        urls = read_url_file(path)
+        counts = {PROFILE_NEW: 0, PROFILE_UPDATED: 0, PROFILE_UNCHANGED: 0}
+        failed = 0
+
+        # Profiles are analyzed as they arrive; fetching continues meanwhile
+        for result in self.app.ingest_linkedin_bulk(urls):
+            if not result.ok:
+                failed += 1
+                console.print(f"[red]✗[/red] {result.url}  {result.error}")
+                continue
+
+            profile = result.profile
+            try:
+                outcome = self.app.store_profile(profile)
+            except RuntimeError as e:
+                failed += 1
+                console.print(f"[red]✗[/red] {result.url}  {e}")
+                continue
+
+            counts[outcome.status] += 1
+            console.print(
+                f"[green]✓[/green] #{outcome.prospect_id} "
+                f"{profile.short_label() or '—'} ({outcome.status})  "
+                f"[dim]{result.url} ({result.seconds:.1f}s fetch)[/dim]"
             )
 
-        console.print(table)
+        render_info(
+            "Bulk Ingestion",
+            f"New: {counts[PROFILE_NEW]}, updated: {counts[PROFILE_UPDATED]}, "
+            f"unchanged: {counts[PROFILE_UNCHANGED]}, failed: {failed}.",
+        )
+        pause()
+
+    def browse_prospects(
+        self, title: str, pick: str, detailed: bool = False
+    ) -> Optional[int]:
+        """
+        Paged persona listing, newest first, with filters. Pages are
+        keyset queries of PAGE_SIZE rows, so only the page on screen is
+        loaded. Returns the persona ID entered, or None.
+        """
+        filters = ProspectFilters()
+        total = self.app.memory.count_prospects(filters)
+        pages: list[Optional[int]] = [None]  # after_id of each visited page
+
+        while True:
+            rows = list(
+                self.app.memory.iter_prospects(
+                    after_id=pages[-1], limit=PAGE_SIZE + 1, filters=filters
+                )
+            )
+            has_next = len(rows) > PAGE_SIZE
+            rows = rows[:PAGE_SIZE]
+
+            if rows:
+                caption = f"Page {len(pages)} · {total} {'matching' if filters else 'stored'}"
+                render_prospect_page(title, rows, caption, detailed=detailed)
+            else:
+                render_info(title, "No personas match these filters.")
+
+            action = ask_page_action(pick)
+            if not action:
+                return None
+            if action.isdigit():
+                return int(action)
+
+            if action == "n" and has_next:
+                pages.append(rows[-1]["id"])
+            elif action == "n":
+                console.print("[dim]Already on the last page.[/dim]")
+            elif action == "p" and len(pages) > 1:
+                pages.pop()
+            elif action == "p":
+                console.print("[dim]Already on the first page.[/dim]")
+            elif action == "f":
+                filters = ask_prospect_filters()
+                total = self.app.memory.count_prospects(filters)
+                pages = [None]
+            else:
+                render_error(f"Unknown choice: {action}")
 
-        choice = Prompt.ask("Enter persona ID to generate outreach")
-        if not choice.isdigit():
-            render_error("Invalid ID.")
+    def generate_outreach(self):
+        if not self.app.memory.count_prospects():
+            render_error("No stored personas available.")
             return
 
-        self.generate_for_prospect(int(choice))
+        prospect_id = self.browse_prospects(
+            "Stored Personas", "a persona ID to generate outreach"
+        )
+        if prospect_id is None:
+            return
+
+        self.generate_for_prospect(prospect_id)
         pause()
 
     def generate_for_prospect(self, prospect_id: int):
@@ -108,37 +215,83 @@ STYLE:
 {prospect['style']}
 """.strip()
 
-        messages = self.app.generate_messages(persona_block)
+        fresh = self.app.cache is not None and Confirm.ask(
+            "Regenerate fresh (ignore cached responses)?", default=False
+        )
 
-        for channel, content in messages.items():
-            self.app.memory.save_message(prospect_id, channel, content)
+        # One CTA per persona, stored on the prospect and shared by channels
+        cta = self.app.resolve_cta(prospect, persona_block, fresh=fresh)
+
+        # Stream every channel into its panel as tokens arrive
+        messages = asyncio.run(
+            render_multi_channel_live(
+                self.app.astream_messages(persona_block, fresh=fresh, cta=cta),
+                list(CHANNEL_LABELS.values()),
+            )
+        )
 
-        render_multi_channel(messages)
+        self.app.memory.save_messages(prospect_id, messages)
 
     def view_personas(self):
-        prospects = self.app.memory.list_prospects()
-        if not prospects:
+        if not self.app.memory.count_prospects():
             render_info("Personas", "No stored personas.")
             return
 
-        table = Table(title="Stored Personas")
-        table.add_column("ID", justify="right")
-        table.add_column("Name")
-        table.add_column("Role")
-        table.add_column("Company")
-        table.add_column("Industry")
-        table.add_column("Created")
-
-        for p in prospects:
-            table.add_row(
-                str(p["id"]),
-                p.get("name") or "—",
-                p.get("role") or "—",
-                p.get("company") or "—",
-                p.get("industry") or "—",
-                p["created_at"],
-            )
+        prospect_id = self.browse_prospects(
+            "Stored Personas", "an ID to show similar prospects", detailed=True
+        )
+        if prospect_id is None:
+            return
 
-        console.print(table)
+        self.show_similar(prospect_id)
+        pause()
+
+    def show_similar(self, prospect_id: int, limit: int = 5):
+        try:
+            rows = self.app.similar.similar(prospect_id=prospect_id, limit=limit)
+        except RuntimeError as e:
+            render_error(str(e))
+            return
+
+        if not rows:
+            render_info("Similar prospects", f"No similar prospects for ID {prospect_id}.")
+            return
+
+        render_similar_prospects(f"Prospects similar to ID {prospect_id}", rows)
+
+    def search(self):
+        query = ask_search_query()
+        if not query:
+            render_error("No search terms provided.")
+            return
+
+        hits = self.app.memory.search(query)
+        if not hits:
+            render_info("Search", f"No matches for: {query}")
+            return
+
+        render_search_results(query, hits, SNIPPET_START, SNIPPET_END)
+
+        choice = Prompt.ask(
+            "Generate outreach for prospect ID (blank to return)",
+            default="",
+            show_default=False,
+        ).strip()
+        if choice.isdigit():
+            self.generate_for_prospect(int(choice))
         pause()
 
+    def view_llm_stats(self):
+        rows = TELEMETRY.summary()
+        if not rows:
+            render_info("LLM Performance", "No LLM calls yet in this session.")
+            return
+
+        render_llm_stats(rows)
+
+        if Confirm.ask("Export per-call timings as JSONL?", default=False):
+            path = DATA_DIR / "telemetry" / f"llm-{time.strftime('%Y%m%d-%H%M%S')}.jsonl"
+            count = TELEMETRY.dump_jsonl(path)
+            render_info("Exported", f"{count} calls written to {path}")
+
+        pause()
@@ -1,6 +1,11 @@
+from datetime import date
+from typing import Optional
+
 from rich.console import Console
 from rich.prompt import Prompt, Confirm
 
+from reachly_engine.memory.store import ProspectFilters
+
 console = Console()
 
 
@@ -12,6 +17,57 @@ def ask_linkedin_url() -> str:
     ).strip()
 
 
+def ask_url_file() -> str:
+    return Prompt.ask(
+        "Path to a file of LinkedIn URLs (one per line)",
+        default="",
+        show_default=False
+    ).strip()
+
+
+def ask_search_query() -> str:
+    return Prompt.ask(
+        "Search personas and messages",
+        default="",
+        show_default=False
+    ).strip()
+
+
+def ask_page_action(pick: str = "a persona ID") -> str:
+    return Prompt.ask(
+        rf"\[n]ext, \[p]revious, \[f]ilter, or {pick} (blank to return)",
+        default="",
+        show_default=False,
+    ).strip().lower()
+
+
+def _ask_text(label: str) -> Optional[str]:
+    return Prompt.ask(label, default="", show_default=False).strip() or None
+
+
+def _ask_date(label: str) -> Optional[date]:
+    while True:
+        value = _ask_text(f"{label} (YYYY-MM-DD, blank for any)")
+        if not value:
+            return None
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            console.print(f"[red]Not a date:[/red] {value}")
+
+
+def ask_prospect_filters() -> ProspectFilters:
+    """
+    Listing filters; blank answers match everything.
+    """
+    return ProspectFilters(
+        company=_ask_text("Company contains"),
+        role=_ask_text("Role contains"),
+        since=_ask_date("Created on or after"),
+        until=_ask_date("Created on or before"),
+    )
+
+
 def ask_raw_profile_text() -> str:
     console.print("\nPaste profile text below. End input with an empty line:\n")
 
@@ -1,6 +1,11 @@
+from typing import AsyncIterator
+
 from rich.console import Console
+from rich.markup import escape
 from rich.panel import Panel
 from rich.columns import Columns
+from rich.live import Live
+from rich.table import Table
 from rich.text import Text
 
 console = Console()
@@ -40,6 +45,36 @@ def render_multi_channel(messages: dict):
     console.print(Columns(panels, equal=True, expand=True))
 
 
+async def render_multi_channel_live(
+    events: AsyncIterator[tuple[str, str]],
+    channels: list[str],
+) -> dict:
+    """
+    Fill one panel per channel live as (channel, delta) events arrive.
+    Returns the final {channel: text} mapping.
+    """
+    texts = {channel: Text(overflow="fold") for channel in channels}
+    panels = [
+        Panel(
+            texts[channel],
+            title=channel,
+            border_style="green",
+            padding=(1, 2),
+        )
+        for channel in channels
+    ]
+
+    with Live(
+        Columns(panels, equal=True, expand=True),
+        console=console,
+        refresh_per_second=12,
+    ):
+        async for channel, delta in events:
+            texts[channel].append(delta)
+
+    return {channel: text.plain.strip() for channel, text in texts.items()}
+
+
 def render_info(title: str, content: str):
     console.print(
         Panel(
@@ -59,3 +94,128 @@ def render_error(message: str):
         )
     )
 
+
+def _fmt(value, pattern: str) -> str:
+    return "—" if value is None else pattern.format(value)
+
+
+def render_llm_stats(rows: list[dict]):
+    """
+    Per-stage LLM timing summary (see Telemetry.summary).
+    """
+    table = Table(title="LLM Performance")
+    table.add_column("Stage")
+    table.add_column("Calls", justify="right")
+    table.add_column("Cached", justify="right")
+    table.add_column("p50 s", justify="right")
+    table.add_column("p95 s", justify="right")
+    table.add_column("Prompt eval %", justify="right")
+    table.add_column("Prompt tok/s", justify="right")
+    table.add_column("Decode tok/s", justify="right")
+    table.add_column("Cold loads", justify="right")
+
+    for row in rows:
+        table.add_row(
+            row["stage"],
+            str(row["calls"]),
+            str(row["cached"]),
+            _fmt(row["p50_seconds"], "{:.2f}"),
+            _fmt(row["p95_seconds"], "{:.2f}"),
+            _fmt(
+                None if row["prompt_eval_share"] is None
+                else row["prompt_eval_share"] * 100,
+                "{:.0f}",
+            ),
+            _fmt(row["prompt_tokens_per_sec"], "{:.0f}"),
+            _fmt(row["eval_tokens_per_sec"], "{:.1f}"),
+            str(row["cold_loads"]),
+        )
+
+    console.print(table)
+
+
+def render_prospect_page(
+    title: str, rows: list[dict], caption: str, detailed: bool = False
+):
+    """
+    One page of a prospect listing (see MemoryStore.iter_prospects);
+    `detailed` adds industry and creation time.
+    """
+    table = Table(title=escape(title), caption=escape(caption))
+    table.add_column("ID", justify="right")
+    table.add_column("Name")
+    table.add_column("Role")
+    table.add_column("Company")
+    if detailed:
+        table.add_column("Industry")
+        table.add_column("Created")
+
+    for row in rows:
+        cells = [
+            str(row["id"]),
+            escape(row.get("name") or "—"),
+            escape(row.get("role") or "—"),
+            escape(row.get("company") or "—"),
+        ]
+        if detailed:
+            cells += [escape(row.get("industry") or "—"), row.get("created_at") or "—"]
+        table.add_row(*cells)
+
+    console.print(table)
+
+
+def _highlight(snippet: str, start: str, end: str) -> str:
+    return (
+        escape(snippet or "")
+        .replace(start, "[bold yellow]")
+        .replace(end, "[/bold yellow]")
+    )
+
+
+def render_search_results(query: str, hits: list[dict], start: str, end: str):
+    """
+    Search hits (see MemoryStore.search), best first, with the matched
+    terms highlighted in each snippet.
+    """
+    table = Table(title=f"Search: {escape(query)}")
+    table.add_column("ID", justify="right")
+    table.add_column("Name")
+    table.add_column("Company")
+    table.add_column("Match")
+    table.add_column("Snippet")
+
+    for hit in hits:
+        table.add_row(
+            str(hit["prospect_id"]),
+            escape(hit.get("name") or "—"),
+            escape(hit.get("company") or "—"),
+            "persona" if hit["kind"] == "prospect" else f"{hit['channel']} message",
+            _highlight(hit["snippet"], start, end),
+        )
+
+    console.print(table)
+
+
+def render_similar_prospects(title: str, rows: list[dict]):
+    """
+    Nearest prospects (see ProspectIndex.similar) with their similarity.
+    """
+    table = Table(title=escape(title))
+    table.add_column("ID", justify="right")
+    table.add_column("Name")
+    table.add_column("Role")
+    table.add_column("Company")
+    table.add_column("Industry")
+    table.add_column("Similarity", justify="right")
+
+    for row in rows:
+        table.add_row(
+            str(row["id"]),
+            escape(row.get("name") or "—"),
+            escape(row.get("role") or "—"),
+            escape(row.get("company") or "—"),
+            escape(row.get("industry") or "—"),
+            f"{row['score']:.2f}",
+        )
+
+    console.print(table)
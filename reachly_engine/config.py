@@ -26,7 +26,86 @@ for p in [DATA_DIR, PROFILES_DIR, SUMMARIES_DIR, MESSAGES_DIR]:
 OLLAMA_BASE_URL = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
 OLLAMA_MODEL = os.getenv("OLLAMA_MODEL", "mistral:7b-instruct-q4_K_M")
 
-OLLAMA_TIMEOUT = int(os.getenv("OLLAMA_TIMEOUT", "120"))
+# Several hosts serving the same model (comma-separated); each request goes
+# to the least-loaded healthy one. Defaults to OLLAMA_BASE_URL alone.
+OLLAMA_BASE_URLS = [
+    url.strip()
+    for url in os.getenv("OLLAMA_BASE_URLS", OLLAMA_BASE_URL).split(",")
+    if url.strip()
+]
+OLLAMA_EJECT_AFTER = int(os.getenv("OLLAMA_EJECT_AFTER", "2"))  # consecutive failures
+OLLAMA_PROBE_INTERVAL = float(os.getenv("OLLAMA_PROBE_INTERVAL", "15"))  # seconds
+
+OLLAMA_TIMEOUT = int(os.getenv("OLLAMA_TIMEOUT", "120"))  # read timeout
+OLLAMA_CONNECT_TIMEOUT = float(os.getenv("OLLAMA_CONNECT_TIMEOUT", "5"))
+OLLAMA_WRITE_TIMEOUT = float(os.getenv("OLLAMA_WRITE_TIMEOUT", "30"))
+OLLAMA_POOL_TIMEOUT = float(os.getenv("OLLAMA_POOL_TIMEOUT", "30"))
+
+# Connection pool (one long-lived pool per client)
+OLLAMA_MAX_CONNECTIONS = int(os.getenv("OLLAMA_MAX_CONNECTIONS", "8"))
+OLLAMA_MAX_KEEPALIVE = int(os.getenv("OLLAMA_MAX_KEEPALIVE", "4"))
+OLLAMA_KEEPALIVE_EXPIRY = float(os.getenv("OLLAMA_KEEPALIVE_EXPIRY", "60"))
+
+# Max in-flight requests from the async client; keep in sync with the
+# server's own OLLAMA_NUM_PARALLEL (extra requests just queue server-side)
+OLLAMA_NUM_PARALLEL = int(os.getenv("OLLAMA_NUM_PARALLEL", "4"))
+
+# Fixed sampling seed (optional) so cached / repeated calls are reproducible
+OLLAMA_SEED = int(os.getenv("OLLAMA_SEED")) if os.getenv("OLLAMA_SEED") else None
+
+# "channels" (one call per channel) or "bundle" (one JSON-mode call)
+GENERATION_MODE = os.getenv("GENERATION_MODE", "channels").lower()
+
+# Touch up the shared CTA per channel (string-only, no extra LLM call)
+CTA_ADAPT_PER_CHANNEL = os.getenv("CTA_ADAPT_PER_CHANNEL", "0").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+
+# --------------------
+# LLM Resilience
+# --------------------
+# Retries for connect errors, timeouts and 429/502/503/504 replies
+# (full-jitter exponential backoff)
+OLLAMA_RETRIES = int(os.getenv("OLLAMA_RETRIES", "3"))
+OLLAMA_RETRY_BASE_DELAY = float(os.getenv("OLLAMA_RETRY_BASE_DELAY", "0.5"))
+OLLAMA_RETRY_MAX_DELAY = float(os.getenv("OLLAMA_RETRY_MAX_DELAY", "8"))
+
+# Per-backend circuit breaker
+OLLAMA_BREAKER_THRESHOLD = int(os.getenv("OLLAMA_BREAKER_THRESHOLD", "5"))
+OLLAMA_BREAKER_RESET = float(os.getenv("OLLAMA_BREAKER_RESET", "30"))  # seconds
+
+# Hedged requests: send a duplicate once the first call outlives the
+# stage's p95 latency and keep whichever answers first. The default covers
+# the stages the merged pipeline runs; "analysis", "style" and "summary"
+# only run in the multi-call persona fallback
+LLM_HEDGING = os.getenv("LLM_HEDGING", "0").lower() in ("1", "true", "yes")
+LLM_HEDGE_STAGES = [
+    s.strip()
+    for s in os.getenv("LLM_HEDGE_STAGES", "persona,bundle,cta").split(",")
+    if s.strip()
+]
+LLM_HEDGE_MIN_SAMPLES = int(os.getenv("LLM_HEDGE_MIN_SAMPLES", "20"))
+
+# --------------------
+# LLM Telemetry
+# --------------------
+# Optional JSONL file with one line of Ollama timing fields per call
+LLM_TELEMETRY_PATH = (
+    Path(os.getenv("LLM_TELEMETRY_PATH")) if os.getenv("LLM_TELEMETRY_PATH") else None
+)
+# load_duration above this marks a model cold load
+LLM_COLD_LOAD_SECONDS = float(os.getenv("LLM_COLD_LOAD_SECONDS", "1.0"))
+
+# --------------------
+# LLM Response Cache (opt-in)
+# --------------------
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE", "0").lower() in ("1", "true", "yes")
+LLM_CACHE_PATH = Path(os.getenv("LLM_CACHE_PATH", DATA_DIR / "llm_cache.db"))
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "5000"))
+LLM_CACHE_MAX_BYTES = int(os.getenv("LLM_CACHE_MAX_MB", "64")) * 1024 * 1024
+LLM_CACHE_TTL_SECONDS = float(os.getenv("LLM_CACHE_TTL_DAYS", "30")) * 86400
 
 # --------------------
 # Scraping
@@ -38,12 +117,74 @@ USER_AGENT = os.getenv(
 
 LINKEDIN_COOKIE = os.getenv("LINKEDIN_COOKIE")  # optional
 
+# Bulk ingestion: concurrent fetches over one pooled session, rate
+# limited per host (token bucket: SCRAPE_RATE_PER_HOST requests/second,
+# bursts of SCRAPE_BURST). 429 and LinkedIn's 999 back the host off
+# (Retry-After when given, else full-jitter exponential backoff).
+SCRAPE_CONCURRENCY = int(os.getenv("SCRAPE_CONCURRENCY", "4"))
+SCRAPE_RATE_PER_HOST = float(os.getenv("SCRAPE_RATE_PER_HOST", "0.5"))
+SCRAPE_BURST = int(os.getenv("SCRAPE_BURST", "2"))
+SCRAPE_RETRIES = int(os.getenv("SCRAPE_RETRIES", "3"))
+SCRAPE_BACKOFF_BASE = float(os.getenv("SCRAPE_BACKOFF_BASE", "5"))  # seconds
+SCRAPE_BACKOFF_MAX = float(os.getenv("SCRAPE_BACKOFF_MAX", "120"))
+
+# Scraped-page cache (compressed, SQLite). Within the freshness window a
+# page is served from disk; after it, the fetch is a conditional GET
+# (ETag / Last-Modified) and a 304 reuses the stored body. Offline mode
+# serves only from the cache.
+HTTP_CACHE_ENABLED = os.getenv("HTTP_CACHE", "1").lower() in ("1", "true", "yes")
+HTTP_CACHE_PATH = Path(os.getenv("HTTP_CACHE_PATH", DATA_DIR / "http_cache.db"))
+HTTP_CACHE_MAX_BYTES = int(os.getenv("HTTP_CACHE_MAX_MB", "256")) * 1024 * 1024
+HTTP_CACHE_LINKEDIN_MAX_AGE = float(os.getenv("HTTP_CACHE_LINKEDIN_MAX_AGE_HOURS", "168")) * 3600
+HTTP_CACHE_WEB_MAX_AGE = float(os.getenv("HTTP_CACHE_WEB_MAX_AGE_HOURS", "24")) * 3600
+SCRAPE_OFFLINE = os.getenv("SCRAPE_OFFLINE", "0").lower() in ("1", "true", "yes")
+
 # --------------------
 # LLM Limits
 # --------------------
-MAX_PROFILE_CHARS = 12000
+MAX_PROFILE_CHARS = 24000
 MAX_CONTEXT_CHARS = 8000
 
+# Profiles longer than this are compressed (most salient lines and
+# sentences kept) before persona inference
+PROFILE_TOKEN_BUDGET = int(os.getenv("PROFILE_TOKEN_BUDGET", "1500"))
+
+# Context budgeting: count tokens with the model's tokenizer and size
+# num_ctx from them (power-of-two buckets between these bounds, raised
+# when a prompt needs more and never lowered, so the model is not reloaded
+# back and forth)
+CONTEXT_BUDGETING = os.getenv("CONTEXT_BUDGETING", "1").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+OLLAMA_MIN_NUM_CTX = int(os.getenv("OLLAMA_MIN_NUM_CTX", "2048"))
+OLLAMA_MAX_NUM_CTX = int(os.getenv("OLLAMA_MAX_NUM_CTX", "8192"))
+LLM_OUTPUT_TOKENS = int(os.getenv("LLM_OUTPUT_TOKENS", "512"))
+
+# --------------------
+# Memory (SQLite)
+# --------------------
+# Per-thread connections in WAL mode: readers never wait for the writer,
+# and a writer waits up to SQLITE_BUSY_TIMEOUT_MS for another writer
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+SQLITE_CACHE_MB = int(os.getenv("SQLITE_CACHE_MB", "16"))
+SQLITE_MMAP_MB = int(os.getenv("SQLITE_MMAP_MB", "256"))
+SQLITE_STATEMENT_CACHE = int(os.getenv("SQLITE_STATEMENT_CACHE", "256"))
+
+# --------------------
+# Similar Prospects (embeddings)
+# --------------------
+# Ollama embedding model (e.g. nomic-embed-text). Unset: a local hashed
+# bag-of-words embedder of EMBEDDING_DIM dimensions, no model needed.
+OLLAMA_EMBED_MODEL = os.getenv("OLLAMA_EMBED_MODEL", "")
+EMBEDDING_DIM = int(os.getenv("EMBEDDING_DIM", "512"))
+
+# Above this many vectors, search probes the EMBEDDING_IVF_PROBES nearest
+# k-means partitions (about sqrt(n) of them) instead of every row
+EMBEDDING_IVF_MIN_ROWS = int(os.getenv("EMBEDDING_IVF_MIN_ROWS", "100000"))
+EMBEDDING_IVF_PROBES = int(os.getenv("EMBEDDING_IVF_PROBES", "8"))
+
 # --------------------
 # Logging
 # --------------------
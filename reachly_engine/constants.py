@@ -11,6 +11,18 @@ ALL_CHANNELS = [
     CHANNEL_INSTAGRAM_DM,
 ]
 
+# Display labels (also used as the stored message channel)
+CHANNEL_LABELS = {
+    CHANNEL_EMAIL: "Email",
+    CHANNEL_WHATSAPP: "WhatsApp",
+    CHANNEL_LINKEDIN_DM: "LinkedIn DM",
+    CHANNEL_INSTAGRAM_DM: "Instagram DM",
+}
+
+# Generation modes
+GENERATION_MODE_CHANNELS = "channels"  # one completion per channel
+GENERATION_MODE_BUNDLE = "bundle"  # all channels in one JSON completion
+
 # Persona tone labels (normalized)
 TONE_FORMAL = "formal"
 TONE_CASUAL = "casual"
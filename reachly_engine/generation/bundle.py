@@ -0,0 +1,151 @@
+import asyncio
+import json
+from typing import Optional
+
+from reachly_engine.constants import ALL_CHANNELS
+from reachly_engine.generation.cta import get_cta, aget_cta
+from reachly_engine.generation.channels import (
+    CHANNEL_GENERATORS,
+    ASYNC_CHANNEL_GENERATORS,
+)
+from reachly_engine.llm.ollama_client import OllamaClient, AsyncOllamaClient
+from reachly_engine.llm.prompts import (
+    SYSTEM_GENERATION,
+    BUNDLE_PROMPT,
+    BUNDLE_CTA_GENERATE,
+    BUNDLE_CTA_GIVEN,
+)
+from reachly_engine.logger import get_logger
+
+logger = get_logger("bundle_gen")
+
+CTA_KEY = "cta"
+TEMPERATURE = 0.6
+
+
+def bundle_schema(include_cta: bool = True) -> dict:
+    """
+    JSON schema passed as Ollama's `format`: the shared CTA (unless one is
+    supplied) plus one string per channel in constants.ALL_CHANNELS.
+    """
+    keys = ([CTA_KEY] if include_cta else []) + ALL_CHANNELS
+    return {
+        "type": "object",
+        "properties": {key: {"type": "string"} for key in keys},
+        "required": keys,
+    }
+
+
+def parse_bundle(raw: str) -> dict:
+    """
+    Validate a bundle reply. Returns only the fields that are present and
+    non-empty strings; anything else is treated as missing.
+    """
+    try:
+        data = json.loads(raw)
+    except json.JSONDecodeError:
+        logger.error("Bundle reply is not valid JSON")
+        return {}
+
+    if not isinstance(data, dict):
+        logger.error("Bundle reply is not a JSON object")
+        return {}
+
+    bundle = {}
+    for key in [CTA_KEY] + ALL_CHANNELS:
+        value = data.get(key)
+        if isinstance(value, str) and value.strip():
+            bundle[key] = value.strip()
+
+    return bundle
+
+
+def _missing(bundle: dict) -> list[str]:
+    return [channel for channel in ALL_CHANNELS if channel not in bundle]
+
+
+def _build_prompt(persona: str, cta: Optional[str]) -> str:
+    if cta is None:
+        instruction = BUNDLE_CTA_GENERATE
+    else:
+        instruction = BUNDLE_CTA_GIVEN.format(cta=cta)
+    return BUNDLE_PROMPT.format(persona=persona, cta_instruction=instruction)
+
+
+def _merge_cta(bundle: dict, cta: Optional[str]) -> dict:
+    if cta is not None:
+        bundle[CTA_KEY] = cta
+    return bundle
+
+
+def generate_bundle(
+    persona: str, llm: OllamaClient, cta: Optional[str] = None
+) -> dict:
+    """
+    Generate every channel (plus the shared CTA) in one structured call.
+    Channels missing from the reply fall back to their own generator,
+    reusing the bundle's CTA.
+    """
+    logger.info("Generating multi-channel bundle")
+
+    bundle = _merge_cta(
+        parse_bundle(
+            llm.generate(
+                system_prompt=SYSTEM_GENERATION,
+                user_prompt=_build_prompt(persona, cta),
+                temperature=TEMPERATURE,
+                stage="bundle",
+                format=bundle_schema(include_cta=cta is None),
+            )
+        ),
+        cta,
+    )
+
+    missing = _missing(bundle)
+    if missing and CTA_KEY not in bundle:
+        bundle[CTA_KEY] = get_cta(persona, llm)
+
+    for channel in missing:
+        logger.info(f"Bundle missing {channel}; falling back to per-channel call")
+        bundle[channel] = CHANNEL_GENERATORS[channel](
+            persona, llm, cta=bundle.get(CTA_KEY)
+        )
+
+    return bundle
+
+
+async def agenerate_bundle(
+    persona: str, llm: AsyncOllamaClient, cta: Optional[str] = None
+) -> dict:
+    logger.info("Generating multi-channel bundle (async)")
+
+    bundle = _merge_cta(
+        parse_bundle(
+            await llm.agenerate(
+                system_prompt=SYSTEM_GENERATION,
+                user_prompt=_build_prompt(persona, cta),
+                temperature=TEMPERATURE,
+                stage="bundle",
+                format=bundle_schema(include_cta=cta is None),
+            )
+        ),
+        cta,
+    )
+
+    missing = _missing(bundle)
+    if missing and CTA_KEY not in bundle:
+        bundle[CTA_KEY] = await aget_cta(persona, llm)
+
+    if missing:
+        logger.info(f"Bundle missing {missing}; falling back to per-channel calls")
+        results = await asyncio.gather(
+            *(
+                ASYNC_CHANNEL_GENERATORS[channel](
+                    persona, llm, cta=bundle.get(CTA_KEY)
+                )
+                for channel in missing
+            )
+        )
+        bundle.update(zip(missing, results))
+
+    return bundle
@@ -0,0 +1,48 @@
+from reachly_engine.constants import (
+    CHANNEL_EMAIL,
+    CHANNEL_WHATSAPP,
+    CHANNEL_LINKEDIN_DM,
+    CHANNEL_INSTAGRAM_DM,
+)
+from reachly_engine.generation.email import (
+    generate_email,
+    agenerate_email,
+    astream_email,
+)
+from reachly_engine.generation.whatsapp import (
+    generate_whatsapp,
+    agenerate_whatsapp,
+    astream_whatsapp,
+)
+from reachly_engine.generation.linkedin_dm import (
+    generate_linkedin_dm,
+    agenerate_linkedin_dm,
+    astream_linkedin_dm,
+)
+from reachly_engine.generation.instagram_dm import (
+    generate_instagram_dm,
+    agenerate_instagram_dm,
+    astream_instagram_dm,
+)
+
+# Channel registry, in constants.ALL_CHANNELS order
+CHANNEL_GENERATORS = {
+    CHANNEL_EMAIL: generate_email,
+    CHANNEL_WHATSAPP: generate_whatsapp,
+    CHANNEL_LINKEDIN_DM: generate_linkedin_dm,
+    CHANNEL_INSTAGRAM_DM: generate_instagram_dm,
+}
+
+ASYNC_CHANNEL_GENERATORS = {
+    CHANNEL_EMAIL: agenerate_email,
+    CHANNEL_WHATSAPP: agenerate_whatsapp,
+    CHANNEL_LINKEDIN_DM: agenerate_linkedin_dm,
+    CHANNEL_INSTAGRAM_DM: agenerate_instagram_dm,
+}
+
+ASYNC_CHANNEL_STREAMS = {
+    CHANNEL_EMAIL: astream_email,
+    CHANNEL_WHATSAPP: astream_whatsapp,
+    CHANNEL_LINKEDIN_DM: astream_linkedin_dm,
+    CHANNEL_INSTAGRAM_DM: astream_instagram_dm,
+}
@@ -1,4 +1,13 @@
-from reachly_engine.llm.ollama_client import OllamaClient
+import hashlib
+import re
+from collections import OrderedDict
+from typing import Optional
+
+from reachly_engine.constants import (
+    CHANNEL_WHATSAPP,
+    CHANNEL_INSTAGRAM_DM,
+)
+from reachly_engine.llm.ollama_client import OllamaClient, AsyncOllamaClient
 from reachly_engine.llm.prompts import SYSTEM_GENERATION
 from reachly_engine.logger import get_logger
 
@@ -20,13 +29,108 @@ Examples:
 Return only the CTA sentence.
 """
 
+# Persona block hash -> CTA (bounded, most recently used last)
+_CTA_MEMO: "OrderedDict[str, str]" = OrderedDict()
+_CTA_MEMO_SIZE = 256
+
+# String-only rewrites for casual channels (no extra LLM call)
+_CASUAL_REWRITES = [
+    (re.compile(r"^would you be open to\b", re.IGNORECASE), "Open to"),
+    (re.compile(r"^would you be interested in\b", re.IGNORECASE), "Up for"),
+    (re.compile(r"^would it make sense to\b", re.IGNORECASE), "Worth it to"),
+]
+
+_SHORT_CHANNELS = {CHANNEL_WHATSAPP, CHANNEL_INSTAGRAM_DM}
+
+# One sentence; also keeps the context budget for this call small
+CTA_MAX_TOKENS = 64
 
-def generate_cta(persona: str, llm: OllamaClient) -> str:
+
+def generate_cta(
+    persona: str, llm: OllamaClient, use_cache: Optional[bool] = None
+) -> str:
     logger.info("Generating CTA")
 
     return llm.generate(
         system_prompt=SYSTEM_GENERATION,
         user_prompt=CTA_PROMPT.format(persona=persona),
         temperature=0.4,
+        use_cache=use_cache,
+        max_tokens=CTA_MAX_TOKENS,
+        stage="cta",
     ).strip()
 
+
+async def agenerate_cta(
+    persona: str, llm: AsyncOllamaClient, use_cache: Optional[bool] = None
+) -> str:
+    logger.info("Generating CTA (async)")
+
+    cta = await llm.agenerate(
+        system_prompt=SYSTEM_GENERATION,
+        user_prompt=CTA_PROMPT.format(persona=persona),
+        temperature=0.4,
+        use_cache=use_cache,
+        max_tokens=CTA_MAX_TOKENS,
+        stage="cta",
+    )
+    return cta.strip()
+
+
+# ---------- Shared CTA stage ----------
+
+
+def _memo_key(persona: str) -> str:
+    return hashlib.sha256(persona.strip().encode("utf-8")).hexdigest()
+
+
+def _memo_get(persona: str):
+    key = _memo_key(persona)
+    cta = _CTA_MEMO.get(key)
+    if cta is not None:
+        _CTA_MEMO.move_to_end(key)
+    return cta
+
+
+def _memo_put(persona: str, cta: str):
+    _CTA_MEMO[_memo_key(persona)] = cta
+    while len(_CTA_MEMO) > _CTA_MEMO_SIZE:
+        _CTA_MEMO.popitem(last=False)
+
+
+def get_cta(persona: str, llm: OllamaClient, fresh: bool = False) -> str:
+    """
+    CTA for a persona block, generated once and reused by every channel.
+    `fresh` skips both the memo and the LLM response cache (the new CTA
+    replaces the cached one).
+    """
+    cta = None if fresh else _memo_get(persona)
+    if cta is None:
+        cta = generate_cta(persona, llm, use_cache=not fresh)
+        _memo_put(persona, cta)
+    return cta
+
+
+async def aget_cta(
+    persona: str, llm: AsyncOllamaClient, fresh: bool = False
+) -> str:
+    cta = None if fresh else _memo_get(persona)
+    if cta is None:
+        cta = await agenerate_cta(persona, llm, use_cache=not fresh)
+        _memo_put(persona, cta)
+    return cta
+
+
+def adapt_cta(cta: str, channel: str) -> str:
+    """
+    Cheap per-channel touch-up of the shared CTA (string-only).
+    Short channels keep a single sentence in a more casual register.
+    """
+    cta = cta.strip().strip("\"'“”").strip()
+
+    if channel in _SHORT_CHANNELS:
+        cta = re.split(r"(?<=[.?!])\s+", cta, maxsplit=1)[0]
+        for pattern, replacement in _CASUAL_REWRITES:
+            cta = pattern.sub(replacement, cta)
+
+    return cta
@@ -1,21 +1,64 @@
-from reachly_engine.llm.ollama_client import OllamaClient
+from typing import AsyncIterator, Optional
+
+from reachly_engine.constants import CHANNEL_EMAIL
+from reachly_engine.llm.ollama_client import OllamaClient, AsyncOllamaClient
 from reachly_engine.llm.prompts import SYSTEM_GENERATION, EMAIL_PROMPT
-from reachly_engine.generation.cta import generate_cta
+from reachly_engine.generation.cta import get_cta, aget_cta
 from reachly_engine.logger import get_logger
 
 logger = get_logger("email_gen")
 
+TEMPERATURE = 0.6
+
+
+def _build_prompt(persona: str, cta: str) -> str:
+    return EMAIL_PROMPT.format(persona=persona) + f"\n\nCTA:\n{cta}"
 
-def generate_email(persona: str, llm: OllamaClient) -> str:
-    logger.info("Generating cold email")
 
-    cta = generate_cta(persona, llm)
+def generate_email(
+    persona: str, llm: OllamaClient, cta: Optional[str] = None
+) -> str:
+    logger.info("Generating cold email")
 
-    prompt = EMAIL_PROMPT.format(persona=persona) + f"\n\nCTA:\n{cta}"
+    if cta is None:
+        cta = get_cta(persona, llm)
 
     return llm.generate(
         system_prompt=SYSTEM_GENERATION,
-        user_prompt=prompt,
-        temperature=0.6,
+        user_prompt=_build_prompt(persona, cta),
+        temperature=TEMPERATURE,
+        stage=CHANNEL_EMAIL,
     )
 
+
+async def agenerate_email(
+    persona: str, llm: AsyncOllamaClient, cta: Optional[str] = None
+) -> str:
+    logger.info("Generating cold email (async)")
+
+    if cta is None:
+        cta = await aget_cta(persona, llm)
+
+    return await llm.agenerate(
+        system_prompt=SYSTEM_GENERATION,
+        user_prompt=_build_prompt(persona, cta),
+        temperature=TEMPERATURE,
+        stage=CHANNEL_EMAIL,
+    )
+
+
+async def astream_email(
+    persona: str, llm: AsyncOllamaClient, cta: Optional[str] = None
+) -> AsyncIterator[str]:
+    logger.info("Streaming cold email")
+
+    if cta is None:
+        cta = await aget_cta(persona, llm)
+
+    async for delta in llm.astream(
+        system_prompt=SYSTEM_GENERATION,
+        user_prompt=_build_prompt(persona, cta),
+        temperature=TEMPERATURE,
+        stage=CHANNEL_EMAIL,
+    ):
+        yield delta
@@ -1,20 +1,64 @@
-from reachly_engine.llm.ollama_client import OllamaClient
+from typing import AsyncIterator, Optional
+
+from reachly_engine.constants import CHANNEL_LINKEDIN_DM
+from reachly_engine.llm.ollama_client import OllamaClient, AsyncOllamaClient
 from reachly_engine.llm.prompts import SYSTEM_GENERATION, LINKEDIN_DM_PROMPT
-from reachly_engine.generation.cta import generate_cta
+from reachly_engine.generation.cta import get_cta, aget_cta
 from reachly_engine.logger import get_logger
 
 logger = get_logger("linkedin_dm_gen")
 
+TEMPERATURE = 0.55
+
+
+def _build_prompt(persona: str, cta: str) -> str:
+    return LINKEDIN_DM_PROMPT.format(persona=persona) + f"\n\nCTA:\n{cta}"
+
 
-def generate_linkedin_dm(persona: str, llm: OllamaClient) -> str:
+def generate_linkedin_dm(
+    persona: str, llm: OllamaClient, cta: Optional[str] = None
+) -> str:
     logger.info("Generating LinkedIn DM")
 
-    cta = generate_cta(persona, llm)
-    prompt = LINKEDIN_DM_PROMPT.format(persona=persona) + f"\n\nCTA:\n{cta}"
+    if cta is None:
+        cta = get_cta(persona, llm)
 
     return llm.generate(
         system_prompt=SYSTEM_GENERATION,
-        user_prompt=prompt,
-        temperature=0.55,
+        user_prompt=_build_prompt(persona, cta),
+        temperature=TEMPERATURE,
+        stage=CHANNEL_LINKEDIN_DM,
+    )
+
+
+async def agenerate_linkedin_dm(
+    persona: str, llm: AsyncOllamaClient, cta: Optional[str] = None
+) -> str:
+    logger.info("Generating LinkedIn DM (async)")
+
+    if cta is None:
+        cta = await aget_cta(persona, llm)
+
+    return await llm.agenerate(
+        system_prompt=SYSTEM_GENERATION,
+        user_prompt=_build_prompt(persona, cta),
+        temperature=TEMPERATURE,
+        stage=CHANNEL_LINKEDIN_DM,
     )
 
+
+async def astream_linkedin_dm(
+    persona: str, llm: AsyncOllamaClient, cta: Optional[str] = None
+) -> AsyncIterator[str]:
+    logger.info("Streaming LinkedIn DM")
+
+    if cta is None:
+        cta = await aget_cta(persona, llm)
+
+    async for delta in llm.astream(
+        system_prompt=SYSTEM_GENERATION,
+        user_prompt=_build_prompt(persona, cta),
+        temperature=TEMPERATURE,
+        stage=CHANNEL_LINKEDIN_DM,
+    ):
+        yield delta
@@ -0,0 +1,226 @@
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Iterator, Optional
+
+import httpx
+
+from reachly_engine.config import (
+    OLLAMA_EJECT_AFTER,
+    OLLAMA_PROBE_INTERVAL,
+    OLLAMA_CONNECT_TIMEOUT,
+)
+from reachly_engine.logger import get_logger
+
+logger = get_logger("backends")
+
+PROBE_TIMEOUT = 10
+
+# Weight of the newest sample in the latency moving average
+LATENCY_ALPHA = 0.3
+
+
+def model_available(tags: dict, model: str) -> bool:
+    """
+    True if an /api/tags reply lists `model`.
+    """
+    models = [m["name"] for m in tags.get("models", [])]
+    return model in models
+
+
+def is_backend_failure(error: Exception) -> bool:
+    """
+    Errors that say something about the host rather than the request:
+    connection problems, timeouts and 5xx replies.
+    """
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code >= 500
+    return isinstance(error, httpx.TransportError)
+
+
+@dataclass
+class Backend:
+    url: str
+    healthy: bool = True
+    in_flight: int = 0
+    failures: int = 0
+    latency: Optional[float] = None  # EWMA, seconds
+    requests: int = 0
+
+    def score(self) -> tuple[float, int]:
+        """
+        Expected wait for one more request: queue depth x recent latency,
+        then queue depth alone. Unmeasured backends score 0 so each gets
+        tried once before latency decides.
+        """
+        return (self.in_flight + 1) * (self.latency or 0.0), self.in_flight
+
+
+class BackendPool:
+    """
+    Several Ollama hosts serving the same model.
+
+    Each request leases the healthy backend with the lowest
+    (in-flight + 1) x latency-EWMA score. A backend is ejected after
+    `eject_after` consecutive failures (or when it lacks the model) and a
+    background thread re-probes ejected backends every `probe_interval`
+    seconds, restoring them once /api/tags lists the model again.
+
+    Thread-safe; the sync and async clients can share one pool.
+    """
+
+    def __init__(
+        self,
+        urls: list[str],
+        model: str,
+        eject_after: int = OLLAMA_EJECT_AFTER,
+        probe_interval: float = OLLAMA_PROBE_INTERVAL,
+        transport: Optional[httpx.BaseTransport] = None,
+    ):
+        if not urls:
+            raise ValueError("BackendPool needs at least one URL")
+
+        self.model = model
+        self.eject_after = max(1, eject_after)
+        self.probe_interval = probe_interval
+        self.backends = [Backend(url.rstrip("/")) for url in urls]
+
+        self._lock = threading.Lock()
+        self._client = httpx.Client(
+            timeout=httpx.Timeout(PROBE_TIMEOUT, connect=OLLAMA_CONNECT_TIMEOUT),
+            transport=transport,
+        )
+        self._stop = threading.Event()
+        self._prober: Optional[threading.Thread] = None
+
+    def __len__(self) -> int:
+        return len(self.backends)
+
+    def close(self):
+        self._stop.set()
+        if self._prober is not None:
+            self._prober.join(timeout=PROBE_TIMEOUT)
+        self._client.close()
+
+    # ---------- Routing ----------
+
+    def healthy(self) -> list[Backend]:
+        with self._lock:
+            return [b for b in self.backends if b.healthy]
+
+    def acquire(self, allow: Optional[Callable[[str], bool]] = None) -> Backend:
+        """
+        Least-loaded healthy backend. `allow` narrows the choice (e.g. skip
+        open circuits) but is ignored if it would leave nothing.
+        """
+        with self._lock:
+            candidates = [b for b in self.backends if b.healthy]
+            if not candidates:
+                raise RuntimeError("No healthy Ollama backend")
+
+            if allow is not None:
+                candidates = [b for b in candidates if allow(b.url)] or candidates
+
+            backend = min(candidates, key=Backend.score)
+            backend.in_flight += 1
+            backend.requests += 1
+            return backend
+
+    def release(
+        self, backend: Backend, latency: Optional[float] = None, ok: bool = True
+    ):
+        with self._lock:
+            backend.in_flight -= 1
+
+            if ok:
+                backend.failures = 0
+                if latency is not None:
+                    if backend.latency is None:
+                        backend.latency = latency
+                    else:
+                        backend.latency += LATENCY_ALPHA * (latency - backend.latency)
+                return
+
+            backend.failures += 1
+            eject = backend.healthy and backend.failures >= self.eject_after
+
+        if eject:
+            self.eject(backend)
+
+    @contextmanager
+    def lease(
+        self, allow: Optional[Callable[[str], bool]] = None
+    ) -> Iterator[Backend]:
+        """
+        Acquire a backend for one request and release it with the outcome.
+        Only clean completions feed the latency average.
+        """
+        backend = self.acquire(allow)
+        start = time.perf_counter()
+        ok, latency = True, None
+        try:
+            yield backend
+            latency = time.perf_counter() - start
+        except Exception as e:
+            ok = not is_backend_failure(e)
+            raise
+        finally:
+            # Also runs when a stream is abandoned (GeneratorExit)
+            self.release(backend, latency, ok)
+
+    # ---------- Health ----------
+
+    def eject(self, backend: Backend):
+        with self._lock:
+            if not backend.healthy:
+                return
+            backend.healthy = False
+        logger.error(f"Ejecting Ollama backend {backend.url}")
+        self._start_prober()
+
+    def _restore(self, backend: Backend):
+        with self._lock:
+            backend.healthy = True
+            backend.failures = 0
+            backend.latency = None  # re-learn; the host may have changed
+        logger.info(f"Ollama backend {backend.url} is back")
+
+    def probe(self, backend: Backend) -> bool:
+        """
+        Same check as OllamaClient.health_check, for one backend.
+        """
+        try:
+            r = self._client.get(f"{backend.url}/api/tags")
+            r.raise_for_status()
+            return model_available(r.json(), self.model)
+        except Exception:
+            return False
+
+    def probe_all(self) -> bool:
+        """
+        Probe every backend, ejecting or restoring as needed.
+        True if at least one is healthy afterwards.
+        """
+        for backend in self.backends:
+            if self.probe(backend):
+                if not backend.healthy:
+                    self._restore(backend)
+            else:
+                self.eject(backend)
+        return bool(self.healthy())
+
+    def _start_prober(self):
+        with self._lock:
+            if self._prober is not None or self._stop.is_set():
+                return
+            self._prober = threading.Thread(
+                target=self._probe_loop, name="ollama-prober", daemon=True
+            )
+        self._prober.start()
+
+    def _probe_loop(self):
+        while not self._stop.wait(self.probe_interval):
+            for backend in self.backends:
+                if not backend.healthy and self.probe(backend):
+                    self._restore(backend)
@@ -0,0 +1,109 @@
+import threading
+from dataclasses import dataclass
+from typing import Optional
+
+from reachly_engine.config import (
+    OLLAMA_MIN_NUM_CTX,
+    OLLAMA_MAX_NUM_CTX,
+    LLM_OUTPUT_TOKENS,
+)
+from reachly_engine.llm.tokenizer import Tokenizer
+from reachly_engine.logger import get_logger
+
+logger = get_logger("budget")
+
+# Chat template tokens (role markers, BOS/EOS) per request
+TEMPLATE_OVERHEAD_TOKENS = 32
+
+
+@dataclass
+class PromptPlan:
+    user_prompt: str
+    num_ctx: int
+    prompt_tokens: int
+    output_tokens: int
+    truncated: bool
+
+
+class ContextBudgeter:
+    """
+    Sizes system prompt + user prompt + expected output against the model's
+    context window and picks `num_ctx` per request.
+
+    num_ctx is rounded up to a power of two (>= OLLAMA_MIN_NUM_CTX) and
+    only ever grows: every change of num_ctx makes Ollama reload the model,
+    so once a large prompt has raised it, smaller requests keep the larger
+    size instead of shrinking it back. A budgeter serves one model, so a
+    process pays at most one reload per power-of-two step up to the window.
+    """
+
+    def __init__(
+        self,
+        tokenizer: Tokenizer,
+        min_num_ctx: int = OLLAMA_MIN_NUM_CTX,
+        max_num_ctx: int = OLLAMA_MAX_NUM_CTX,
+        output_tokens: int = LLM_OUTPUT_TOKENS,
+    ):
+        self.tokenizer = tokenizer
+        self.min_num_ctx = min_num_ctx
+        self.max_num_ctx = max_num_ctx
+        self.output_tokens = output_tokens
+        self._limit: Optional[int] = None
+        self._num_ctx = min_num_ctx  # high-water mark sent to the server
+        self._lock = threading.Lock()
+
+    def context_limit(self) -> int:
+        """
+        Largest num_ctx we will ask for: the model's trained window,
+        capped by OLLAMA_MAX_NUM_CTX.
+        """
+        if self._limit is None:
+            model_ctx = self.tokenizer.context_length()
+            self._limit = min(model_ctx or self.max_num_ctx, self.max_num_ctx)
+        return self._limit
+
+    def _bucket(self, tokens: int) -> int:
+        size = self.min_num_ctx
+        while size < tokens:
+            size *= 2
+        size = min(size, self.context_limit())
+
+        with self._lock:
+            if size > self._num_ctx:
+                logger.info(f"Raising num_ctx {self._num_ctx} -> {size}")
+            self._num_ctx = max(self._num_ctx, size)
+            return self._num_ctx
+
+    def plan(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        output_tokens: Optional[int] = None,
+    ) -> PromptPlan:
+        output_tokens = output_tokens or self.output_tokens
+        system_tokens = self.tokenizer.count(system_prompt)
+        user_tokens = self.tokenizer.count(user_prompt)
+
+        fixed = system_tokens + TEMPLATE_OVERHEAD_TOKENS + output_tokens
+        needed = fixed + user_tokens
+        limit = self.context_limit()
+
+        truncated = False
+        if needed > limit:
+            allowed = max(limit - fixed, 0)
+            logger.info(
+                f"Prompt needs {needed} tokens, window is {limit}; "
+                f"truncating user prompt to {allowed} tokens"
+            )
+            user_prompt = self.tokenizer.truncate(user_prompt, allowed)
+            user_tokens = self.tokenizer.count(user_prompt)
+            needed = fixed + user_tokens
+            truncated = True
+
+        return PromptPlan(
+            user_prompt=user_prompt,
+            num_ctx=self._bucket(needed),
+            prompt_tokens=system_tokens + user_tokens + TEMPLATE_OVERHEAD_TOKENS,
+            output_tokens=output_tokens,
+            truncated=truncated,
+        )
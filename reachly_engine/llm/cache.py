@@ -0,0 +1,174 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from reachly_engine.config import (
+    LLM_CACHE_PATH,
+    LLM_CACHE_MAX_ENTRIES,
+    LLM_CACHE_MAX_BYTES,
+    LLM_CACHE_TTL_SECONDS,
+)
+from reachly_engine.logger import get_logger
+
+logger = get_logger("llm_cache")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    content TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_responses_last_access ON responses(last_access);
+"""
+
+
+def request_key(payload: dict) -> str:
+    """
+    Content address of a chat request: model, messages, options (incl. seed)
+    and output format. Transport-only fields such as `stream` are ignored,
+    and so is `num_ctx`: the budgeter raises it as the process goes, but it
+    sizes the window, not the answer.
+    """
+    canonical = {k: v for k, v in payload.items() if k != "stream"}
+    options = canonical.get("options")
+    if options and "num_ctx" in options:
+        canonical["options"] = {k: v for k, v in options.items() if k != "num_ctx"}
+    blob = json.dumps(canonical, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """
+    On-disk LLM response cache (SQLite) with TTL and size-bounded LRU eviction.
+    """
+
+    def __init__(
+        self,
+        path: Path = LLM_CACHE_PATH,
+        max_entries: int = LLM_CACHE_MAX_ENTRIES,
+        max_bytes: int = LLM_CACHE_MAX_BYTES,
+        ttl_seconds: float = LLM_CACHE_TTL_SECONDS,
+    ):
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    # ---------- Lookup ----------
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT content, created_at FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+
+            if row and self.ttl_seconds and now - row[1] > self.ttl_seconds:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._conn.commit()
+                self.evictions += 1
+                row = None
+
+            if not row:
+                self.misses += 1
+                return None
+
+            self._conn.execute(
+                "UPDATE responses SET last_access = ? WHERE key = ?",
+                (now, key),
+            )
+            self._conn.commit()
+            self.hits += 1
+
+        return row[0]
+
+    def put(self, key: str, content: str):
+        now = time.time()
+        size = len(content.encode("utf-8"))
+
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO responses
+                (key, content, size, created_at, last_access)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                (key, content, size, now, now),
+            )
+            self._evict(now)
+            self._conn.commit()
+
+    # ---------- Maintenance ----------
+
+    def _evict(self, now: float):
+        if self.ttl_seconds:
+            cur = self._conn.execute(
+                "DELETE FROM responses WHERE created_at < ?",
+                (now - self.ttl_seconds,),
+            )
+            self.evictions += cur.rowcount
+
+        count, total = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+
+        if count <= self.max_entries and total <= self.max_bytes:
+            return
+
+        # Drop least recently used rows until both bounds hold
+        rows = self._conn.execute(
+            "SELECT key, size FROM responses ORDER BY last_access ASC"
+        )
+        victims = []
+        for key, size in rows:
+            if count <= self.max_entries and total <= self.max_bytes:
+                break
+            victims.append((key,))
+            count -= 1
+            total -= size
+
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", victims)
+        self.evictions += len(victims)
+        logger.info(f"Evicted {len(victims)} cached LLM responses")
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def stats(self) -> dict:
+        with self._lock:
+            count, total = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+
+        lookups = self.hits + self.misses
+        return {
+            "entries": count,
+            "bytes": total,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
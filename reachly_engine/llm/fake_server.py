@@ -0,0 +1,395 @@
+"""
+Local stand-in for an Ollama server, for tests and benchmarks.
+
+Implements /api/chat (streaming and non-streaming, `format` JSON schemas),
+/api/tags, /api/show, /api/embed and the legacy /api/embeddings, with
+simulated timing:
+
+- prompt evaluation per prompt token, skipping the prefix shared with the
+  previous prompt in the same slot (like Ollama's KV cache reuse)
+- decoding per output token
+- a one-off model load on the first request
+- at most `parallel` requests decoding at once, `max_queue` waiting,
+  503 beyond that (Ollama's OLLAMA_NUM_PARALLEL / OLLAMA_MAX_QUEUE)
+- optional random error injection
+
+Standard library only, so scripts can start it before the package reads
+its configuration from the environment.
+"""
+import hashlib
+import json
+import math
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+CHARS_PER_TOKEN = 4
+
+_WORDS = (
+    "quick note about your work on data platforms and the team you lead "
+    "would love to compare notes on scaling analytics open to a short chat "
+    "next week happy to share what we learned shipping this at similar companies"
+).split()
+
+
+@dataclass
+class FakeOllamaConfig:
+    model: str = "fake-model"
+    context_length: int = 8192
+    embedding_dim: int = 384
+
+    prompt_ms_per_token: float = 0.2
+    token_ms: float = 10.0
+    load_ms: float = 0.0  # first request only
+    reply_tokens: int = 60
+
+    parallel: int = 4
+    max_queue: int = 64
+
+    error_rate: float = 0.0
+    error_status: int = 503
+    seed: Optional[int] = None
+
+    models: list[str] = field(default_factory=list)  # defaults to [model]
+
+
+def _tokens(text: str) -> int:
+    return math.ceil(len(text) / CHARS_PER_TOKEN) if text else 0
+
+
+def _prompt_text(messages: list[dict]) -> str:
+    return "".join(f"<{m.get('role')}>{m.get('content', '')}" for m in messages)
+
+
+def _common_prefix(a: str, b: str) -> int:
+    n = min(len(a), len(b))
+    i = 0
+    while i < n and a[i] == b[i]:
+        i += 1
+    return i
+
+
+def _words(rng: random.Random, count: int) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(max(count, 1)))
+
+
+def fake_from_schema(schema: dict, rng: random.Random) -> object:
+    """
+    A value matching a (simple) JSON schema: objects, arrays, enums,
+    strings, booleans and numbers.
+    """
+    kind = schema.get("type")
+    if "enum" in schema:
+        options = [v for v in schema["enum"] if v != ""] or schema["enum"]
+        return options[0]
+    if kind == "object":
+        return {
+            key: fake_from_schema(sub, rng)
+            for key, sub in schema.get("properties", {}).items()
+        }
+    if kind == "array":
+        return [fake_from_schema(schema.get("items", {}), rng) for _ in range(2)]
+    if kind == "boolean":
+        return False
+    if kind in ("integer", "number"):
+        return 1
+    return _words(rng, 8).capitalize() + "."
+
+
+def fake_embedding(text: str, dim: int) -> list[float]:
+    """
+    Deterministic unit vector from the text's word hashes.
+    """
+    vector = [0.0] * dim
+    for word in text.lower().split():
+        h = int.from_bytes(hashlib.md5(word.encode()).digest()[:8], "big")
+        vector[h % dim] += 1.0 if (h >> 32) & 1 else -1.0
+    norm = math.sqrt(sum(v * v for v in vector)) or 1.0
+    return [v / norm for v in vector]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    server: "FakeOllamaServer"
+
+    def log_message(self, *args):
+        pass
+
+    def _json(self, status: int, body: dict):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _body(self) -> dict:
+        length = int(self.headers.get("Content-Length", 0))
+        return json.loads(self.rfile.read(length) or b"{}")
+
+    def do_GET(self):
+        if self.path == "/api/tags":
+            self._json(
+                200, {"models": [{"name": m} for m in self.server.model_names]}
+            )
+        else:
+            self._json(404, {"error": "not found"})
+
+    def do_POST(self):
+        body = self._body()
+        route = {
+            "/api/chat": self.server.handle_chat,
+            "/api/show": self.server.handle_show,
+            "/api/embed": self.server.handle_embed,
+            "/api/embeddings": self.server.handle_embeddings,
+        }.get(self.path)
+
+        if route is None:
+            self._json(404, {"error": "not found"})
+            return
+
+        self.server.count(self.path)
+        route(self, body)
+
+
+class FakeOllamaServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(
+        self,
+        config: Optional[FakeOllamaConfig] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        super().__init__((host, port), _Handler)
+        self.config = config or FakeOllamaConfig()
+        self.model_names = self.config.models or [self.config.model]
+
+        self._rng = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+        self._slots = threading.Semaphore(self.config.parallel)
+        self._slot_prompts: list[str] = []  # last prompt per KV slot
+        self._waiting = 0
+        self._loaded = False
+        self._thread: Optional[threading.Thread] = None
+
+        self.requests: dict[str, int] = {}
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.errors = 0
+
+    # ---------- Lifecycle ----------
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeOllamaServer":
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def count(self, path: str):
+        with self._lock:
+            self.requests[path] = self.requests.get(path, 0) + 1
+
+    # ---------- Simulation ----------
+
+    def _inject_error(self) -> bool:
+        with self._lock:
+            if self._rng.random() < self.config.error_rate:
+                self.errors += 1
+                return True
+        return False
+
+    def _take_slot(self, prompt: str) -> int:
+        """
+        Tokens to evaluate after reusing the best-matching cached prefix;
+        the slot then holds this prompt.
+        """
+        with self._lock:
+            best, shared = None, 0
+            for i, cached in enumerate(self._slot_prompts):
+                n = _common_prefix(cached, prompt)
+                if best is None or n > shared:
+                    best, shared = i, n
+            if best is None or len(self._slot_prompts) < self.config.parallel:
+                self._slot_prompts.append(prompt)
+            else:
+                self._slot_prompts[best] = prompt
+        return _tokens(prompt[shared:])
+
+    def _load(self) -> int:
+        with self._lock:
+            cold = not self._loaded
+            self._loaded = True
+        if not cold or not self.config.load_ms:
+            return 0
+        time.sleep(self.config.load_ms / 1000)
+        return int(self.config.load_ms * 1e6)
+
+    def _reply(self, body: dict, rng: random.Random) -> str:
+        fmt = body.get("format")
+        if isinstance(fmt, dict):
+            return json.dumps(fake_from_schema(fmt, rng))
+        if fmt == "json":
+            return "{}"
+        limit = body.get("options", {}).get("num_predict")
+        count = self.config.reply_tokens
+        if limit and limit > 0:
+            count = min(count, limit)
+        return _words(rng, count)
+
+    # ---------- Endpoints ----------
+
+    def handle_chat(self, handler: _Handler, body: dict):
+        if body.get("model") not in self.model_names:
+            handler._json(404, {"error": f"model '{body.get('model')}' not found"})
+            return
+
+        if self._inject_error():
+            handler._json(self.config.error_status, {"error": "injected failure"})
+            return
+
+        with self._lock:
+            if self._waiting >= self.config.max_queue:
+                self.errors += 1
+                handler._json(503, {"error": "server busy, please try again"})
+                return
+            self._waiting += 1
+
+        self._slots.acquire()
+        with self._lock:
+            self._waiting -= 1
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+
+        try:
+            self._serve_chat(handler, body)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+            self._slots.release()
+
+    def _serve_chat(self, handler: _Handler, body: dict):
+        started = time.perf_counter_ns()
+        prompt = _prompt_text(body.get("messages", []))
+
+        # Same prompt → same reply, different prompts → different replies
+        rng = random.Random(hashlib.sha256(prompt.encode()).hexdigest())
+
+        load_ns = self._load()
+        prompt_tokens = self._take_slot(prompt)
+        prompt_ns = int(prompt_tokens * self.config.prompt_ms_per_token * 1e6)
+        time.sleep(prompt_ns / 1e9)
+
+        content = self._reply(body, rng)
+        pieces = content.split(" ")
+        token_s = self.config.token_ms / 1000
+        stats = {
+            "load_duration": load_ns,
+            "prompt_eval_count": prompt_tokens,
+            "prompt_eval_duration": prompt_ns,
+            "eval_count": len(pieces),
+        }
+
+        if not body.get("stream", True):
+            time.sleep(token_s * len(pieces))
+            stats["eval_duration"] = int(token_s * len(pieces) * 1e9)
+            stats["total_duration"] = time.perf_counter_ns() - started
+            handler._json(
+                200,
+                {
+                    "model": self.config.model,
+                    "message": {"role": "assistant", "content": content},
+                    "done": True,
+                    **stats,
+                },
+            )
+            return
+
+        handler.send_response(200)
+        handler.send_header("Content-Type", "application/x-ndjson")
+        handler.send_header("Transfer-Encoding", "chunked")
+        handler.end_headers()
+
+        def chunk(data: dict):
+            line = (json.dumps(data) + "\n").encode()
+            handler.wfile.write(f"{len(line):X}\r\n".encode() + line + b"\r\n")
+            handler.wfile.flush()
+
+        decode_started = time.perf_counter_ns()
+        for i, piece in enumerate(pieces):
+            time.sleep(token_s)
+            text = piece if i == 0 else " " + piece
+            chunk(
+                {
+                    "model": self.config.model,
+                    "message": {"role": "assistant", "content": text},
+                    "done": False,
+                }
+            )
+
+        stats["eval_duration"] = time.perf_counter_ns() - decode_started
+        stats["total_duration"] = time.perf_counter_ns() - started
+        chunk(
+            {
+                "model": self.config.model,
+                "message": {"role": "assistant", "content": ""},
+                "done": True,
+                **stats,
+            }
+        )
+        handler.wfile.write(b"0\r\n\r\n")
+        handler.wfile.flush()
+
+    def handle_show(self, handler: _Handler, body: dict):
+        handler._json(
+            200,
+            {
+                "model_info": {
+                    "general.architecture": "llama",
+                    "llama.context_length": self.config.context_length,
+                }
+            },
+        )
+
+    def handle_embed(self, handler: _Handler, body: dict):
+        inputs = body.get("input", "")
+        if isinstance(inputs, str):
+            inputs = [inputs]
+        handler._json(
+            200,
+            {
+                "model": body.get("model", self.config.model),
+                "embeddings": [
+                    fake_embedding(text, self.config.embedding_dim)
+                    for text in inputs
+                ],
+            },
+        )
+
+    def handle_embeddings(self, handler: _Handler, body: dict):
+        handler._json(
+            200,
+            {
+                "embedding": fake_embedding(
+                    body.get("prompt", ""), self.config.embedding_dim
+                )
+            },
+        )
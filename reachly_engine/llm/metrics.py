@@ -0,0 +1,156 @@
+import bisect
+import threading
+from collections import defaultdict
+from typing import Optional
+
+from reachly_engine.logger import get_logger
+
+logger = get_logger("metrics")
+
+
+def _key(name: str, labels: dict) -> tuple:
+    return (name, tuple(sorted((k, str(v)) for k, v in labels.items())))
+
+
+def _render(key: tuple) -> str:
+    name, labels = key
+    if not labels:
+        return name
+    return name + "{" + ",".join(f"{k}={v}" for k, v in labels) + "}"
+
+
+# Default histogram bounds, seconds (LLM calls: tens of ms to minutes)
+LATENCY_BUCKETS = (
+    0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 15.0, 30.0, 60.0, 120.0,
+)
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram (upper bounds, plus +Inf) with count/sum/min/max.
+    Quantiles are estimated by linear interpolation inside the bucket.
+    """
+
+    def __init__(self, buckets: tuple = LATENCY_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        if not self.count:
+            return 0.0
+
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            if n and seen + n >= rank:
+                lower = self.buckets[i - 1] if i > 0 else 0.0
+                upper = self.buckets[i] if i < len(self.buckets) else self.max
+                lower, upper = max(lower, self.min), min(upper, self.max)
+                return lower + (upper - lower) * (rank - seen) / n
+            seen += n
+        return self.max
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 6),
+            "min": self.min,
+            "max": self.max,
+            "p50": round(self.quantile(0.5), 6),
+            "p95": round(self.quantile(0.95), 6),
+            "buckets": dict(
+                zip([str(b) for b in self.buckets] + ["+Inf"], self.counts)
+            ),
+        }
+
+
+class Metrics:
+    """
+    In-process counter and histogram registry, labelled Prometheus-style:
+
+        METRICS.incr("llm_retries_total", stage="cta", reason="503")
+        METRICS.get("llm_retries_total", stage="cta", reason="503")
+        METRICS.observe("llm_total_seconds", 1.7, stage="email")
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: "defaultdict[tuple, int]" = defaultdict(int)
+        self._histograms: dict[tuple, Histogram] = {}
+
+    def incr(self, name: str, value: int = 1, **labels):
+        with self._lock:
+            self._counters[_key(name, labels)] += value
+
+    def get(self, name: str, **labels) -> int:
+        with self._lock:
+            return self._counters.get(_key(name, labels), 0)
+
+    def total(self, name: str, **labels) -> int:
+        """
+        Sum of a counter over all label sets that include `labels`.
+        """
+        wanted = set(_key(name, labels)[1])
+        with self._lock:
+            return sum(
+                v
+                for (n, key_labels), v in self._counters.items()
+                if n == name and wanted <= set(key_labels)
+            )
+
+    def observe(
+        self, name: str, value: float, buckets: tuple = LATENCY_BUCKETS, **labels
+    ):
+        with self._lock:
+            key = _key(name, labels)
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram(buckets)
+            histogram.observe(value)
+
+    def histogram(self, name: str, **labels) -> Optional[Histogram]:
+        with self._lock:
+            return self._histograms.get(_key(name, labels))
+
+    def histograms(self, name: str) -> dict[tuple, Histogram]:
+        """
+        Every label set of one histogram, keyed by its sorted label items.
+        """
+        with self._lock:
+            return {
+                labels: h for (n, labels), h in self._histograms.items() if n == name
+            }
+
+    def snapshot(self) -> dict[str, int]:
+        with self._lock:
+            return {_render(k): v for k, v in sorted(self._counters.items())}
+
+    def histogram_snapshot(self) -> dict[str, dict]:
+        with self._lock:
+            return {
+                _render(k): h.to_dict() for k, h in sorted(self._histograms.items())
+            }
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+
+# Process-wide registry
+METRICS = Metrics()
@@ -1,95 +1,808 @@
+import asyncio
+import json
+import time
 import httpx
-from typing import Optional
+from contextlib import contextmanager
+from typing import AsyncIterator, Iterator, Optional
 
 from reachly_engine.config import (
     OLLAMA_BASE_URL,
     OLLAMA_MODEL,
     OLLAMA_TIMEOUT,
+    OLLAMA_CONNECT_TIMEOUT,
+    OLLAMA_WRITE_TIMEOUT,
+    OLLAMA_POOL_TIMEOUT,
+    OLLAMA_MAX_CONNECTIONS,
+    OLLAMA_MAX_KEEPALIVE,
+    OLLAMA_KEEPALIVE_EXPIRY,
+    OLLAMA_NUM_PARALLEL,
+    OLLAMA_SEED,
     MAX_CONTEXT_CHARS,
 )
 from reachly_engine.logger import get_logger
+from reachly_engine.llm.backends import (
+    BackendPool,
+    is_backend_failure,
+    model_available,
+)
+from reachly_engine.llm.budget import ContextBudgeter
+from reachly_engine.llm.cache import ResponseCache, request_key
+from reachly_engine.llm.resilience import Resilience
+from reachly_engine.llm.telemetry import TELEMETRY, LLMResult, Telemetry
 from reachly_engine.llm.tokenizer import truncate_to_tokens
 
 logger = get_logger("ollama")
 
+HEALTH_CHECK_TIMEOUT = 10
+
+# Stage label for calls that do not pass one (metrics, hedging)
+DEFAULT_STAGE = "default"
+
+
+def build_timeout(read_timeout: float = OLLAMA_TIMEOUT) -> httpx.Timeout:
+    """
+    Split timeouts: fail fast on connect, wait long on read (model decoding).
+    """
+    return httpx.Timeout(
+        connect=OLLAMA_CONNECT_TIMEOUT,
+        read=read_timeout,
+        write=OLLAMA_WRITE_TIMEOUT,
+        pool=OLLAMA_POOL_TIMEOUT,
+    )
+
+
+def build_limits(
+    max_connections: int = OLLAMA_MAX_CONNECTIONS,
+    max_keepalive: int = OLLAMA_MAX_KEEPALIVE,
+) -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive,
+        keepalive_expiry=OLLAMA_KEEPALIVE_EXPIRY,
+    )
+
+
+class _OllamaBase:
+    """
+    Request building and response parsing shared by the sync and async clients.
+    """
 
-class OllamaClient:
     def __init__(
         self,
-        base_url: str = OLLAMA_BASE_URL,
-        model: str = OLLAMA_MODEL,
-        timeout: int = OLLAMA_TIMEOUT,
+        base_url: str,
+        model: str,
+        timeout: int,
+        cache: Optional[ResponseCache] = None,
+        seed: Optional[int] = OLLAMA_SEED,
+        cache_bypass: bool = False,
+        budgeter: Optional[ContextBudgeter] = None,
+        base_urls: Optional[list[str]] = None,
+        pool: Optional[BackendPool] = None,
+        resilience: Optional[Resilience] = None,
+        telemetry: Optional[Telemetry] = TELEMETRY,
     ):
         self.base_url = base_url.rstrip("/")
         self.model = model
         self.timeout = timeout
 
-    def generate(
+        # Several hosts: route per request through a BackendPool. A pool
+        # passed in is shared (e.g. sync + async client) and not closed here.
+        self._owns_pool = False
+        if pool is None and base_urls and len(base_urls) > 1:
+            pool = BackendPool(base_urls, model)
+            self._owns_pool = True
+        elif pool is None and base_urls:
+            self.base_url = base_urls[0].rstrip("/")
+        self.pool = pool
+        if pool is not None:
+            self.base_url = pool.backends[0].url
+
+        # Retries, circuit breakers and hedging; share one between clients
+        # that talk to the same hosts
+        self._owns_resilience = resilience is None
+        self.resilience = resilience or Resilience()
+
+        # Per-call timing from Ollama's response fields (None disables)
+        self.telemetry = telemetry
+
+        # Token-accurate prompt sizing and per-request num_ctx (optional)
+        self.budgeter = budgeter
+
+        # Opt-in response cache; `cache_bypass` skips lookups ("regenerate
+        # fresh") but still stores the new result for next time.
+        self.cache = cache
+        self.seed = seed
+        self.cache_bypass = cache_bypass
+
+    def _build_payload(
         self,
         system_prompt: str,
         user_prompt: str,
-        temperature: float = 0.7,
-    ) -> str:
+        temperature: float,
+        stream: bool = False,
+        seed: Optional[int] = None,
+        format: Optional[dict | str] = None,
+        max_tokens: Optional[int] = None,
+    ) -> dict:
+        num_ctx = None
+        if self.budgeter is not None:
+            plan = self.budgeter.plan(system_prompt, user_prompt, max_tokens)
+            user_prompt = plan.user_prompt
+            num_ctx = plan.num_ctx
+        else:
+            user_prompt = truncate_to_tokens(
+                user_prompt,
+                MAX_CONTEXT_CHARS // 4,
+            )
+
+        return self._build_chat_payload(
+            [
+                {"role": "system", "content": system_prompt.strip()},
+                {"role": "user", "content": user_prompt.strip()},
+            ],
+            temperature,
+            stream=stream,
+            seed=seed,
+            format=format,
+            max_tokens=max_tokens,
+            num_ctx=num_ctx,
+        )
+
+    def _build_chat_payload(
+        self,
+        messages: list[dict],
+        temperature: float,
+        stream: bool = False,
+        seed: Optional[int] = None,
+        format: Optional[dict | str] = None,
+        max_tokens: Optional[int] = None,
+        num_ctx: Optional[int] = None,
+    ) -> dict:
         """
-        Perform a single-shot generation using Ollama.
+        Payload for a prepared message list. No budgeting or truncation:
+        callers that build their own messages size them themselves.
         """
+        options = {"temperature": temperature}
 
-        user_prompt = truncate_to_tokens(
-            user_prompt,
-            MAX_CONTEXT_CHARS // 4,
-        )
+        if num_ctx is not None:
+            options["num_ctx"] = num_ctx
+
+        if max_tokens is not None:
+            options["num_predict"] = max_tokens
+
+        seed = self.seed if seed is None else seed
+        if seed is not None:
+            options["seed"] = seed
 
         payload = {
             "model": self.model,
-            "messages": [
-                {"role": "system", "content": system_prompt.strip()},
-                {"role": "user", "content": user_prompt.strip()},
-            ],
-            "options": {
-                "temperature": temperature,
-            },
-            "stream": False,
+            "messages": messages,
+            "options": options,
+            "stream": stream,
         }
 
-        url = f"{self.base_url}/api/chat"
+        # Structured output: "json" or a JSON schema the reply must match
+        if format is not None:
+            payload["format"] = format
 
-        logger.info("Sending request to Ollama")
+        return payload
 
-        try:
-            with httpx.Client(timeout=self.timeout) as client:
-                response = client.post(url, json=payload)
-                response.raise_for_status()
+    def _cache_lookup(
+        self, payload: dict, use_cache: Optional[bool]
+    ) -> tuple[Optional[str], Optional[str]]:
+        """
+        Returns (cache key, cached content). Key is None when caching is off.
+        """
+        if self.cache is None:
+            return None, None
 
-        except httpx.RequestError as e:
-            logger.error(f"Ollama connection error: {e}")
-            raise RuntimeError("Failed to connect to Ollama") from e
+        key = request_key(payload)
+        bypass = self.cache_bypass if use_cache is None else not use_cache
+        if bypass:
+            return key, None
 
-        except httpx.HTTPStatusError as e:
+        content = self.cache.get(key)
+        if content is not None:
+            logger.info("LLM cache hit")
+        return key, content
+
+    def _cache_store(self, key: Optional[str], content: str):
+        if key is not None and content:
+            self.cache.put(key, content)
+
+    @staticmethod
+    def _raise_for_error(e: httpx.HTTPError):
+        if isinstance(e, httpx.HTTPStatusError):
             logger.error(f"Ollama HTTP error: {e.response.text}")
             raise RuntimeError("Ollama returned an error") from e
 
-        data = response.json()
+        logger.error(f"Ollama connection error: {e}")
+        raise RuntimeError("Failed to connect to Ollama") from e
 
+    @staticmethod
+    def _parse_content(data: dict) -> str:
         try:
-            content = data["message"]["content"].strip()
+            return data["message"]["content"].strip()
         except KeyError:
             logger.error(f"Unexpected Ollama response: {data}")
             raise RuntimeError("Invalid response from Ollama")
 
+    @staticmethod
+    def _parse_stream_line(line: str) -> tuple[str, bool, dict]:
+        """
+        Parse one NDJSON chunk of a streamed /api/chat response.
+        Returns (content delta, done flag, chunk); the final chunk carries
+        the timing fields.
+        """
+        if not line.strip():
+            return "", False, {}
+
+        try:
+            chunk = json.loads(line)
+        except json.JSONDecodeError:
+            logger.error(f"Malformed Ollama stream chunk: {line[:200]}")
+            raise RuntimeError("Invalid response from Ollama")
+
+        if "error" in chunk:
+            logger.error(f"Ollama stream error: {chunk['error']}")
+            raise RuntimeError("Ollama returned an error")
+
+        delta = chunk.get("message", {}).get("content", "")
+        return delta, bool(chunk.get("done")), chunk
+
+    def _record(
+        self,
+        data: dict,
+        stage: str,
+        backend: str,
+        started: float,
+        streamed: bool = False,
+    ):
+        if self.telemetry is None:
+            return
+        self.telemetry.record(
+            LLMResult.from_response(
+                data,
+                stage,
+                self.model,
+                backend,
+                time.perf_counter() - started,
+                streamed=streamed,
+            )
+        )
+
+    def _record_cache_hit(self, stage: str):
+        if self.telemetry is not None:
+            self.telemetry.record(
+                LLMResult(stage, self.model, "cache", 0.0, cached=True)
+            )
+
+    def _model_available(self, tags: dict) -> bool:
+        return model_available(tags, self.model)
+
+    @contextmanager
+    def _lease(self) -> Iterator[str]:
+        """
+        Base URL for one request: the fixed one, or the least-loaded
+        healthy backend of the pool (released with the request's outcome).
+        Refused with CircuitOpenError while the host's circuit is open.
+        """
+        if self.pool is None:
+            with self._guard(self.base_url):
+                yield self.base_url
+            return
+
+        with self.pool.lease(allow=self.resilience.available) as backend:
+            with self._guard(backend.url):
+                yield backend.url
+
+    @contextmanager
+    def _guard(self, url: str) -> Iterator[None]:
+        """
+        Every admitted request reports back to the breaker, including one
+        that never finishes (a stream closed early raises GeneratorExit, a
+        cancelled task CancelledError): that releases a half-open trial.
+        """
+        self.resilience.check(url)
+        try:
+            yield
+        except Exception as e:
+            self.resilience.record(url, backend_failure=is_backend_failure(e))
+            raise
+        except BaseException:
+            self.resilience.release(url)
+            raise
+        self.resilience.record(url, backend_failure=False)
+
+    def _close_shared(self):
+        if self._owns_pool:
+            self.pool.close()
+        if self._owns_resilience:
+            self.resilience.close()
+
+
+class OllamaClient(_OllamaBase):
+    """
+    Ollama chat client backed by one long-lived, pooled HTTP connection.
+
+    Use as a context manager or call close() when done.
+    """
+
+    def __init__(
+        self,
+        base_url: str = OLLAMA_BASE_URL,
+        model: str = OLLAMA_MODEL,
+        timeout: int = OLLAMA_TIMEOUT,
+        max_connections: int = OLLAMA_MAX_CONNECTIONS,
+        max_keepalive: int = OLLAMA_MAX_KEEPALIVE,
+        transport: Optional[httpx.BaseTransport] = None,
+        cache: Optional[ResponseCache] = None,
+        seed: Optional[int] = OLLAMA_SEED,
+        cache_bypass: bool = False,
+        budgeter: Optional[ContextBudgeter] = None,
+        base_urls: Optional[list[str]] = None,
+        pool: Optional[BackendPool] = None,
+        resilience: Optional[Resilience] = None,
+        telemetry: Optional[Telemetry] = TELEMETRY,
+    ):
+        super().__init__(
+            base_url,
+            model,
+            timeout,
+            cache,
+            seed,
+            cache_bypass,
+            budgeter,
+            base_urls,
+            pool,
+            resilience,
+            telemetry,
+        )
+
+        self._client = httpx.Client(
+            timeout=build_timeout(timeout),
+            limits=build_limits(max_connections, max_keepalive),
+            transport=transport,
+        )
+
+    # -------- Lifecycle --------
+
+    def close(self):
+        self._client.close()
+        self._close_shared()
+
+    @property
+    def closed(self) -> bool:
+        return self._client.is_closed
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    # -------- API --------
+
+    def generate(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float = 0.7,
+        seed: Optional[int] = None,
+        use_cache: Optional[bool] = None,
+        format: Optional[dict | str] = None,
+        max_tokens: Optional[int] = None,
+        stage: str = DEFAULT_STAGE,
+    ) -> str:
+        """
+        Perform a single-shot generation using Ollama.
+        `stage` labels the call for metrics and selects hedging.
+        """
+        payload = self._build_payload(
+            system_prompt,
+            user_prompt,
+            temperature,
+            seed=seed,
+            format=format,
+            max_tokens=max_tokens,
+        )
+
+        return self._send(payload, use_cache, stage)
+
+    def chat(
+        self,
+        messages: list[dict],
+        temperature: float = 0.7,
+        seed: Optional[int] = None,
+        use_cache: Optional[bool] = None,
+        max_tokens: Optional[int] = None,
+        num_ctx: Optional[int] = None,
+        stage: str = DEFAULT_STAGE,
+    ) -> str:
+        """
+        Generation over a caller-built message list (e.g. a ProfileSession
+        that keeps a stable prefix across calls). Sent as-is.
+        """
+        payload = self._build_chat_payload(
+            messages,
+            temperature,
+            seed=seed,
+            max_tokens=max_tokens,
+            num_ctx=num_ctx,
+        )
+        return self._send(payload, use_cache, stage)
+
+    def _send(self, payload: dict, use_cache: Optional[bool], stage: str) -> str:
+        key, cached = self._cache_lookup(payload, use_cache)
+        if cached is not None:
+            self._record_cache_hit(stage)
+            return cached
+
+        try:
+            data = self.resilience.call(lambda: self._post(payload, stage), stage)
+        except httpx.HTTPError as e:
+            self._raise_for_error(e)
+
+        content = self._parse_content(data)
+        self._cache_store(key, content)
         return content
 
+    def _post(self, payload: dict, stage: str) -> dict:
+        """
+        One attempt, no retries.
+        """
+        logger.info("Sending request to Ollama")
+
+        started = time.perf_counter()
+        with self._lease() as base_url:
+            response = self._client.post(f"{base_url}/api/chat", json=payload)
+            response.raise_for_status()
+
+        data = response.json()
+        self._record(data, stage, base_url, started)
+        return data
+
+    def embed(
+        self,
+        texts: list[str],
+        model: Optional[str] = None,
+        stage: str = "embed",
+    ) -> list[list[float]]:
+        """
+        One embedding per text from /api/embed (batched in one request).
+        `model` defaults to the chat model; embedding models such as
+        nomic-embed-text are much faster and usually better.
+        """
+        payload = {"model": model or self.model, "input": texts}
+
+        def attempt() -> dict:
+            with self._lease() as base_url:
+                response = self._client.post(f"{base_url}/api/embed", json=payload)
+                response.raise_for_status()
+            return response.json()
+
+        try:
+            data = self.resilience.call(attempt, stage)
+        except httpx.HTTPError as e:
+            self._raise_for_error(e)
+
+        embeddings = data.get("embeddings")
+        if not isinstance(embeddings, list) or len(embeddings) != len(texts):
+            logger.error(f"Unexpected Ollama embed response: {str(data)[:200]}")
+            raise RuntimeError("Invalid embedding response from Ollama")
+        return embeddings
+
+    def stream(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float = 0.7,
+        seed: Optional[int] = None,
+        use_cache: Optional[bool] = None,
+        max_tokens: Optional[int] = None,
+        stage: str = DEFAULT_STAGE,
+    ) -> Iterator[str]:
+        """
+        Streamed generation: yields content deltas as Ollama decodes them.
+        A cache hit is yielded as a single delta. Retryable failures are
+        retried only until the first delta has been yielded.
+        """
+        payload = self._build_payload(
+            system_prompt,
+            user_prompt,
+            temperature,
+            stream=True,
+            seed=seed,
+            max_tokens=max_tokens,
+        )
+
+        key, cached = self._cache_lookup(payload, use_cache)
+        if cached is not None:
+            self._record_cache_hit(stage)
+            yield cached
+            return
+
+        parts = []
+        attempt = 0
+
+        while True:
+            logger.info("Streaming request to Ollama")
+            started = time.perf_counter()
+            try:
+                with self._lease() as base_url, self._client.stream(
+                    "POST", f"{base_url}/api/chat", json=payload
+                ) as response:
+                    if response.is_error:
+                        response.read()
+                    response.raise_for_status()
+
+                    for line in response.iter_lines():
+                        delta, done, chunk = self._parse_stream_line(line)
+                        if delta:
+                            parts.append(delta)
+                            yield delta
+                        if done:
+                            self._record(
+                                chunk, stage, base_url, started, streamed=True
+                            )
+                            break
+                break
+            except (httpx.HTTPError, RuntimeError) as e:
+                if parts or not self.resilience.should_retry(e, attempt, stage):
+                    if isinstance(e, httpx.HTTPError):
+                        self._raise_for_error(e)
+                    raise
+            self.resilience.backoff(attempt)
+            attempt += 1
+
+        self._cache_store(key, "".join(parts).strip())
+
     def health_check(self) -> bool:
         """
         Verify Ollama is reachable and model exists.
+        With a backend pool: probe every host, true if any is usable.
         """
-        try:
-            with httpx.Client(timeout=10) as client:
-                r = client.get(f"{self.base_url}/api/tags")
-                r.raise_for_status()
+        if self.pool is not None:
+            return self.pool.probe_all()
 
-            models = [m["name"] for m in r.json().get("models", [])]
-            return self.model in models
+        try:
+            r = self._client.get(
+                f"{self.base_url}/api/tags",
+                timeout=HEALTH_CHECK_TIMEOUT,
+            )
+            r.raise_for_status()
+            return self._model_available(r.json())
 
         except Exception:
             return False
 
+
+class AsyncOllamaClient(_OllamaBase):
+    """
+    Async counterpart of OllamaClient for concurrent fan-out.
+
+    At most `max_concurrency` requests are in flight at once per host; set
+    it to the server's OLLAMA_NUM_PARALLEL so we never queue more than
+    Ollama serves. With a backend pool each host has its own slots, taken
+    after the pool picked the host, so one busy host cannot use up the
+    slots of the others.
+    The underlying httpx.AsyncClient is bound to the running event loop, so
+    create (and close) one per asyncio.run().
+    """
+
+    def __init__(
+        self,
+        base_url: str = OLLAMA_BASE_URL,
+        model: str = OLLAMA_MODEL,
+        timeout: int = OLLAMA_TIMEOUT,
+        max_concurrency: int = OLLAMA_NUM_PARALLEL,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        cache: Optional[ResponseCache] = None,
+        seed: Optional[int] = OLLAMA_SEED,
+        cache_bypass: bool = False,
+        budgeter: Optional[ContextBudgeter] = None,
+        base_urls: Optional[list[str]] = None,
+        pool: Optional[BackendPool] = None,
+        resilience: Optional[Resilience] = None,
+        telemetry: Optional[Telemetry] = TELEMETRY,
+    ):
+        super().__init__(
+            base_url,
+            model,
+            timeout,
+            cache,
+            seed,
+            cache_bypass,
+            budgeter,
+            base_urls,
+            pool,
+            resilience,
+            telemetry,
+        )
+
+        hosts = len(self.pool) if self.pool is not None else 1
+        self.max_concurrency = max(1, max_concurrency)
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+        total = self.max_concurrency * hosts
+        self._client = httpx.AsyncClient(
+            timeout=build_timeout(timeout),
+            limits=build_limits(
+                max(OLLAMA_MAX_CONNECTIONS, total),
+                max(OLLAMA_MAX_KEEPALIVE, total),
+            ),
+            transport=transport,
+        )
+
+    # -------- Lifecycle --------
+
+    async def aclose(self):
+        await self._client.aclose()
+        self._close_shared()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+    # -------- API --------
+
+    def _slots(self, base_url: str) -> asyncio.Semaphore:
+        """
+        Concurrency slots of one host.
+        """
+        semaphore = self._semaphores.get(base_url)
+        if semaphore is None:
+            semaphore = self._semaphores[base_url] = asyncio.Semaphore(
+                self.max_concurrency
+            )
+        return semaphore
+
+    async def _abuild_payload(self, *args, **kwargs) -> dict:
+        # Token counting may call the server; keep it off the event loop
+        if self.budgeter is None:
+            return self._build_payload(*args, **kwargs)
+        return await asyncio.to_thread(self._build_payload, *args, **kwargs)
+
+    async def agenerate(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float = 0.7,
+        seed: Optional[int] = None,
+        use_cache: Optional[bool] = None,
+        format: Optional[dict | str] = None,
+        max_tokens: Optional[int] = None,
+        stage: str = DEFAULT_STAGE,
+    ) -> str:
+        """
+        Async single-shot generation, bounded by the concurrency semaphore.
+        """
+        payload = await self._abuild_payload(
+            system_prompt,
+            user_prompt,
+            temperature,
+            seed=seed,
+            format=format,
+            max_tokens=max_tokens,
+        )
+
+        key, cached = self._cache_lookup(payload, use_cache)
+        if cached is not None:
+            self._record_cache_hit(stage)
+            return cached
+
+        try:
+            data = await self.resilience.acall(
+                lambda: self._apost(payload, stage), stage
+            )
+        except httpx.HTTPError as e:
+            self._raise_for_error(e)
+
+        content = self._parse_content(data)
+        self._cache_store(key, content)
+        return content
+
+    async def _apost(self, payload: dict, stage: str) -> dict:
+        # Host picked first, then one of its slots; held per attempt only,
+        # not across retry backoff
+        with self._lease() as base_url:
+            async with self._slots(base_url):
+                logger.info("Sending async request to Ollama")
+
+                started = time.perf_counter()
+                response = await self._client.post(
+                    f"{base_url}/api/chat", json=payload
+                )
+                response.raise_for_status()
+
+        data = response.json()
+        self._record(data, stage, base_url, started)
+        return data
+
+    async def astream(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float = 0.7,
+        seed: Optional[int] = None,
+        use_cache: Optional[bool] = None,
+        max_tokens: Optional[int] = None,
+        stage: str = DEFAULT_STAGE,
+    ) -> AsyncIterator[str]:
+        """
+        Async streamed generation. Holds a concurrency slot until the
+        stream finishes. A cache hit is yielded as a single delta.
+        Retried like stream(): only before the first delta.
+        """
+        payload = await self._abuild_payload(
+            system_prompt,
+            user_prompt,
+            temperature,
+            stream=True,
+            seed=seed,
+            max_tokens=max_tokens,
+        )
+
+        key, cached = self._cache_lookup(payload, use_cache)
+        if cached is not None:
+            self._record_cache_hit(stage)
+            yield cached
+            return
+
+        parts = []
+        attempt = 0
+
+        while True:
+            try:
+                with self._lease() as base_url:
+                    async with self._slots(base_url):
+                        logger.info("Streaming async request to Ollama")
+
+                        started = time.perf_counter()
+                        async with self._client.stream(
+                            "POST", f"{base_url}/api/chat", json=payload
+                        ) as response:
+                            if response.is_error:
+                                await response.aread()
+                            response.raise_for_status()
+
+                            async for line in response.aiter_lines():
+                                delta, done, chunk = self._parse_stream_line(line)
+                                if delta:
+                                    parts.append(delta)
+                                    yield delta
+                                if done:
+                                    self._record(
+                                        chunk,
+                                        stage,
+                                        base_url,
+                                        started,
+                                        streamed=True,
+                                    )
+                                    break
+                break
+            except (httpx.HTTPError, RuntimeError) as e:
+                if parts or not self.resilience.should_retry(e, attempt, stage):
+                    if isinstance(e, httpx.HTTPError):
+                        self._raise_for_error(e)
+                    raise
+            await asyncio.sleep(self.resilience.policy.delay(attempt))
+            attempt += 1
+
+        self._cache_store(key, "".join(parts).strip())
+
+    async def ahealth_check(self) -> bool:
+        if self.pool is not None:
+            return await asyncio.to_thread(self.pool.probe_all)
+
+        try:
+            r = await self._client.get(
+                f"{self.base_url}/api/tags",
+                timeout=HEALTH_CHECK_TIMEOUT,
+            )
+            r.raise_for_status()
+            return self._model_available(r.json())
+
+        except Exception:
+            return False
@@ -33,10 +33,7 @@ Clear CTA. No filler.
 # Task Prompts
 # ----------------------------
 
-PERSONA_ANALYSIS_PROMPT = """
-PROFILE TEXT:
-{profile_text}
-
+PERSONA_ANALYSIS_QUESTION = """
 Analyze the person above and return:
 
 1. Name (if available)
@@ -51,6 +48,38 @@ Analyze the person above and return:
 Respond in clean bullet points.
 """
 
+PERSONA_ANALYSIS_PROMPT = """
+PROFILE TEXT:
+{profile_text}
+""" + PERSONA_ANALYSIS_QUESTION
+
+# Profile session: the profile goes into the system message once and every
+# question follows it, so the encoded prefix is identical across calls
+SESSION_PROFILE_PREFIX = """
+PROFILE TEXT:
+{profile_text}
+
+Answer each question below about the person in this profile.
+"""
+
+PERSONA_JSON_PROMPT = """
+PROFILE TEXT:
+{profile_text}
+
+Analyze the person above in one pass. Use only what the profile states;
+leave a field as an empty string (or empty list) when it is not available.
+
+- summary: concise factual summary, max 6 bullet points (name, current role
+  and company, industry, seniority, core interests). No speculation.
+- name, role, company, industry: as stated in the profile
+- seniority: junior / mid / senior / lead / executive
+- interests: short interests or focus areas
+- style: their communication style (tone, emoji usage, slang or
+  abbreviations, sentence length, overall vibe)
+
+Respond with a JSON object only.
+"""
+
 EMAIL_PROMPT = """
 PERSONA:
 {persona}
@@ -93,3 +122,23 @@ Write an Instagram DM:
 - Short CTA
 """
 
+
+BUNDLE_PROMPT = """
+PERSONA:
+{persona}
+
+Write cold outreach for every channel below, all built around one shared CTA.
+
+{cta_instruction}
+- email: short subject line, 5–7 sentences max, personalized, ends with the CTA
+- whatsapp: WhatsApp/SMS message, very concise, friendly but respectful, one clear CTA
+- linkedin_dm: LinkedIn DM, professional but human, not salesy, ends with a soft CTA
+- instagram_dm: Instagram DM, casual, matches their likely tone, no forced slang, short CTA
+
+Respond with a JSON object containing exactly these keys.
+"""
+
+BUNDLE_CTA_GENERATE = (
+    "- cta: ONE short, low-pressure call-to-action that fits their seniority and tone"
+)
+BUNDLE_CTA_GIVEN = "Use this CTA in every message: {cta}"
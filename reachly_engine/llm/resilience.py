@@ -0,0 +1,393 @@
+import asyncio
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Optional, TypeVar
+
+import httpx
+
+from reachly_engine.config import (
+    OLLAMA_RETRIES,
+    OLLAMA_RETRY_BASE_DELAY,
+    OLLAMA_RETRY_MAX_DELAY,
+    OLLAMA_BREAKER_THRESHOLD,
+    OLLAMA_BREAKER_RESET,
+    LLM_HEDGING,
+    LLM_HEDGE_STAGES,
+    LLM_HEDGE_MIN_SAMPLES,
+)
+from reachly_engine.llm.metrics import METRICS, Metrics
+from reachly_engine.logger import get_logger
+
+logger = get_logger("resilience")
+
+T = TypeVar("T")
+
+RETRYABLE_STATUS = {429, 502, 503, 504}
+
+# Latency samples kept per stage for the hedging threshold
+LATENCY_WINDOW = 200
+
+
+class CircuitOpenError(RuntimeError):
+    """
+    The backend's circuit is open; the request was not sent.
+    """
+
+
+def retry_reason(error: Exception) -> Optional[str]:
+    """
+    Short label if the error is worth retrying, else None.
+    """
+    if isinstance(error, CircuitOpenError):
+        return "circuit_open"
+    if isinstance(error, httpx.HTTPStatusError):
+        status = error.response.status_code
+        return str(status) if status in RETRYABLE_STATUS else None
+    if isinstance(error, httpx.TimeoutException):
+        return "timeout"
+    if isinstance(error, httpx.TransportError):
+        return "connect"
+    return None
+
+
+@dataclass
+class RetryPolicy:
+    retries: int = OLLAMA_RETRIES
+    base_delay: float = OLLAMA_RETRY_BASE_DELAY
+    max_delay: float = OLLAMA_RETRY_MAX_DELAY
+
+    def delay(self, attempt: int) -> float:
+        """
+        Full jitter: uniform in [0, min(max_delay, base * 2^attempt)].
+        """
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+
+
+class CircuitBreaker:
+    """
+    Closed → open after `threshold` consecutive backend failures; after
+    `reset_timeout` one trial request is let through (half-open) and its
+    outcome closes or re-opens the circuit.
+    """
+
+    def __init__(
+        self,
+        threshold: int = OLLAMA_BREAKER_THRESHOLD,
+        reset_timeout: float = OLLAMA_BREAKER_RESET,
+    ):
+        self.threshold = max(1, threshold)
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._trial = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    def allow(self) -> bool:
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half_open" and not self._trial:
+            self._trial = True
+            return True
+        return False
+
+    def record_success(self):
+        self.failures = 0
+        self.opened_at = None
+        self._trial = False
+
+    def record_failure(self) -> bool:
+        """
+        Returns True if this failure opened (or re-opened) the circuit.
+        """
+        self.failures += 1
+        was_open = self.opened_at is not None
+        if was_open or self.failures >= self.threshold:
+            # (Re)open; a failed half-open trial restarts the timeout
+            self.opened_at = time.monotonic()
+            self._trial = False
+            return True
+        return False
+
+    def release(self):
+        """
+        An admitted request ended without an outcome (abandoned stream,
+        cancellation): free the half-open trial for the next request.
+        """
+        self._trial = False
+
+
+class StageLatency:
+    """
+    Rolling per-stage latencies; p95 once enough samples exist.
+    """
+
+    def __init__(self, min_samples: int = LLM_HEDGE_MIN_SAMPLES):
+        self.min_samples = min_samples
+        self._samples: dict[str, deque] = {}
+        self._lock = threading.Lock()
+
+    def record(self, stage: str, seconds: float):
+        with self._lock:
+            self._samples.setdefault(stage, deque(maxlen=LATENCY_WINDOW)).append(
+                seconds
+            )
+
+    def p95(self, stage: str) -> Optional[float]:
+        with self._lock:
+            samples = sorted(self._samples.get(stage, ()))
+        if len(samples) < self.min_samples:
+            return None
+        return samples[min(int(len(samples) * 0.95), len(samples) - 1)]
+
+
+class Resilience:
+    """
+    Retry / circuit-breaker / hedging policy shared by the sync and async
+    Ollama clients. Every decision is counted in `metrics`:
+
+    - llm_retries_total{stage,reason}, llm_retries_exhausted_total{stage}
+    - llm_circuit_opened_total{backend}, llm_circuit_rejected_total{backend}
+    - llm_hedges_total{stage,decision}: sent / not_needed / no_baseline,
+      llm_hedge_wins_total{stage}
+    """
+
+    def __init__(
+        self,
+        policy: Optional[RetryPolicy] = None,
+        breaker_threshold: int = OLLAMA_BREAKER_THRESHOLD,
+        breaker_reset: float = OLLAMA_BREAKER_RESET,
+        hedging: bool = LLM_HEDGING,
+        hedge_stages: Optional[list[str]] = None,
+        hedge_min_samples: int = LLM_HEDGE_MIN_SAMPLES,
+        metrics: Metrics = METRICS,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.policy = policy or RetryPolicy()
+        self.breaker_threshold = breaker_threshold
+        self.breaker_reset = breaker_reset
+        self.hedging = hedging
+        self.hedge_stages = set(
+            LLM_HEDGE_STAGES if hedge_stages is None else hedge_stages
+        )
+        self.latency = StageLatency(hedge_min_samples)
+        self.metrics = metrics
+        self._sleep = sleep
+
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+
+    # ---------- Circuit breaker ----------
+
+    def _breaker(self, url: str) -> CircuitBreaker:
+        breaker = self._breakers.get(url)
+        if breaker is None:
+            breaker = self._breakers.setdefault(
+                url, CircuitBreaker(self.breaker_threshold, self.breaker_reset)
+            )
+        return breaker
+
+    def available(self, url: str) -> bool:
+        """
+        Not fully open (no side effects; used to steer backend choice).
+        """
+        with self._lock:
+            return self._breaker(url).state != "open"
+
+    def check(self, url: str):
+        """
+        Raise CircuitOpenError unless a request to `url` may be sent.
+        """
+        with self._lock:
+            allowed = self._breaker(url).allow()
+        if not allowed:
+            self.metrics.incr("llm_circuit_rejected_total", backend=url)
+            raise CircuitOpenError(f"Circuit open for {url}")
+
+    def record(self, url: str, backend_failure: bool):
+        with self._lock:
+            breaker = self._breaker(url)
+            if not backend_failure:
+                breaker.record_success()
+                return
+            opened = breaker.record_failure()
+
+        if opened:
+            logger.error(f"Circuit opened for Ollama backend {url}")
+            self.metrics.incr("llm_circuit_opened_total", backend=url)
+
+    def release(self, url: str):
+        """
+        Counterpart of check() for a request that ended without an outcome.
+        """
+        with self._lock:
+            self._breaker(url).release()
+
+    # ---------- Retries ----------
+
+    def should_retry(self, error: Exception, attempt: int, stage: str) -> bool:
+        """
+        Counts the decision. Streams call this directly (they can only be
+        retried before the first delta).
+        """
+        reason = retry_reason(error)
+        if reason is None:
+            return False
+        if attempt >= self.policy.retries:
+            self.metrics.incr("llm_retries_exhausted_total", stage=stage)
+            return False
+        logger.info(f"Retrying {stage} call after {reason} (attempt {attempt + 1})")
+        self.metrics.incr("llm_retries_total", stage=stage, reason=reason)
+        return True
+
+    def backoff(self, attempt: int):
+        self._sleep(self.policy.delay(attempt))
+
+    def retry(self, fn: Callable[[], T], stage: str = "default") -> T:
+        attempt = 0
+        while True:
+            try:
+                return fn()
+            except Exception as e:
+                if not self.should_retry(e, attempt, stage):
+                    raise
+            self.backoff(attempt)
+            attempt += 1
+
+    async def aretry(
+        self, fn: Callable[[], Awaitable[T]], stage: str = "default"
+    ) -> T:
+        attempt = 0
+        while True:
+            try:
+                return await fn()
+            except Exception as e:
+                if not self.should_retry(e, attempt, stage):
+                    raise
+            await asyncio.sleep(self.policy.delay(attempt))
+            attempt += 1
+
+    # ---------- Hedging ----------
+
+    def _hedge_after(self, stage: str) -> Optional[float]:
+        if not self.hedging or stage not in self.hedge_stages:
+            return None
+        threshold = self.latency.p95(stage)
+        if threshold is None:
+            self.metrics.incr("llm_hedges_total", stage=stage, decision="no_baseline")
+        return threshold
+
+    def call(self, fn: Callable[[], T], stage: str = "default") -> T:
+        """
+        fn with retries; hedged for hedge stages once a p95 is known.
+        """
+        start = time.perf_counter()
+        threshold = self._hedge_after(stage)
+
+        if threshold is None:
+            result = self.retry(fn, stage)
+        else:
+            result = self._hedged(fn, stage, threshold)
+
+        self.latency.record(stage, time.perf_counter() - start)
+        return result
+
+    def _hedged(self, fn: Callable[[], T], stage: str, threshold: float) -> T:
+        """
+        A thread cannot be interrupted: the losing leg is cancelled if it
+        has not started yet, otherwise it runs to completion and keeps its
+        executor thread and its backend slot busy until then (its result is
+        dropped). That bounds hedging to two requests per call.
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=8, thread_name_prefix="llm-hedge"
+                )
+
+        primary = self._executor.submit(self.retry, fn, stage)
+        done, _ = wait([primary], timeout=threshold)
+        if done:
+            self.metrics.incr("llm_hedges_total", stage=stage, decision="not_needed")
+            return primary.result()
+
+        self.metrics.incr("llm_hedges_total", stage=stage, decision="sent")
+        hedge = self._executor.submit(self.retry, fn, stage)
+        pending = {primary, hedge}
+
+        # First successful leg wins; fail only if both fail
+        error = None
+        try:
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future.exception() is None:
+                        if future is hedge:
+                            self.metrics.incr("llm_hedge_wins_total", stage=stage)
+                        return future.result()
+                    error = future.exception()
+            raise error
+        finally:
+            for future in pending:
+                future.cancel()
+
+    async def acall(
+        self, fn: Callable[[], Awaitable[T]], stage: str = "default"
+    ) -> T:
+        start = time.perf_counter()
+        threshold = self._hedge_after(stage)
+
+        if threshold is None:
+            result = await self.aretry(fn, stage)
+        else:
+            result = await self._ahedged(fn, stage, threshold)
+
+        self.latency.record(stage, time.perf_counter() - start)
+        return result
+
+    async def _ahedged(
+        self, fn: Callable[[], Awaitable[T]], stage: str, threshold: float
+    ) -> T:
+        primary = asyncio.ensure_future(self.aretry(fn, stage))
+        done, _ = await asyncio.wait({primary}, timeout=threshold)
+        if done:
+            self.metrics.incr("llm_hedges_total", stage=stage, decision="not_needed")
+            return primary.result()
+
+        self.metrics.incr("llm_hedges_total", stage=stage, decision="sent")
+        hedge = asyncio.ensure_future(self.aretry(fn, stage))
+        pending = {primary, hedge}
+
+        error = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            self.metrics.incr("llm_hedge_wins_total", stage=stage)
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            # Cancelling closes the loser's connection; Ollama stops decoding
+            for task in pending:
+                task.cancel()
@@ -0,0 +1,84 @@
+from typing import Optional
+
+from reachly_engine.config import MAX_CONTEXT_CHARS, LLM_OUTPUT_TOKENS
+from reachly_engine.llm.ollama_client import OllamaClient
+from reachly_engine.llm.prompts import SYSTEM_ANALYSIS, SESSION_PROFILE_PREFIX
+from reachly_engine.llm.tokenizer import truncate_to_tokens
+from reachly_engine.logger import get_logger
+
+logger = get_logger("session")
+
+# Room kept for the longest follow-up question
+QUESTION_RESERVE_TOKENS = 256
+
+
+class ProfileSession:
+    """
+    Several questions about one profile over a byte-identical prompt prefix.
+
+    The system prompt and the profile form one fixed system message; each
+    question is a separate user message after it. Ollama keeps the KV cache
+    of the last prompt per slot and only evaluates the tokens past the
+    longest common prefix, so the profile is encoded once per prospect
+    instead of once per question.
+
+    num_ctx is pinned for the whole session: a different num_ctx reloads
+    the model and throws the cached prefix away.
+    """
+
+    def __init__(
+        self,
+        llm: OllamaClient,
+        profile_text: str,
+        system_prompt: str = SYSTEM_ANALYSIS,
+        output_tokens: int = LLM_OUTPUT_TOKENS,
+    ):
+        self.llm = llm
+        self.num_ctx: Optional[int] = None
+
+        header = system_prompt.strip() + "\n" + SESSION_PROFILE_PREFIX.format(
+            profile_text=""
+        )
+
+        budgeter = getattr(llm, "budgeter", None)
+        if budgeter is not None:
+            plan = budgeter.plan(
+                header,
+                profile_text,
+                output_tokens=output_tokens + QUESTION_RESERVE_TOKENS,
+            )
+            profile_text = plan.user_prompt
+            self.num_ctx = plan.num_ctx
+        else:
+            profile_text = truncate_to_tokens(profile_text, MAX_CONTEXT_CHARS // 4)
+
+        self.prefix = (
+            system_prompt.strip()
+            + "\n"
+            + SESSION_PROFILE_PREFIX.format(profile_text=profile_text.strip())
+        ).strip()
+        self.questions = 0
+
+    def messages(self, question: str) -> list[dict]:
+        return [
+            {"role": "system", "content": self.prefix},
+            {"role": "user", "content": question.strip()},
+        ]
+
+    def ask(
+        self,
+        question: str,
+        temperature: float = 0.2,
+        max_tokens: Optional[int] = None,
+        stage: str = "session",
+    ) -> str:
+        self.questions += 1
+        logger.info(f"Session question {self.questions}")
+
+        return self.llm.chat(
+            self.messages(question),
+            temperature=temperature,
+            max_tokens=max_tokens,
+            num_ctx=self.num_ctx,
+            stage=stage,
+        )
@@ -0,0 +1,203 @@
+import json
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Optional
+
+from reachly_engine.config import LLM_TELEMETRY_PATH, LLM_COLD_LOAD_SECONDS
+from reachly_engine.llm.metrics import METRICS, Metrics
+from reachly_engine.logger import get_logger
+
+logger = get_logger("telemetry")
+
+NS = 1e9
+
+# Results kept in memory for the CLI view / JSONL export
+RECENT_RESULTS = 1000
+
+
+def _rate(tokens: int, duration_ns: int) -> Optional[float]:
+    if not tokens or not duration_ns:
+        return None
+    return tokens / (duration_ns / NS)
+
+
+@dataclass
+class LLMResult:
+    """
+    Timing of one LLM call, from Ollama's final response fields
+    (durations in nanoseconds, as Ollama reports them).
+    """
+
+    stage: str
+    model: str
+    backend: str
+    wall_seconds: float
+    total_duration: int = 0
+    load_duration: int = 0
+    prompt_eval_count: int = 0
+    prompt_eval_duration: int = 0
+    eval_count: int = 0
+    eval_duration: int = 0
+    cached: bool = False
+    streamed: bool = False
+    timestamp: float = 0.0
+
+    @classmethod
+    def from_response(
+        cls,
+        data: dict,
+        stage: str,
+        model: str,
+        backend: str,
+        wall_seconds: float,
+        streamed: bool = False,
+    ) -> "LLMResult":
+        return cls(
+            stage=stage,
+            model=data.get("model") or model,
+            backend=backend,
+            wall_seconds=wall_seconds,
+            total_duration=data.get("total_duration") or 0,
+            load_duration=data.get("load_duration") or 0,
+            prompt_eval_count=data.get("prompt_eval_count") or 0,
+            prompt_eval_duration=data.get("prompt_eval_duration") or 0,
+            eval_count=data.get("eval_count") or 0,
+            eval_duration=data.get("eval_duration") or 0,
+            streamed=streamed,
+            timestamp=time.time(),
+        )
+
+    @property
+    def prompt_tokens_per_sec(self) -> Optional[float]:
+        return _rate(self.prompt_eval_count, self.prompt_eval_duration)
+
+    @property
+    def eval_tokens_per_sec(self) -> Optional[float]:
+        return _rate(self.eval_count, self.eval_duration)
+
+    @property
+    def cold_load(self) -> bool:
+        """
+        The model was (re)loaded for this call: first use, eviction, or a
+        num_ctx change.
+        """
+        return self.load_duration / NS >= LLM_COLD_LOAD_SECONDS
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        data["prompt_tokens_per_sec"] = self.prompt_tokens_per_sec
+        data["eval_tokens_per_sec"] = self.eval_tokens_per_sec
+        data["cold_load"] = self.cold_load
+        return data
+
+
+class Telemetry:
+    """
+    Collects LLMResults: per-stage histograms and token counters in
+    `metrics`, a bounded list of recent results, and (optionally) one
+    JSONL line per call at `jsonl_path`.
+    """
+
+    def __init__(
+        self,
+        metrics: Metrics = METRICS,
+        jsonl_path: Optional[Path] = LLM_TELEMETRY_PATH,
+        keep: int = RECENT_RESULTS,
+    ):
+        self.metrics = metrics
+        self.jsonl_path = jsonl_path
+        self.recent: deque = deque(maxlen=keep)
+        self._lock = threading.Lock()
+
+    def record(self, result: LLMResult):
+        stage = result.stage
+        m = self.metrics
+
+        m.incr("llm_calls_total", stage=stage, cached=result.cached)
+        m.observe("llm_wall_seconds", result.wall_seconds, stage=stage)
+
+        if not result.cached:
+            m.observe("llm_total_seconds", result.total_duration / NS, stage=stage)
+            m.observe("llm_load_seconds", result.load_duration / NS, stage=stage)
+            m.observe(
+                "llm_prompt_eval_seconds",
+                result.prompt_eval_duration / NS,
+                stage=stage,
+            )
+            m.observe("llm_eval_seconds", result.eval_duration / NS, stage=stage)
+            m.incr("llm_prompt_tokens_total", result.prompt_eval_count, stage=stage)
+            m.incr("llm_eval_tokens_total", result.eval_count, stage=stage)
+            m.incr(
+                "llm_prompt_eval_ns_total", result.prompt_eval_duration, stage=stage
+            )
+            m.incr("llm_eval_ns_total", result.eval_duration, stage=stage)
+
+        if result.cold_load:
+            logger.info(
+                f"Model cold load on {result.backend} "
+                f"({result.load_duration / NS:.1f}s, stage {stage})"
+            )
+            m.incr("llm_cold_loads_total", stage=stage, backend=result.backend)
+
+        with self._lock:
+            self.recent.append(result)
+            if self.jsonl_path is not None:
+                self._append(self.jsonl_path, [result])
+
+    @staticmethod
+    def _append(path: Path, results: list[LLMResult]):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            for result in results:
+                f.write(json.dumps(result.to_dict()) + "\n")
+
+    def dump_jsonl(self, path: Path) -> int:
+        """
+        Write the recent results to `path` (appending). Returns the count.
+        """
+        with self._lock:
+            results = list(self.recent)
+        self._append(path, results)
+        return len(results)
+
+    def summary(self) -> list[dict]:
+        """
+        One row per stage: calls, latency percentiles, where the time goes
+        (prompt eval vs decode) and token rates.
+        """
+        m = self.metrics
+        rows = []
+
+        for labels, wall in sorted(m.histograms("llm_wall_seconds").items()):
+            stage = dict(labels)["stage"]
+            prompt_tokens = m.get("llm_prompt_tokens_total", stage=stage)
+            eval_tokens = m.get("llm_eval_tokens_total", stage=stage)
+            prompt_ns = m.get("llm_prompt_eval_ns_total", stage=stage)
+            eval_ns = m.get("llm_eval_ns_total", stage=stage)
+
+            rows.append(
+                {
+                    "stage": stage,
+                    "calls": wall.count,
+                    "cached": m.get("llm_calls_total", stage=stage, cached=True),
+                    "p50_seconds": wall.quantile(0.5),
+                    "p95_seconds": wall.quantile(0.95),
+                    "prompt_eval_share": (
+                        prompt_ns / (prompt_ns + eval_ns)
+                        if prompt_ns + eval_ns
+                        else None
+                    ),
+                    "prompt_tokens_per_sec": _rate(prompt_tokens, prompt_ns),
+                    "eval_tokens_per_sec": _rate(eval_tokens, eval_ns),
+                    "cold_loads": m.total("llm_cold_loads_total", stage=stage),
+                }
+            )
+
+        return rows
+
+
+# Process-wide collector used by the Ollama clients
+TELEMETRY = Telemetry()
@@ -1,9 +1,28 @@
+import hashlib
 import math
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+import httpx
+
+from reachly_engine.logger import get_logger
+
+logger = get_logger("tokenizer")
 
 # Rough but safe heuristic for Mistral-family models
 # ~4 characters per token is conservative
 CHARS_PER_TOKEN = 4
 
+# SentencePiece / GPT-2 style whitespace markers in GGUF vocabularies
+_SPACE_MARKERS = {"llama": "▁", "gpt2": "Ġ"}
+_MAX_PIECE_CHARS = 24
+
+TRUNCATION_MARKER = "\n\n[TRUNCATED]"
+
+# /api/tokenize replies meaning the server does not have the endpoint
+UNSUPPORTED_STATUS = {404, 405, 501}
+
 
 def estimate_tokens(text: str) -> int:
     if not text:
@@ -19,5 +38,188 @@ def truncate_to_tokens(text: str, max_tokens: int) -> str:
     if len(text) <= max_chars:
         return text
 
-    return text[:max_chars].rsplit(" ", 1)[0] + "\n\n[TRUNCATED]"
+    return text[:max_chars].rsplit(" ", 1)[0] + TRUNCATION_MARKER
+
+
+class _VocabCounter:
+    """
+    Greedy longest-match over the model's own GGUF vocabulary.
+    Not byte-exact BPE, but within a few percent on prose and far closer
+    than a fixed chars/token ratio on JSON and URNs.
+    """
+
+    def __init__(self, tokens: list[str], tokenizer_model: str):
+        self.vocab = set(tokens)
+        self.space = _SPACE_MARKERS.get(tokenizer_model, "▁")
+        self.newline = "Ċ" if tokenizer_model == "gpt2" else "\n"
+        self.max_len = min(max((len(t) for t in tokens), default=1), _MAX_PIECE_CHARS)
+
+    def count(self, text: str) -> int:
+        text = text.replace(" ", self.space).replace("\n", self.newline)
+        if self.space == "▁":
+            text = self.space + text  # SentencePiece prefixes a space
+
+        i, count, n = 0, 0, len(text)
+        while i < n:
+            for size in range(min(self.max_len, n - i), 0, -1):
+                if text[i:i + size] in self.vocab:
+                    i += size
+                    break
+            else:
+                # Unknown char: byte fallback, one token per UTF-8 byte
+                count += len(text[i].encode("utf-8")) - 1
+                i += 1
+            count += 1
+        return count
+
+
+class Tokenizer:
+    """
+    Token counts for one Ollama model, memoized in an LRU.
+
+    Resolution order:
+    1. Ollama's /api/tokenize (exact, when the server provides it)
+    2. The model vocabulary from /api/show (verbose), matched locally
+    3. The chars/token heuristic
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        model: str,
+        cache_size: int = 2048,
+        transport: Optional[httpx.BaseTransport] = None,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.model = model
+        self.cache_size = cache_size
+
+        self._client = httpx.Client(timeout=30, transport=transport)
+        self._lock = threading.Lock()
+        self._cache: "OrderedDict[str, int]" = OrderedDict()
+
+        self._remote = True  # until the server says otherwise
+        self._vocab: Optional[_VocabCounter] = None
+        self._model_info: Optional[dict] = None
 
+    def close(self):
+        self._client.close()
+
+    # ---------- Model metadata ----------
+
+    def model_info(self) -> dict:
+        """
+        /api/show (verbose) for the model, fetched once. Empty on failure.
+        """
+        if self._model_info is None:
+            try:
+                r = self._client.post(
+                    f"{self.base_url}/api/show",
+                    json={"model": self.model, "verbose": True},
+                )
+                r.raise_for_status()
+                self._model_info = r.json()
+            except (httpx.HTTPError, ValueError) as e:
+                logger.error(f"Could not read model info: {e}")
+                self._model_info = {}
+        return self._model_info
+
+    def context_length(self) -> Optional[int]:
+        """
+        Trained context window of the model, if the server reports it.
+        """
+        info = self.model_info().get("model_info", {})
+        for key, value in info.items():
+            if key.endswith(".context_length"):
+                return int(value)
+        return None
+
+    # ---------- Counting ----------
+
+    def _count_remote(self, text: str) -> Optional[int]:
+        """
+        Only a server without the endpoint (or one answering in another
+        shape) turns remote counting off; timeouts, connect errors and 5xx
+        fall back for this call only.
+        """
+        if not self._remote:
+            return None
+        try:
+            r = self._client.post(
+                f"{self.base_url}/api/tokenize",
+                json={"model": self.model, "content": text},
+            )
+            if r.status_code in UNSUPPORTED_STATUS:
+                logger.info("Server has no /api/tokenize; using local vocab")
+                self._remote = False
+                return None
+            r.raise_for_status()
+            return len(r.json()["tokens"])
+        except (KeyError, ValueError):
+            logger.info("Unexpected /api/tokenize reply; using local vocab")
+            self._remote = False
+            return None
+        except httpx.HTTPError as e:
+            logger.warning(f"Token count request failed, estimating locally: {e}")
+            return None
+
+    def _count_vocab(self, text: str) -> Optional[int]:
+        if self._vocab is None:
+            info = self.model_info().get("model_info", {})
+            tokens = info.get("tokenizer.ggml.tokens")
+            if not tokens:
+                return None
+            self._vocab = _VocabCounter(
+                tokens, info.get("tokenizer.ggml.model", "llama")
+            )
+        return self._vocab.count(text)
+
+    def count(self, text: str) -> int:
+        if not text:
+            return 0
+
+        key = hashlib.sha1(text.encode("utf-8")).hexdigest()
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+
+        tokens = self._count_remote(text)
+        # Remote still on but no answer: a transient failure, so the local
+        # count below is not memoized
+        transient = tokens is None and self._remote
+        if tokens is None:
+            tokens = self._count_vocab(text)
+        if tokens is None:
+            tokens = estimate_tokens(text)
+        if transient:
+            return tokens
+
+        with self._lock:
+            self._cache[key] = tokens
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+        return tokens
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """
+        Cut text to at most max_tokens (by this tokenizer's count).
+        """
+        if not text or max_tokens <= 0:
+            return ""
+
+        tokens = self.count(text)
+        if tokens <= max_tokens:
+            return text
+
+        # Shrink proportionally, then step down until it fits
+        budget = max(max_tokens - self.count(TRUNCATION_MARKER), 1)
+        chars = int(len(text) * budget / tokens)
+        while chars > 0:
+            candidate = text[:chars].rsplit(" ", 1)[0]
+            if self.count(candidate) <= budget:
+                return candidate + TRUNCATION_MARKER
+            chars = int(chars * 0.9)
+
+        return ""
@@ -65,27 +65,38 @@ def run() -> None:
 
     menu = CLIMenu()
 
-    while True:
-        choice = menu.show_main()
+    try:
+        while True:
+            choice = menu.show_main()
 
-        try:
-            if choice == "1":
-                menu.add_linkedin_profile()
+            try:
+                if choice == "1":
+                    menu.add_linkedin_profile()
 
-            elif choice == "2":
-                menu.generate_outreach()
+                elif choice == "2":
+                    menu.generate_outreach()
 
-            elif choice == "3":
-                menu.view_personas()
+                elif choice == "3":
+                    menu.view_personas()
 
-            elif choice == "4":
-                sys.exit(0)
+                elif choice == "4":
+                    menu.view_llm_stats()
 
-            else:
-                console.print("[red]Invalid choice[/red]")
+                elif choice == "5":
+                    menu.bulk_add_linkedin_profiles()
 
-        except KeyboardInterrupt:
-            console.print(
-                "\n[yellow]Interrupted. Returning to menu.[/yellow]"
-            )
+                elif choice == "6":
+                    menu.search()
 
+                elif choice == "7":
+                    sys.exit(0)
+
+                else:
+                    console.print("[red]Invalid choice[/red]")
+
+            except KeyboardInterrupt:
+                console.print(
+                    "\n[yellow]Interrupted. Returning to menu.[/yellow]"
+                )
+    finally:
+        menu.close()
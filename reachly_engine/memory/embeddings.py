@@ -0,0 +1,423 @@
+"""
+Persona embeddings and the vector index behind similar-prospect search.
+
+Embedders turn persona text into unit float32 vectors: OllamaEmbedder
+calls the server's /api/embed, HashingEmbedder works offline (hashed
+words, word pairs and job/industry concepts). EmbeddingIndex keeps the
+vectors of one embedder in a memory-mapped matrix, so a top-k cosine
+query is a single matrix-vector product, and large indexes only scan
+the nearest k-means partitions (IVF).
+"""
+import hashlib
+import json
+import math
+import re
+import threading
+from collections import Counter
+from pathlib import Path
+from typing import Iterable, Optional, Sequence
+
+import numpy as np
+
+from reachly_engine.config import (
+    EMBEDDING_DIM,
+    EMBEDDING_IVF_MIN_ROWS,
+    EMBEDDING_IVF_PROBES,
+    OLLAMA_EMBED_MODEL,
+)
+from reachly_engine.logger import get_logger
+
+logger = get_logger("embeddings")
+
+# Prospect columns that describe the persona, most telling first
+PERSONA_FIELDS = ("role", "seniority", "industry", "company", "interests", "summary")
+
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has have he her his i in is it its "
+    "of on or our she that the their they this to was we were with who "
+    "you your".split()
+)
+
+# Related job and industry terms share a concept feature, so "Head of Data,
+# fintech" lands near "VP Analytics, payments" without a model
+CONCEPTS = {
+    "leadership": "head vp director chief cto ceo cfo coo cio founder cofounder "
+                  "president lead principal manager owner partner",
+    "data": "data analytics analyst bi insights ml machine learning science "
+            "scientist ai statistics",
+    "engineering": "engineer engineering developer software backend frontend "
+                   "fullstack devops platform sre infrastructure architect",
+    "product": "product pm ux design designer roadmap",
+    "sales": "sales revenue gtm account business development bdr sdr",
+    "marketing": "marketing growth brand demand content seo campaign",
+    "people": "recruiter recruiting talent hr people hiring",
+    "finance": "fintech payments banking bank lending ledger finance financial "
+               "insurance insurtech crypto trading accounting",
+    "health": "health healthcare medical clinical pharma biotech hospital",
+    "commerce": "retail ecommerce commerce marketplace logistics supply",
+}
+
+_WORD = re.compile(r"[a-z0-9]+")
+
+
+def _stem(word: str) -> str:
+    if len(word) > 4 and word.endswith("s") and not word.endswith("ss"):
+        return word[:-1]
+    return word
+
+
+_CONCEPT_OF = {
+    _stem(word): f"#{concept}"
+    for concept, words in CONCEPTS.items()
+    for word in words.split()
+}
+
+
+def persona_text(prospect: dict) -> str:
+    """
+    The text a prospect is embedded by (role, seniority, industry, ...).
+    """
+    return ". ".join(
+        str(prospect[field]).strip()
+        for field in PERSONA_FIELDS
+        if prospect.get(field) and str(prospect[field]).strip()
+    )
+
+
+def normalize(vectors: np.ndarray) -> np.ndarray:
+    """
+    Rows scaled to unit length (zero rows stay zero), as float32.
+    """
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+class HashingEmbedder:
+    """
+    Offline embedder: signed feature hashing of words, adjacent word pairs
+    and concept tags, with sublinear (1 + log tf) weights. Captures
+    lexical and coarse topical overlap; no model, no state.
+    """
+
+    def __init__(self, dim: int = EMBEDDING_DIM):
+        self.dim = dim
+        self.name = f"hashing-{dim}"
+
+    @staticmethod
+    def features(text: str) -> Counter:
+        words = [
+            _stem(w) for w in _WORD.findall(text.lower()) if w not in STOPWORDS
+        ]
+        counts = Counter(words)
+        counts.update(_CONCEPT_OF[w] for w in words if w in _CONCEPT_OF)
+        counts.update(f"{a} {b}" for a, b in zip(words, words[1:]))
+        return counts
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for i, text in enumerate(texts):
+            for feature, count in self.features(text).items():
+                h = int.from_bytes(
+                    hashlib.blake2b(feature.encode(), digest_size=8).digest(), "little"
+                )
+                sign = 1.0 if h >> 63 else -1.0
+                vectors[i, h % self.dim] += sign * (1.0 + math.log(count))
+        return normalize(vectors)
+
+
+class OllamaEmbedder:
+    """
+    Embeddings from an Ollama embedding model (one batched request per call).
+    The dimension is learned from the first response.
+    """
+
+    def __init__(self, llm, model: str = OLLAMA_EMBED_MODEL):
+        self.llm = llm
+        self.model = model
+        self.name = f"ollama:{model}"
+        self._dim: Optional[int] = None
+
+    @property
+    def dim(self) -> int:
+        if self._dim is None:
+            self.embed(["dimension probe"])
+        return self._dim
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        if not texts:
+            return np.zeros((0, self.dim), dtype=np.float32)
+        vectors = normalize(self.llm.embed(list(texts), model=self.model))
+        self._dim = vectors.shape[1]
+        return vectors
+
+
+def get_embedder(llm=None):
+    """
+    OllamaEmbedder when OLLAMA_EMBED_MODEL is set and a client is given,
+    else the offline HashingEmbedder.
+    """
+    if OLLAMA_EMBED_MODEL and llm is not None:
+        return OllamaEmbedder(llm)
+    return HashingEmbedder()
+
+
+class _IVF:
+    """
+    Inverted file: k-means (spherical) partitions of the rows; a query
+    scans only the rows of its nearest partitions.
+    """
+
+    def __init__(self, matrix: np.ndarray, lists: int, iterations: int = 6, seed: int = 0):
+        rng = np.random.default_rng(seed)
+        n = len(matrix)
+        sample = matrix[np.sort(rng.choice(n, size=min(n, lists * 32), replace=False))]
+        centroids = sample[rng.choice(len(sample), size=lists, replace=False)].copy()
+
+        for _ in range(iterations):
+            assign = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assign, sample)
+            empty = ~sums.any(axis=1)
+            sums[empty] = centroids[empty]
+            centroids = normalize(sums)
+
+        self.centroids = centroids
+        self.trained_on = n
+
+        assign = np.concatenate([
+            np.argmax(matrix[start:start + 65536] @ centroids.T, axis=1)
+            for start in range(0, n, 65536)
+        ])
+        order = np.argsort(assign, kind="stable")
+        bounds = np.searchsorted(assign[order], np.arange(lists + 1))
+        self.lists = [order[a:b].tolist() for a, b in zip(bounds, bounds[1:])]
+        self.list_of_row = assign.tolist()
+
+    def nearest(self, vector: np.ndarray) -> int:
+        return int(np.argmax(self.centroids @ vector))
+
+    def add(self, row: int, vector: np.ndarray):
+        c = self.nearest(vector)
+        self.lists[c].append(row)
+        self.list_of_row.append(c)
+
+    def move(self, row: int, vector: np.ndarray):
+        self.lists[self.list_of_row[row]].remove(row)
+        c = self.nearest(vector)
+        self.lists[c].append(row)
+        self.list_of_row[row] = c
+
+    def candidates(self, vector: np.ndarray, probes: int) -> np.ndarray:
+        scores = self.centroids @ vector
+        if probes < len(scores):
+            probed = np.argpartition(-scores, probes - 1)[:probes]
+        else:
+            probed = range(len(scores))
+        rows = np.fromiter(
+            (row for c in probed for row in self.lists[c]), dtype=np.int64
+        )
+        rows.sort()  # sequential reads from the memory map
+        return rows
+
+
+class EmbeddingIndex:
+    """
+    Unit vectors of one embedder, memory-mapped from
+    `directory`/<model>/vectors.f32 (row i belongs to the prospect id at
+    position i of ids.i64). New vectors are appended to the files, a
+    re-embedded prospect overwrites its row in place.
+
+    search() scores every row with one matrix-vector product. From
+    `ivf_min_rows` rows on it trains k-means partitions (about sqrt(n)) in
+    memory on first use, retrained when the index doubles, and scores
+    only the rows of the `ivf_probes` nearest partitions.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        model: str,
+        dim: int,
+        ivf_min_rows: int = EMBEDDING_IVF_MIN_ROWS,
+        ivf_probes: int = EMBEDDING_IVF_PROBES,
+    ):
+        self.directory = Path(directory) / re.sub(r"[^a-z0-9]+", "-", model.lower())
+        self.model = model
+        self.dim = dim
+        self.ivf_min_rows = ivf_min_rows
+        self.ivf_probes = ivf_probes
+
+        self._vectors_path = self.directory / "vectors.f32"
+        self._ids_path = self.directory / "ids.i64"
+        self._meta_path = self.directory / "meta.json"
+
+        self._lock = threading.RLock()
+        self._matrix: Optional[np.memmap] = None
+        self._ids: list[int] = []
+        self._rows: dict[int, int] = {}
+        self._ivf: Optional[_IVF] = None
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def _load(self):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        meta = {"model": self.model, "dim": self.dim}
+
+        try:
+            stored = json.loads(self._meta_path.read_text())
+        except (OSError, ValueError):
+            stored = None
+
+        if stored != meta:
+            self._meta_path.write_text(json.dumps(meta))
+            self._truncate(0)
+        else:
+            # A crash between the two appends leaves one file a row ahead
+            rows = min(
+                self._file_size(self._vectors_path) // (4 * self.dim),
+                self._file_size(self._ids_path) // 8,
+            )
+            self._truncate(rows)
+
+        self._ids = np.fromfile(self._ids_path, dtype=np.int64).tolist()
+        self._rows = {pid: row for row, pid in enumerate(self._ids)}
+        self._map()
+
+    @staticmethod
+    def _file_size(path: Path) -> int:
+        return path.stat().st_size if path.exists() else 0
+
+    def _truncate(self, rows: int):
+        self._matrix = None
+        for path, row_bytes in ((self._vectors_path, 4 * self.dim), (self._ids_path, 8)):
+            with open(path, "ab") as f:
+                f.truncate(rows * row_bytes)
+
+    def _map(self):
+        self._matrix = (
+            np.memmap(self._vectors_path, dtype=np.float32, mode="r+",
+                      shape=(len(self._ids), self.dim))
+            if self._ids else None
+        )
+
+    def vector(self, prospect_id: int) -> Optional[np.ndarray]:
+        with self._lock:
+            row = self._rows.get(prospect_id)
+            return None if row is None else np.array(self._matrix[row])
+
+    def add(self, prospect_id: int, vector: np.ndarray):
+        self.add_many([prospect_id], np.asarray(vector).reshape(1, -1))
+
+    def add_many(self, prospect_ids: Sequence[int], vectors: np.ndarray):
+        """
+        Append new prospects' vectors; known prospects are updated in place.
+        """
+        vectors = normalize(np.asarray(vectors).reshape(len(prospect_ids), self.dim))
+
+        with self._lock:
+            new_ids, new_rows = [], []
+            for pid, vector in zip(prospect_ids, vectors):
+                pid = int(pid)
+                row = self._rows.get(pid)
+                if row is not None:
+                    self._matrix[row] = vector
+                    if self._ivf is not None:
+                        self._ivf.move(row, vector)
+                elif pid in new_ids:
+                    new_rows[new_ids.index(pid)] = vector
+                else:
+                    new_ids.append(pid)
+                    new_rows.append(vector)
+
+            if not new_ids:
+                return
+
+            with open(self._vectors_path, "ab") as f:
+                f.write(np.asarray(new_rows, dtype=np.float32).tobytes())
+            with open(self._ids_path, "ab") as f:
+                f.write(np.asarray(new_ids, dtype=np.int64).tobytes())
+
+            first = len(self._ids)
+            self._ids.extend(new_ids)
+            self._rows.update((pid, first + i) for i, pid in enumerate(new_ids))
+            self._map()
+
+            if self._ivf is not None:
+                for i, vector in enumerate(new_rows):
+                    self._ivf.add(first + i, vector)
+
+    def rebuild(self, items: Iterable[tuple[int, bytes]]):
+        """
+        Replace the contents with (prospect_id, float32 bytes) pairs.
+        """
+        with self._lock:
+            self._truncate(0)
+            self._ids, self._rows, self._ivf = [], {}, None
+            self._map()
+
+            ids, rows = [], []
+            for pid, blob in items:
+                ids.append(pid)
+                rows.append(np.frombuffer(blob, dtype=np.float32))
+                if len(ids) == 4096:
+                    self.add_many(ids, np.stack(rows))
+                    ids, rows = [], []
+            if ids:
+                self.add_many(ids, np.stack(rows))
+
+    def _partitions(self) -> Optional[_IVF]:
+        n = len(self._ids)
+        if n < self.ivf_min_rows:
+            return None
+        if self._ivf is None or n >= 2 * self._ivf.trained_on:
+            lists = max(1, int(math.sqrt(n)))
+            logger.info(f"Training {lists} IVF partitions over {n} vectors")
+            self._ivf = _IVF(self._matrix, lists)
+        return self._ivf
+
+    def search(
+        self, vector: np.ndarray, k: int = 3, exclude: Iterable[int] = ()
+    ) -> list[tuple[int, float]]:
+        """
+        (prospect_id, cosine similarity) of the k nearest vectors, best first.
+        """
+        query = normalize(np.asarray(vector).reshape(self.dim))
+        exclude = set(exclude)
+
+        with self._lock:
+            if not self._ids or k <= 0:
+                return []
+
+            ivf = self._partitions()
+            if ivf is None:
+                rows = None
+                scores = self._matrix @ query
+            else:
+                rows = ivf.candidates(query, self.ivf_probes)
+                scores = self._matrix[rows] @ query
+
+            want = min(k + len(exclude), len(scores))
+            if want < len(scores):
+                top = np.argpartition(-scores, want - 1)[:want]
+            else:
+                top = np.arange(len(scores))
+            top = top[np.argsort(-scores[top], kind="stable")]
+
+            hits = []
+            for i in top:
+                pid = self._ids[int(i) if rows is None else int(rows[i])]
+                if pid not in exclude:
+                    hits.append((pid, float(scores[i])))
+                if len(hits) == k:
+                    break
+            return hits
+
+    def close(self):
+        with self._lock:
+            if self._matrix is not None:
+                self._matrix.flush()
+            self._matrix = None
@@ -0,0 +1,34 @@
+import hashlib
+import re
+import unicodedata
+
+# Page furniture that changes between scrapes of an unchanged profile
+_VOLATILE = [
+    re.compile(r"\[truncated\]"),
+    # "3 weeks ago" and the compact "2w", "3mo" on activity items
+    re.compile(
+        r"\b\d+\s*(?:seconds?|minutes?|hours?|days?|weeks?|months?|years?)\s+ago\b"
+    ),
+    re.compile(r"\b\d+(?:h|d|w|mo|yr)\b"),
+    # follower / connection counts
+    re.compile(r"[\d,.]+\+?\s*(?:followers?|connections?)\b"),
+]
+
+
+def normalize_profile_text(text: str) -> str:
+    """
+    Case-, whitespace- and Unicode-normalized text with volatile counters
+    and relative timestamps removed.
+    """
+    text = unicodedata.normalize("NFKC", text or "").casefold()
+    for pattern in _VOLATILE:
+        text = pattern.sub(" ", text)
+    return " ".join(text.split())
+
+
+def content_fingerprint(text: str) -> str:
+    """
+    SHA-256 of the normalized profile text: equal for re-scrapes of an
+    unchanged profile.
+    """
+    return hashlib.sha256(normalize_profile_text(text).encode("utf-8")).hexdigest()
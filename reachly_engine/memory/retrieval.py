@@ -1,54 +1,195 @@
-import sqlite3
-from typing import List, Dict
+import threading
+from pathlib import Path
+from typing import List, Dict, Optional
 
-from reachly_engine.config import DB_PATH
 from reachly_engine.logger import get_logger
+from reachly_engine.memory.embeddings import (
+    EmbeddingIndex,
+    HashingEmbedder,
+    persona_text,
+)
+from reachly_engine.memory.store import MemoryStore, get_memory_store
 
 logger = get_logger("memory_retrieval")
 
+SIMILAR_COLUMNS = "id, name, role, company, industry, summary"
 
-def find_similar_prospects(
-    *,
-    industry: str | None = None,
-    role: str | None = None,
-    limit: int = 3,
-) -> List[Dict]:
+
+class ProspectIndex:
     """
-    Lightweight similarity based on industry + role overlap.
-    Deterministic, fast, offline.
+    Similar-prospect search by persona embedding.
+
+    Vectors are stored with the prospects (prospect_embeddings, the source
+    of truth) and mirrored in an EmbeddingIndex next to the database, which
+    is rebuilt from the table whenever the two disagree (new model, lost
+    files, rows added by another process).
     """
 
-    conditions = []
-    params = []
+    def __init__(
+        self,
+        store: Optional[MemoryStore] = None,
+        embedder=None,
+        directory: Optional[Path] = None,
+    ):
+        self.store = store or get_memory_store()
+        self.embedder = embedder or HashingEmbedder()
+        self.directory = directory or self.store.db_path.parent / "embeddings"
+        self._index: Optional[EmbeddingIndex] = None
+        self._backfilled = False
+        self._lock = threading.Lock()
+
+    @property
+    def index(self) -> EmbeddingIndex:
+        with self._lock:
+            if self._index is None:
+                name = self.embedder.name
+                index = EmbeddingIndex(self.directory, name, self.embedder.dim)
+                stored = self.store.count_embeddings(name)
+                if len(index) != stored:
+                    logger.info(f"Rebuilding embedding index ({stored} vectors)")
+                    index.rebuild(self.store.iter_embeddings(name))
+                self._index = index
+            return self._index
+
+    def add(self, prospect_id: int, prospect: Optional[Dict] = None) -> bool:
+        """
+        Embed one prospect (re-embedding replaces its vector). An embedding
+        failure is logged, not raised: the prospect is still stored and
+        backfill() can pick it up later.
+        """
+        prospect = prospect or self.store.get_prospect(prospect_id)
+        if not prospect:
+            return False
+
+        try:
+            vector = self.embedder.embed([persona_text(prospect)])[0]
+        except RuntimeError as e:
+            logger.warning(f"Prospect {prospect_id} not embedded: {e}")
+            return False
+
+        self.store.save_embedding(
+            prospect_id, self.embedder.name, len(vector), vector.tobytes()
+        )
+        self.index.add(prospect_id, vector)
+        return True
+
+    def backfill(self, batch_size: int = 64) -> int:
+        """
+        Embed every stored prospect that has no vector for this embedder,
+        in batches. Returns how many were embedded.
+        """
+        name = self.embedder.name
+        total = 0
+
+        while rows := self.store.prospects_without_embedding(name, batch_size):
+            vectors = self.embedder.embed([persona_text(row) for row in rows])
+            with self.store.transaction():
+                for row, vector in zip(rows, vectors):
+                    self.store.save_embedding(
+                        row["id"], name, len(vector), vector.tobytes()
+                    )
+            self.index.add_many([row["id"] for row in rows], vectors)
+            total += len(rows)
+
+        if total:
+            logger.info(f"Embedded {total} prospects")
+        return total
+
+    def similar(
+        self,
+        *,
+        text: Optional[str] = None,
+        prospect_id: Optional[int] = None,
+        limit: int = 3,
+    ) -> List[Dict]:
+        """
+        Prospects nearest to `text`, or to a stored prospect (itself
+        excluded). Rows carry a cosine `score`, best first; unrelated
+        prospects (score <= 0) are left out. The first
+        call embeds prospects stored before they had vectors.
+        """
+        if not self._backfilled:
+            self.backfill()
+            self._backfilled = True
+
+        exclude = ()
+        vector = None
 
-    if industry:
-        conditions.append("industry = ?")
-        params.append(industry)
+        if prospect_id is not None:
+            exclude = (prospect_id,)
+            vector = self.index.vector(prospect_id)
+            if vector is None:
+                prospect = self.store.get_prospect(prospect_id)
+                if not prospect:
+                    return []
+                text = persona_text(prospect)
 
-    if role:
-        conditions.append("role = ?")
-        params.append(role)
+        if vector is None:
+            if not text:
+                return []
+            vector = self.embedder.embed([text])[0]
 
-    if not conditions:
-        return []
+        hits = [
+            (pid, score)
+            for pid, score in self.index.search(vector, limit, exclude)
+            if score > 0
+        ]
+        if not hits:
+            return []
 
-    where_clause = " OR ".join(conditions)
+        rows = self.store.connection().execute(
+            f"SELECT {SIMILAR_COLUMNS} FROM prospects "
+            f"WHERE id IN ({', '.join('?' for _ in hits)})",
+            [pid for pid, _ in hits],
+        ).fetchall()
+        by_id = {row["id"]: dict(row) for row in rows}
 
-    query = f"""
-        SELECT id, name, role, company, industry, summary
-        FROM prospects
-        WHERE {where_clause}
-        ORDER BY created_at DESC
-        LIMIT ?
+        return [
+            {**by_id[pid], "score": score} for pid, score in hits if pid in by_id
+        ]
+
+    def close(self):
+        with self._lock:
+            if self._index is not None:
+                self._index.close()
+                self._index = None
+
+
+_index: Optional[ProspectIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_prospect_index() -> ProspectIndex:
+    """
+    Process-wide index over get_memory_store(), offline embedder.
     """
+    global _index
 
-    params.append(limit)
+    with _index_lock:
+        if _index is None:
+            _index = ProspectIndex()
+        return _index
 
-    logger.info("Retrieving similar prospects")
 
-    with sqlite3.connect(DB_PATH) as conn:
-        conn.row_factory = sqlite3.Row
-        rows = conn.execute(query, params).fetchall()
+def find_similar_prospects(
+    *,
+    industry: str | None = None,
+    role: str | None = None,
+    text: str | None = None,
+    prospect_id: int | None = None,
+    limit: int = 3,
+    store: Optional[MemoryStore] = None,
+    index: Optional[ProspectIndex] = None,
+) -> List[Dict]:
+    """
+    Nearest prospects by persona embedding: to free text, to a role and
+    industry ("Head of Data", "fintech" also finds "VP Analytics" at a
+    payments company), or to a stored prospect.
+    """
+    logger.info("Retrieving similar prospects")
 
-    return [dict(row) for row in rows]
+    if index is None:
+        index = ProspectIndex(store) if store is not None else get_prospect_index()
 
+    query = text or ". ".join(part for part in (role, industry) if part)
+    return index.similar(text=query or None, prospect_id=prospect_id, limit=limit)
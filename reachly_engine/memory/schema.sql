@@ -7,11 +7,16 @@ CREATE TABLE IF NOT EXISTS prospects (
     company TEXT,
     industry TEXT,
     seniority TEXT,
+    interests TEXT,
     summary TEXT,
     style TEXT,
+    cta TEXT,
     raw_profile TEXT,
     source TEXT,
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    source_url TEXT,
+    content_hash TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP
 );
 
 CREATE TABLE IF NOT EXISTS messages (
@@ -23,7 +28,70 @@ CREATE TABLE IF NOT EXISTS messages (
     FOREIGN KEY (prospect_id) REFERENCES prospects(id) ON DELETE CASCADE
 );
 
+-- Persona embeddings (float32, unit length), one per prospect and model;
+-- the search matrix under EMBEDDINGS_DIR is rebuilt from these
+CREATE TABLE IF NOT EXISTS prospect_embeddings (
+    prospect_id INTEGER NOT NULL,
+    model TEXT NOT NULL,
+    dim INTEGER NOT NULL,
+    vector BLOB NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (prospect_id, model),
+    FOREIGN KEY (prospect_id) REFERENCES prospects(id) ON DELETE CASCADE
+);
+
 CREATE INDEX IF NOT EXISTS idx_prospects_industry ON prospects(industry);
 CREATE INDEX IF NOT EXISTS idx_prospects_role ON prospects(role);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_prospects_source_url ON prospects(source_url);
+CREATE INDEX IF NOT EXISTS idx_prospects_content_hash ON prospects(content_hash);
+-- Listing order and date filters; with the implicit rowid this is a
+-- (created_at, id) index, so keyset pages seek instead of scanning
+CREATE INDEX IF NOT EXISTS idx_prospects_created_at ON prospects(created_at);
 CREATE INDEX IF NOT EXISTS idx_messages_channel ON messages(channel);
 
+-- Full-text search (external content: the text lives only in the base
+-- tables; triggers keep the indexes in step)
+CREATE VIRTUAL TABLE IF NOT EXISTS prospects_fts USING fts5(
+    name, role, company, summary, style, raw_profile,
+    content='prospects', content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+);
+
+CREATE TRIGGER IF NOT EXISTS prospects_fts_insert AFTER INSERT ON prospects BEGIN
+    INSERT INTO prospects_fts (rowid, name, role, company, summary, style, raw_profile)
+    VALUES (new.id, new.name, new.role, new.company, new.summary, new.style, new.raw_profile);
+END;
+
+CREATE TRIGGER IF NOT EXISTS prospects_fts_delete AFTER DELETE ON prospects BEGIN
+    INSERT INTO prospects_fts (prospects_fts, rowid, name, role, company, summary, style, raw_profile)
+    VALUES ('delete', old.id, old.name, old.role, old.company, old.summary, old.style, old.raw_profile);
+END;
+
+CREATE TRIGGER IF NOT EXISTS prospects_fts_update
+AFTER UPDATE OF name, role, company, summary, style, raw_profile ON prospects BEGIN
+    INSERT INTO prospects_fts (prospects_fts, rowid, name, role, company, summary, style, raw_profile)
+    VALUES ('delete', old.id, old.name, old.role, old.company, old.summary, old.style, old.raw_profile);
+    INSERT INTO prospects_fts (rowid, name, role, company, summary, style, raw_profile)
+    VALUES (new.id, new.name, new.role, new.company, new.summary, new.style, new.raw_profile);
+END;
+
+CREATE VIRTUAL TABLE IF NOT EXISTS messages_fts USING fts5(
+    content,
+    content='messages', content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+);
+
+CREATE TRIGGER IF NOT EXISTS messages_fts_insert AFTER INSERT ON messages BEGIN
+    INSERT INTO messages_fts (rowid, content) VALUES (new.id, new.content);
+END;
+
+CREATE TRIGGER IF NOT EXISTS messages_fts_delete AFTER DELETE ON messages BEGIN
+    INSERT INTO messages_fts (messages_fts, rowid, content)
+    VALUES ('delete', old.id, old.content);
+END;
+
+CREATE TRIGGER IF NOT EXISTS messages_fts_update AFTER UPDATE OF content ON messages BEGIN
+    INSERT INTO messages_fts (messages_fts, rowid, content)
+    VALUES ('delete', old.id, old.content);
+    INSERT INTO messages_fts (rowid, content) VALUES (new.id, new.content);
+END;
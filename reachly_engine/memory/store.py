@@ -1,29 +1,254 @@
+import re
 import sqlite3
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import date
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Optional, Dict, Iterable, Iterator
 
-from reachly_engine.config import DB_PATH
+from reachly_engine.config import (
+    DB_PATH,
+    SQLITE_BUSY_TIMEOUT_MS,
+    SQLITE_CACHE_MB,
+    SQLITE_MMAP_MB,
+    SQLITE_STATEMENT_CACHE,
+)
 from reachly_engine.logger import get_logger
 
 logger = get_logger("memory_store")
 
+FTS_TABLES = ("prospects_fts", "messages_fts")
+
+# bm25 column weights for prospects_fts: name, role, company, summary,
+# style, raw_profile
+PROSPECT_SEARCH_WEIGHTS = (5.0, 3.0, 3.0, 2.0, 0.5, 1.0)
+
+SEARCH_KINDS = ("prospects", "messages")
+
+# Match markers around highlighted terms in search snippets
+SNIPPET_START = "\x02"
+SNIPPET_END = "\x03"
+
+# Columns added after the initial schema: {table: {column: declaration}}.
+# Applied to existing databases before schema.sql runs.
+COLUMN_MIGRATIONS = {
+    "prospects": {
+        "cta": "TEXT",
+        "interests": "TEXT",
+        "source_url": "TEXT",
+        "content_hash": "TEXT",
+        "updated_at": "TIMESTAMP",
+    },
+}
+
+# Columns of a listing row (iter_prospects / list_prospects)
+LISTING_COLUMNS = "id, name, role, company, industry, created_at"
+
+# Rows fetched per query while iter_prospects streams an unbounded listing
+LISTING_BATCH_SIZE = 500
+
+
+@dataclass
+class ProspectFilters:
+    """
+    Listing filters: company / role containing the text (case-insensitive),
+    created between `since` and `until` (inclusive days, UTC).
+    """
+
+    company: Optional[str] = None
+    role: Optional[str] = None
+    since: Optional[date] = None
+    until: Optional[date] = None
+
+    def __bool__(self) -> bool:
+        return any((self.company, self.role, self.since, self.until))
+
+    def where(self) -> tuple[list[str], dict]:
+        """
+        SQL conditions and their named parameters.
+        """
+        conditions, params = [], {}
+
+        for column in ("company", "role"):
+            value = getattr(self, column)
+            if value:
+                conditions.append(f"{column} LIKE :{column} ESCAPE '\\'")
+                escaped = re.sub(r"([\\%_])", r"\\\1", value.strip())
+                params[column] = f"%{escaped}%"
+
+        if self.since:
+            conditions.append("created_at >= :since")
+            params["since"] = self.since.isoformat()
+        if self.until:
+            conditions.append("created_at < date(:until, '+1 day')")
+            params["until"] = self.until.isoformat()
+
+        return conditions, params
+
+
+def fts_query(text: str) -> str:
+    """
+    FTS5 query for free text: every word must match (the last one as a
+    prefix, for search-as-you-type), and quotes, operators and column
+    filters in the input are treated as plain words.
+    """
+    words = re.findall(r"\w+", text)
+    if not words:
+        return ""
+    terms = [f'"{w}"' for w in words]
+    terms[-1] += "*"
+    return " ".join(terms)
+
+
+def connect(db_path: Path) -> sqlite3.Connection:
+    """
+    Connection with the store's pragmas: WAL journal, NORMAL sync (durable
+    at checkpoints, no fsync per commit), a busy timeout instead of
+    immediate "database is locked", page cache and mmap sized from config.
+    Rows come back as sqlite3.Row.
+    """
+    conn = sqlite3.connect(
+        db_path,
+        timeout=SQLITE_BUSY_TIMEOUT_MS / 1000,
+        cached_statements=SQLITE_STATEMENT_CACHE,
+        check_same_thread=False,  # only close() crosses threads
+    )
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    conn.execute("PRAGMA foreign_keys = ON")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute(f"PRAGMA busy_timeout = {SQLITE_BUSY_TIMEOUT_MS}")
+    conn.execute(f"PRAGMA cache_size = {-SQLITE_CACHE_MB * 1024}")
+    conn.execute(f"PRAGMA mmap_size = {SQLITE_MMAP_MB * 1024 * 1024}")
+    return conn
+
 
 class MemoryStore:
+    """
+    SQLite store for prospects and messages.
+
+    Each thread gets one long-lived connection (opened on first use), so
+    the schema is parsed once per thread and sqlite's statement cache
+    keeps the prepared queries. Connections are closed by close().
+    """
+
     def __init__(self, db_path: Path = DB_PATH):
         self.db_path = db_path
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._lock = threading.Lock()
         self._ensure_db()
 
+    def connection(self) -> sqlite3.Connection:
+        """
+        This thread's connection. `with store.connection() as conn:` runs
+        a transaction (commit on success, rollback on error).
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = connect(self.db_path)
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    def close(self):
+        with self._lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+            self._local = threading.local()
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        One write transaction: everything inside commits together or not
+        at all. BEGIN IMMEDIATE takes the write lock up front, so reads
+        inside see no concurrent writes. Nested calls (the save_* methods
+        use this too) join the outer transaction.
+        """
+        conn = self.connection()
+        if conn.in_transaction:
+            yield conn
+            return
+
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.rollback()
+            raise
+        conn.commit()
+
     def _ensure_db(self):
-        if not self.db_path.exists():
-            self._init_schema()
+        if self.db_path.exists():
+            self._migrate()
+        self._init_schema()
 
     def _init_schema(self):
         schema_path = Path(__file__).parent / "schema.sql"
-        with sqlite3.connect(self.db_path) as conn:
+        with self.connection() as conn:
+            had_fts = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'prospects_fts'"
+            ).fetchone()
             conn.executescript(schema_path.read_text())
 
+            if not had_fts:
+                # Index rows stored before the search tables existed
+                for table in FTS_TABLES:
+                    conn.execute(f"INSERT INTO {table}({table}) VALUES ('rebuild')")
+
+    def _migrate(self):
+        with self.connection() as conn:
+            for table, columns in COLUMN_MIGRATIONS.items():
+                existing = {
+                    row[1] for row in conn.execute(f"PRAGMA table_info({table})")
+                }
+                if not existing:
+                    continue  # table not created yet; schema.sql handles it
+
+                for column, declaration in columns.items():
+                    if column not in existing:
+                        logger.info(f"Migrating: adding {table}.{column}")
+                        conn.execute(
+                            f"ALTER TABLE {table} ADD COLUMN {column} {declaration}"
+                        )
+
     # ---------- Prospects ----------
 
+    @staticmethod
+    def _prospect_fields(
+        *,
+        name,
+        role,
+        company,
+        industry,
+        seniority,
+        summary,
+        style,
+        raw_profile,
+        source,
+        interests=None,
+        source_url=None,
+        content_hash=None,
+    ) -> Dict:
+        return {
+            "name": name,
+            "role": role,
+            "company": company,
+            "industry": industry,
+            "seniority": seniority,
+            "interests": interests,
+            "summary": summary,
+            "style": style,
+            "raw_profile": raw_profile,
+            "source": source,
+            "source_url": source_url,
+            "content_hash": content_hash,
+        }
+
     def save_prospect(
         self,
         *,
@@ -36,63 +261,390 @@ class MemoryStore:
         style,
         raw_profile,
         source,
+        interests=None,
+        source_url=None,
+        content_hash=None,
     ) -> int:
-        with sqlite3.connect(self.db_path) as conn:
-            cur = conn.cursor()
-            cur.execute(
-                """
-                INSERT INTO prospects
-                (name, role, company, industry, seniority, summary, style, raw_profile, source)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    name,
-                    role,
-                    company,
-                    industry,
-                    seniority,
-                    summary,
-                    style,
-                    raw_profile,
-                    source,
-                ),
+        """
+        Insert a prospect, or update it in place when one with the same
+        source URL already exists (its CTA is cleared: it was written for
+        the old persona).
+        """
+        fields = self._prospect_fields(
+            name=name,
+            role=role,
+            company=company,
+            industry=industry,
+            seniority=seniority,
+            summary=summary,
+            style=style,
+            raw_profile=raw_profile,
+            source=source,
+            interests=interests,
+            source_url=source_url,
+            content_hash=content_hash,
+        )
+        return self.save_prospects([fields])[0]
+
+    def save_prospects(self, prospects: Iterable[Dict]) -> list[int]:
+        """
+        save_prospect() for many rows in one transaction: existing URLs
+        are looked up in one query, then updated and inserted with
+        executemany. Returns the ids in input order; a URL repeated in the
+        batch resolves to one row holding its last version.
+        """
+        rows = [self._prospect_fields(**p) for p in prospects]
+        if not rows:
+            return []
+
+        columns = list(rows[0])
+        assignments = ", ".join(f"{column} = ?" for column in columns)
+
+        with self.transaction() as conn:
+            urls = list({r["source_url"] for r in rows if r["source_url"]})
+            existing: Dict[str, int] = {}
+            for start in range(0, len(urls), 500):
+                chunk = urls[start:start + 500]
+                existing.update(
+                    conn.execute(
+                        f"""
+                        SELECT source_url, id FROM prospects
+                        WHERE source_url IN ({", ".join("?" for _ in chunk)})
+                        """,
+                        chunk,
+                    )
+                )
+
+            # slot of each input row: ("id", prospect_id) or ("new", n)
+            slots = []
+            updates: Dict[int, Dict] = {}
+            inserts: list[Dict] = []
+            new_by_url: Dict[str, int] = {}
+            for row in rows:
+                url = row["source_url"]
+                if url in existing:
+                    updates[existing[url]] = row
+                    slots.append(("id", existing[url]))
+                elif url and url in new_by_url:
+                    inserts[new_by_url[url]] = row
+                    slots.append(("new", new_by_url[url]))
+                else:
+                    if url:
+                        new_by_url[url] = len(inserts)
+                    slots.append(("new", len(inserts)))
+                    inserts.append(row)
+
+            if updates:
+                conn.executemany(
+                    f"""
+                    UPDATE prospects
+                    SET {assignments}, cta = NULL, updated_at = CURRENT_TIMESTAMP
+                    WHERE id = ?
+                    """,
+                    [(*row.values(), pid) for pid, row in updates.items()],
+                )
+                logger.info(f"Updated {len(updates)} prospect(s) in place")
+
+            new_ids: list[int] = []
+            if inserts:
+                # AUTOINCREMENT under the write lock: the new rows are
+                # exactly those above the current maximum, in order
+                last = conn.execute(
+                    "SELECT COALESCE(MAX(id), 0) FROM prospects"
+                ).fetchone()[0]
+                conn.executemany(
+                    f"""
+                    INSERT INTO prospects ({", ".join(columns)})
+                    VALUES ({", ".join("?" for _ in columns)})
+                    """,
+                    [tuple(row.values()) for row in inserts],
+                )
+                new_ids = [
+                    r[0]
+                    for r in conn.execute(
+                        "SELECT id FROM prospects WHERE id > ? ORDER BY id",
+                        (last,),
+                    )
+                ]
+
+        return [value if kind == "id" else new_ids[value] for kind, value in slots]
+
+    def find_prospect(
+        self,
+        *,
+        source_url: Optional[str] = None,
+        content_hash: Optional[str] = None,
+    ) -> Optional[Dict]:
+        """
+        The prospect stored for this URL, or (without a URL) one with the
+        same content fingerprint.
+        """
+        if source_url:
+            query, params = "SELECT * FROM prospects WHERE source_url = ?", (source_url,)
+        elif content_hash:
+            query, params = (
+                "SELECT * FROM prospects WHERE content_hash = ? ORDER BY id DESC LIMIT 1",
+                (content_hash,),
             )
-            conn.commit()
-            return cur.lastrowid
+        else:
+            return None
+
+        row = self.connection().execute(query, params).fetchone()
+
+        return dict(row) if row else None
 
     def list_prospects(self) -> list[Dict]:
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        return list(self.iter_prospects())
+
+    def iter_prospects(
+        self,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
+        filters: Optional[ProspectFilters] = None,
+    ) -> Iterator[Dict]:
+        """
+        Listing rows (LISTING_COLUMNS), newest first, streamed in keyset
+        order: pass the last id of one page as `after_id` to get the next.
+        Each query seeks straight to its position on the created_at index
+        (no OFFSET), and no statement stays open between batches, so the
+        caller may write while iterating.
+        """
+        conditions, params = (filters or ProspectFilters()).where()
+        conn = self.connection()
+
+        anchor = None
+        if after_id is not None:
+            row = conn.execute(
+                "SELECT created_at, id FROM prospects WHERE id = ?", (after_id,)
+            ).fetchone()
+            # A deleted anchor still marks a position: ids grow with time
+            anchor = tuple(row) if row else (None, after_id)
+
+        remaining = limit
+        while remaining is None or remaining > 0:
+            batch = min(remaining or LISTING_BATCH_SIZE, LISTING_BATCH_SIZE)
+
+            keyset = []
+            if anchor is not None:
+                keyset.append(
+                    "id < :after_id" if anchor[0] is None
+                    else "(created_at, id) < (:after_at, :after_id)"
+                )
+
             rows = conn.execute(
-                """
-                SELECT id, name, role, company, industry, created_at
-                FROM prospects
-                ORDER BY created_at DESC
-                """
+                f"""
+                SELECT {LISTING_COLUMNS} FROM prospects
+                WHERE {' AND '.join(conditions + keyset) or '1'}
+                ORDER BY created_at DESC, id DESC
+                LIMIT :batch
+                """,
+                {**params, "after_at": anchor and anchor[0],
+                 "after_id": anchor and anchor[1], "batch": batch},
             ).fetchall()
 
-        return [dict(row) for row in rows]
+            for row in rows:
+                yield dict(row)
+
+            if len(rows) < batch:
+                return
+            anchor = (rows[-1]["created_at"], rows[-1]["id"])
+            if remaining is not None:
+                remaining -= len(rows)
+
+    def count_prospects(self, filters: Optional[ProspectFilters] = None) -> int:
+        conditions, params = (filters or ProspectFilters()).where()
+        return self.connection().execute(
+            f"SELECT COUNT(*) FROM prospects WHERE {' AND '.join(conditions) or '1'}",
+            params,
+        ).fetchone()[0]
 
     def get_prospect(self, prospect_id: int) -> Optional[Dict]:
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            row = conn.execute(
-                "SELECT * FROM prospects WHERE id = ?",
-                (prospect_id,),
-            ).fetchone()
+        row = self.connection().execute(
+            "SELECT * FROM prospects WHERE id = ?",
+            (prospect_id,),
+        ).fetchone()
 
         return dict(row) if row else None
 
+    def save_cta(self, prospect_id: int, cta: str):
+        with self.transaction() as conn:
+            conn.execute(
+                "UPDATE prospects SET cta = ? WHERE id = ?",
+                (cta, prospect_id),
+            )
+
+    # ---------- Search ----------
+
+    def search(
+        self, query: str, limit: int = 20, kinds: Iterable[str] = SEARCH_KINDS
+    ) -> list[Dict]:
+        """
+        BM25-ranked full-text search over prospects (name, role, company,
+        summary, style, raw profile) and generated messages. Each hit has
+        `kind`, `prospect_id`, `name`, `company`, `channel` (messages
+        only), a `snippet` with matches between SNIPPET_START/END, and
+        `score` (lower is better). Best hits first.
+        """
+        match = fts_query(query)
+        if not match:
+            return []
+
+        conn = self.connection()
+        params = {
+            "match": match,
+            "limit": limit,
+            "start": SNIPPET_START,
+            "end": SNIPPET_END,
+        }
+        hits = []
+
+        # Rank first, then build snippets for the top rows only
+        if "prospects" in kinds:
+            weights = ", ".join(str(w) for w in PROSPECT_SEARCH_WEIGHTS)
+            hits += conn.execute(
+                f"""
+                WITH top AS (
+                    SELECT rowid, bm25(prospects_fts, {weights}) AS score
+                    FROM prospects_fts
+                    WHERE prospects_fts MATCH :match
+                    ORDER BY score
+                    LIMIT :limit
+                )
+                SELECT 'prospect' AS kind, p.id AS prospect_id, p.name, p.role,
+                       p.company, NULL AS channel,
+                       snippet(prospects_fts, -1, :start, :end, '…', 16) AS snippet,
+                       top.score
+                FROM top
+                JOIN prospects_fts ON prospects_fts.rowid = top.rowid
+                JOIN prospects p ON p.id = top.rowid
+                WHERE prospects_fts MATCH :match
+                """,
+                params,
+            ).fetchall()
+
+        if "messages" in kinds:
+            hits += conn.execute(
+                """
+                WITH top AS (
+                    SELECT rowid, bm25(messages_fts) AS score
+                    FROM messages_fts
+                    WHERE messages_fts MATCH :match
+                    ORDER BY score
+                    LIMIT :limit
+                )
+                SELECT 'message' AS kind, m.prospect_id, p.name, p.role,
+                       p.company, m.channel,
+                       snippet(messages_fts, 0, :start, :end, '…', 16) AS snippet,
+                       top.score
+                FROM top
+                JOIN messages_fts ON messages_fts.rowid = top.rowid
+                JOIN messages m ON m.id = top.rowid
+                JOIN prospects p ON p.id = m.prospect_id
+                WHERE messages_fts MATCH :match
+                """,
+                params,
+            ).fetchall()
+
+        return sorted((dict(h) for h in hits), key=lambda h: h["score"])[:limit]
+
+    # ---------- Embeddings ----------
+
+    def save_embedding(self, prospect_id: int, model: str, dim: int, vector: bytes):
+        """
+        A prospect's persona embedding (raw float32 bytes), replacing the
+        previous one for the same model.
+        """
+        with self.transaction() as conn:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO prospect_embeddings
+                    (prospect_id, model, dim, vector)
+                VALUES (?, ?, ?, ?)
+                """,
+                (prospect_id, model, dim, vector),
+            )
+
+    def iter_embeddings(self, model: str) -> Iterator[tuple[int, bytes]]:
+        """
+        (prospect_id, vector bytes) for every prospect embedded with `model`.
+        """
+        yield from self.connection().execute(
+            """
+            SELECT prospect_id, vector FROM prospect_embeddings
+            WHERE model = ? ORDER BY prospect_id
+            """,
+            (model,),
+        )
+
+    def count_embeddings(self, model: str) -> int:
+        return self.connection().execute(
+            "SELECT COUNT(*) FROM prospect_embeddings WHERE model = ?", (model,)
+        ).fetchone()[0]
+
+    def prospects_without_embedding(self, model: str, limit: int = 100) -> list[Dict]:
+        rows = self.connection().execute(
+            """
+            SELECT * FROM prospects p
+            WHERE NOT EXISTS (
+                SELECT 1 FROM prospect_embeddings e
+                WHERE e.prospect_id = p.id AND e.model = ?
+            )
+            ORDER BY p.id
+            LIMIT ?
+            """,
+            (model, limit),
+        ).fetchall()
+        return [dict(row) for row in rows]
+
     # ---------- Messages ----------
 
     def save_message(self, prospect_id: int, channel: str, content: str):
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
+        self.save_message_rows([(prospect_id, channel, content)])
+
+    def save_messages(self, prospect_id: int, messages: Dict[str, str]):
+        """
+        All channel messages of a prospect in one transaction.
+        """
+        self.save_message_rows(
+            (prospect_id, channel, content) for channel, content in messages.items()
+        )
+
+    def save_message_rows(self, rows: Iterable[tuple[int, str, str]]):
+        """
+        (prospect_id, channel, content) rows, one executemany.
+        """
+        with self.transaction() as conn:
+            conn.executemany(
                 """
                 INSERT INTO messages (prospect_id, channel, content)
                 VALUES (?, ?, ?)
                 """,
-                (prospect_id, channel, content),
+                rows,
             )
-            conn.commit()
 
+    def save_prospect_with_messages(
+        self, messages: Dict[str, str], **fields
+    ) -> int:
+        """
+        save_prospect() and save_messages() atomically: both or neither.
+        """
+        with self.transaction():
+            prospect_id = self.save_prospect(**fields)
+            self.save_messages(prospect_id, messages)
+        return prospect_id
+
+
+_store: Optional[MemoryStore] = None
+_store_lock = threading.Lock()
+
+
+def get_memory_store() -> MemoryStore:
+    """
+    Process-wide store on DB_PATH, for module-level helpers.
+    """
+    global _store
+
+    with _store_lock:
+        if _store is None:
+            _store = MemoryStore()
+        return _store
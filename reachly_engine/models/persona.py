@@ -19,9 +19,15 @@ class Persona(BaseModel):
     company: Optional[str] = None
     industry: Optional[str] = None
     seniority: Optional[str] = None
+    interests: list[str] = Field(default_factory=list)
 
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
+    @property
+    def raw_analysis(self) -> str:
+        # Name used by the original analysis-layer dataclass
+        return self.analysis
+
     def persona_block(self) -> str:
         """
         Canonical persona block passed into generators.
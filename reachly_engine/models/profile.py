@@ -3,6 +3,55 @@ from typing import Optional
 from datetime import datetime
 
 
+# Long role descriptions are cut in the compact rendering
+POSITION_DESCRIPTION_CHARS = 400
+ABOUT_CHARS = 1500
+
+
+class Position(BaseModel):
+    title: Optional[str] = None
+    company: Optional[str] = None
+    location: Optional[str] = None
+    start: Optional[str] = None  # "YYYY" or "YYYY-MM"
+    end: Optional[str] = None  # None = current
+    description: Optional[str] = None
+
+    def key(self) -> tuple:
+        return (
+            (self.title or "").lower(),
+            (self.company or "").lower(),
+            self.start or "",
+        )
+
+
+class Education(BaseModel):
+    school: Optional[str] = None
+    degree: Optional[str] = None
+    field: Optional[str] = None
+    start: Optional[str] = None
+    end: Optional[str] = None
+
+    def key(self) -> tuple:
+        return (
+            (self.school or "").lower(),
+            (self.degree or "").lower(),
+            (self.field or "").lower(),
+        )
+
+
+def _period(start: Optional[str], end: Optional[str]) -> str:
+    if not start and not end:
+        return ""
+    return f" ({start or '?'} – {end or 'present'})"
+
+
+def _cut(text: str, limit: int) -> str:
+    text = " ".join(text.split())
+    if len(text) <= limit:
+        return text
+    return text[:limit].rsplit(" ", 1)[0] + "…"
+
+
 class Profile(BaseModel):
     source: str = Field(..., description="linkedin | raw_text | web")
     source_url: Optional[str] = None
@@ -13,6 +62,12 @@ class Profile(BaseModel):
     industry: Optional[str] = None
     seniority: Optional[str] = None
 
+    headline: Optional[str] = None
+    about: Optional[str] = None
+    location: Optional[str] = None
+    positions: list[Position] = Field(default_factory=list)
+    education: list[Education] = Field(default_factory=list)
+
     raw_text: str = Field(..., description="Cleaned raw profile text")
 
     created_at: datetime = Field(default_factory=datetime.utcnow)
@@ -21,3 +76,61 @@ class Profile(BaseModel):
         parts = [self.name, self.role, self.company]
         return " | ".join(p for p in parts if p)
 
+    @property
+    def structured(self) -> bool:
+        return bool(self.headline or self.positions)
+
+    def render(self) -> str:
+        """
+        Compact plain-text profile for LLM prompts: one line per fact,
+        duplicates dropped, long descriptions cut.
+        """
+        lines = []
+        seen = set()
+
+        def add(line: str):
+            if line and line.lower() not in seen:
+                seen.add(line.lower())
+                lines.append(line)
+
+        if self.name:
+            add(f"Name: {self.name}")
+        if self.headline:
+            add(f"Headline: {' '.join(self.headline.split())}")
+        if self.location:
+            add(f"Location: {self.location}")
+        if self.industry:
+            add(f"Industry: {self.industry}")
+
+        if self.about:
+            lines.append("")
+            lines.append("About:")
+            add(_cut(self.about, ABOUT_CHARS))
+
+        if self.positions:
+            lines.append("")
+            lines.append("Experience:")
+            for p in self.positions:
+                head = " at ".join(x for x in (p.title, p.company) if x)
+                add(f"- {head}{_period(p.start, p.end)}")
+                if p.description:
+                    add(f"  {_cut(p.description, POSITION_DESCRIPTION_CHARS)}")
+
+        if self.education:
+            lines.append("")
+            lines.append("Education:")
+            for e in self.education:
+                degree = ", ".join(x for x in (e.degree, e.field) if x)
+                head = " — ".join(x for x in (degree, e.school) if x)
+                add(f"- {head}{_period(e.start, e.end)}")
+
+        return "\n".join(lines).strip()
+
+    def prompt_text(self) -> str:
+        """
+        What the persona analysis should read: the compact rendering when
+        structured data was parsed, the raw page text otherwise.
+        """
+        if self.structured:
+            return self.render()
+        return self.raw_text
@@ -0,0 +1,260 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Optional
+from urllib.parse import urlsplit
+
+import requests
+
+from reachly_engine.config import (
+    SCRAPE_CONCURRENCY,
+    SCRAPE_RATE_PER_HOST,
+    SCRAPE_BURST,
+    SCRAPE_RETRIES,
+    SCRAPE_BACKOFF_BASE,
+    SCRAPE_BACKOFF_MAX,
+)
+from reachly_engine.llm.resilience import RetryPolicy
+from reachly_engine.logger import get_logger
+from reachly_engine.models.profile import Profile
+from reachly_engine.scraping.http_cache import RATE_LIMIT_STATUS
+from reachly_engine.scraping.linkedin import fetch_linkedin_profile
+from reachly_engine.scraping.urls import canonicalize_url
+
+logger = get_logger("bulk_scraper")
+
+
+# ---------- URLs ----------
+
+
+def dedupe_urls(urls: Iterable[str]) -> list[str]:
+    """
+    Canonical URLs in first-seen order; blanks, '#' comments and
+    non-URLs are skipped.
+    """
+    seen = set()
+    unique = []
+    given = 0
+    for raw in urls:
+        raw = raw.strip()
+        if not raw or raw.startswith("#"):
+            continue
+        given += 1
+        url = canonicalize_url(raw)
+        if url is None:
+            logger.warning(f"Skipping invalid URL: {raw}")
+            continue
+        if url not in seen:
+            seen.add(url)
+            unique.append(url)
+
+    if given != len(unique):
+        logger.info(f"{given} URLs → {len(unique)} unique")
+    return unique
+
+
+def read_url_file(path: Path) -> list[str]:
+    return path.read_text(encoding="utf-8").splitlines()
+
+
+# ---------- Rate limiting ----------
+
+
+class TokenBucket:
+    """
+    Token bucket of `burst` tokens refilled at `rate` per second, kept as
+    the single timestamp of the next free token (GCRA form). reserve()
+    takes a token and returns how long to wait before using it, so
+    callers sleep outside the lock.
+    """
+
+    def __init__(
+        self,
+        rate: float = SCRAPE_RATE_PER_HOST,
+        burst: int = SCRAPE_BURST,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self.tolerance = self.interval * (max(burst, 1) - 1)
+        self.clock = clock
+        self._tat = 0.0  # theoretical arrival time of the next request
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        with self._lock:
+            now = self.clock()
+            send_at = max(now, self._tat - self.tolerance)
+            self._tat = max(self._tat, send_at) + self.interval
+            return send_at - now
+
+    def block_until(self, until: float):
+        """
+        No tokens before `until` (absolute clock time), and no burst
+        right after it.
+        """
+        with self._lock:
+            self._tat = max(self._tat, until + self.tolerance)
+
+
+class HostRateLimiter:
+    """
+    One TokenBucket per host, shared by every worker.
+    """
+
+    def __init__(
+        self,
+        rate: float = SCRAPE_RATE_PER_HOST,
+        burst: int = SCRAPE_BURST,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.rate = rate
+        self.burst = burst
+        self.clock = clock
+        self.sleep = sleep
+        self._buckets: dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, url: str) -> TokenBucket:
+        host = urlsplit(url).hostname or ""
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = self._buckets[host] = TokenBucket(
+                    self.rate, self.burst, self.clock
+                )
+            return bucket
+
+    def acquire(self, url: str):
+        wait = self._bucket(url).reserve()
+        if wait > 0:
+            self.sleep(wait)
+
+    def backoff(self, url: str, seconds: float):
+        """
+        Pause the whole host (every worker), e.g. after a 429.
+        """
+        self._bucket(url).block_until(self.clock() + seconds)
+
+
+# ---------- Fetching ----------
+
+
+@dataclass
+class BulkResult:
+    url: str
+    profile: Optional[Profile] = None
+    error: Optional[str] = None
+    attempts: int = 0
+    seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.profile is not None
+
+
+def _response(error: Exception) -> Optional[requests.Response]:
+    # Fetchers wrap requests errors in RuntimeError; look down the chain
+    while error is not None:
+        response = getattr(error, "response", None)
+        if response is not None:
+            return response
+        error = error.__cause__
+    return None
+
+
+def retry_after(response: requests.Response) -> Optional[float]:
+    """
+    Seconds from a Retry-After header (delta-seconds or HTTP date).
+    """
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _fetch_one(
+    url: str,
+    fetch: Callable[[str], Profile],
+    limiter: HostRateLimiter,
+    policy: RetryPolicy,
+) -> BulkResult:
+    result = BulkResult(url=url)
+    started = time.perf_counter()
+
+    for attempt in range(policy.retries + 1):
+        result.attempts = attempt + 1
+        limiter.acquire(url)
+        try:
+            result.profile = fetch(url)
+            break
+        except (RuntimeError, requests.RequestException) as e:
+            response = _response(e)
+            status = response.status_code if response is not None else None
+
+            if status in RATE_LIMIT_STATUS and attempt < policy.retries:
+                delay = retry_after(response)
+                if delay is None:
+                    delay = policy.delay(attempt + 1)
+                delay = min(delay, policy.max_delay)
+                logger.warning(
+                    f"{status} from {urlsplit(url).hostname}, "
+                    f"backing off {delay:.1f}s (attempt {attempt + 1})"
+                )
+                limiter.backoff(url, delay)
+                continue
+
+            result.error = f"HTTP {status}" if status else str(e)
+            break
+
+    result.seconds = time.perf_counter() - started
+    return result
+
+
+def iter_bulk_profiles(
+    urls: Iterable[str],
+    concurrency: int = SCRAPE_CONCURRENCY,
+    limiter: Optional[HostRateLimiter] = None,
+    policy: Optional[RetryPolicy] = None,
+    fetch: Callable[[str], Profile] = fetch_linkedin_profile,
+) -> Iterator[BulkResult]:
+    """
+    Fetch the canonicalized, deduplicated URLs on a thread pool and yield
+    each result as soon as it is ready (completion order, not input
+    order), so analysis can start on the first profile while the rest
+    are still downloading. Failures are yielded as results with `error`
+    set rather than raised.
+    """
+    unique = dedupe_urls(urls)
+    limiter = limiter or HostRateLimiter()
+    policy = policy or RetryPolicy(
+        retries=SCRAPE_RETRIES,
+        base_delay=SCRAPE_BACKOFF_BASE,
+        max_delay=SCRAPE_BACKOFF_MAX,
+    )
+
+    pool = ThreadPoolExecutor(
+        max_workers=max(1, concurrency), thread_name_prefix="scrape"
+    )
+    futures = [
+        pool.submit(_fetch_one, url, fetch, limiter, policy) for url in unique
+    ]
+
+    try:
+        for future in as_completed(futures):
+            yield future.result()
+    finally:
+        # Consumer stopped early: drop what has not started yet
+        for future in futures:
+            future.cancel()
+        pool.shutdown(wait=True)
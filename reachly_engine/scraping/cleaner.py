@@ -1,8 +1,44 @@
 import re
 from bs4 import BeautifulSoup
 
+# Obvious LinkedIn / web UI noise. Line rules drop a line from where it
+# starts with the phrase; word rules drop whole words or phrases anywhere
+# in a line, never part of a word ("Connecticut", "Messaging" survive).
+LINE_NOISE_PATTERNS = [
+    r"Sign in\b.*",
+    r"Join LinkedIn\b.*",
+]
+NOISE_PATTERNS = [
+    r"LinkedIn Member",
+    r"See more",
+    r"Show less",
+    r"Followers?\s*\d[\d,.]*\+?",
+    r"Connections?\s*\d[\d,.]*\+?",
+    r"Message",
+    r"Connect",
+]
 
-def clean_html(html: str) -> str:
+# All rules as one alternation: one scan instead of one per rule. The
+# lookahead on the word rules' first letters lets the scan skip most
+# positions without trying every alternative there. Lines are matched one
+# at a time, so ^ is the start of the line.
+_FIRST = "".join(sorted({c for p in NOISE_PATTERNS for c in (p[0].lower(), p[0].upper())}))
+_LINE_RULES = "|".join(f"(?:{p})" for p in LINE_NOISE_PATTERNS)
+_WORD_RULES = "|".join(f"(?:{p})" for p in NOISE_PATTERNS)
+_NOISE = re.compile(
+    rf"^\s*(?:{_LINE_RULES})|(?=[{_FIRST}])(?<!\w)(?:{_WORD_RULES})(?!\w)",
+    re.IGNORECASE,
+)
+
+# Repeated lines shorter than this are kept unless adjacent ("Full-time",
+# "2 yrs" legitimately recur once per position)
+DEDUPE_MIN_LINE_CHARS = 32
+
+
+def html_to_text(html: str) -> str:
+    """
+    Text of the page without scripts, styles and page chrome.
+    """
     if not html:
         return ""
 
@@ -12,38 +48,76 @@ def clean_html(html: str) -> str:
     for tag in soup(["script", "style", "noscript", "svg", "img", "footer", "header"]):
         tag.decompose()
 
-    text = soup.get_text(separator="\n")
+    return soup.get_text(separator="\n")
 
-    # Normalize whitespace
-    text = re.sub(r"\n{2,}", "\n\n", text)
-    text = re.sub(r"[ \t]+", " ", text)
 
-    return text.strip()
-
-
-def aggressive_cleanup(text: str) -> str:
+def clean_text(text: str, noise: bool = True, dedupe: bool = True) -> str:
     """
-    Remove obvious LinkedIn / web UI noise.
+    One pass over the lines:
+    - UI noise removed (`noise`)
+    - whitespace collapsed inside lines, lines stripped, blank runs
+      reduced to a single paragraph break
+    - with `dedupe`: adjacent duplicate lines dropped, longer lines seen
+      before dropped, and whole paragraphs seen before dropped (matched
+      case-insensitively by hash)
     """
     if not text:
         return ""
 
-    noise_patterns = [
-        r"Sign in.*",
-        r"Join LinkedIn.*",
-        r"LinkedIn Member",
-        r"See more",
-        r"Show less",
-        r"Followers?\s*\d+",
-        r"Connections?\s*\d+",
-        r"Message",
-        r"Connect",
-    ]
-
-    for pattern in noise_patterns:
-        text = re.sub(pattern, "", text, flags=re.IGNORECASE)
-
-    # Final whitespace cleanup
-    text = re.sub(r"\n{2,}", "\n\n", text)
-    return text.strip()
+    # Scraped pages repeat the same raw lines a lot: clean each one once
+    cleaned: dict[str, str] = {}
+    seen_lines: set[int] = set()
+    seen_paragraphs: set[int] = set()
+    paragraphs: list[str] = []
+    current: list[str] = []
+    previous = None
+
+    def flush():
+        if not current:
+            return
+        paragraph = "\n".join(current)
+        key = hash(paragraph.casefold())
+        if not dedupe or key not in seen_paragraphs:
+            seen_paragraphs.add(key)
+            paragraphs.append(paragraph)
+        current.clear()
+
+    for raw in text.splitlines():
+        line = cleaned.get(raw)
+        if line is None:
+            line = _NOISE.sub("", raw) if noise else raw
+            line = cleaned[raw] = " ".join(line.split())
+
+        if not line:
+            flush()
+            continue
 
+        if dedupe:
+            folded = line.casefold()
+            if folded == previous:
+                continue
+            previous = folded
+            if len(line) >= DEDUPE_MIN_LINE_CHARS:
+                key = hash(folded)
+                if key in seen_lines:
+                    continue
+                seen_lines.add(key)
+
+        current.append(line)
+
+    flush()
+    return "\n\n".join(paragraphs)
+
+
+def clean_html(html: str) -> str:
+    """
+    Page text with whitespace normalized (no noise removal or dedup).
+    """
+    return clean_text(html_to_text(html), noise=False, dedupe=False)
+
+
+def aggressive_cleanup(text: str) -> str:
+    """
+    Remove obvious LinkedIn / web UI noise and repeated lines/paragraphs.
+    """
+    return clean_text(text)
@@ -0,0 +1,272 @@
+import re
+from typing import Optional
+
+from lxml import etree
+
+from reachly_engine.config import MAX_PROFILE_CHARS
+from reachly_engine.logger import get_logger
+
+logger = get_logger("extract")
+
+# Script payloads worth keeping (LinkedIn's embedded profile JSON).
+# Matched against lowercased text: one str.lower() per chunk is several
+# times faster than re.IGNORECASE over megabytes of script.
+PROFILE_KEYWORDS = re.compile(r"profile|experience|education|firstname|lastname")
+# Longest keyword minus one: carried over between data chunks so a match
+# split across two chunks is still found
+_KEYWORD_OVERLAP = 9
+
+_NEWLINE_RUNS = re.compile(r"\n{3,}")
+
+# Text inside these never counts as visible (BeautifulSoup's get_text rules)
+_HIDDEN_TAGS = {"script", "style", "template"}
+# Whitespace-only strings are kept verbatim inside these, and squeezed to
+# one space or newline elsewhere (also as BeautifulSoup does)
+_PRESERVE_TAGS = {"pre", "textarea"}
+_ASCII_SPACES = " \n\t\x0c\r"
+
+FEED_CHUNK_CHARS = 64 * 1024
+TRUNCATED_MARKER = "\n\n[TRUNCATED]"
+
+# Extra characters kept beyond the budget to absorb whitespace that the
+# final join/strip removes
+_SLACK = 64
+
+
+class _TextBuffer:
+    """
+    Append-only text with runs of 3+ newlines collapsed to two as it is
+    written (also across writes), so `length` is the cleaned length.
+    """
+
+    def __init__(self):
+        self.parts: list[str] = []
+        self.length = 0
+        self.leading = 0  # leading whitespace, removed by the final strip()
+        self._newlines = 0  # newline run at the end
+        self._started = False
+
+    def write(self, text: str):
+        stripped = text.lstrip("\n")
+        lead = len(text) - len(stripped)
+        if lead and self._newlines + lead >= 3:
+            text = "\n" * max(0, 2 - self._newlines) + stripped
+        text = _NEWLINE_RUNS.sub("\n\n", text)
+        if not text:
+            return
+
+        if stripped:
+            self._newlines = len(text) - len(text.rstrip("\n"))
+        else:
+            self._newlines += len(text)
+
+        if not self._started:
+            content = text.lstrip()
+            self.leading += len(text) - len(content)
+            self._started = bool(content)
+
+        self.parts.append(text)
+        self.length += len(text)
+
+    @property
+    def content_length(self) -> int:
+        return self.length - self.leading
+
+    def getvalue(self) -> str:
+        return "".join(self.parts)
+
+
+class _ProfileTarget:
+    """
+    lxml parser target: receives text in document order without building
+    a tree. Visible text strings are joined with newlines (like
+    `soup.get_text(separator="\\n")`); <script> bodies are kept when they
+    mention a profile keyword.
+    """
+
+    def __init__(self, max_chars: int):
+        self.max_chars = max_chars
+        self.visible = _TextBuffer()
+        self.scripts = _TextBuffer()
+        self.done = False
+
+        self._strings = 0
+        self._in_string = False
+        self._blank: Optional[str] = None  # open string, whitespace so far
+        self._preserve = 0
+        self._hidden: Optional[str] = None
+        self._hidden_depth = 0
+
+        self._script: Optional[_TextBuffer] = None
+        self._script_matched = False
+        self._script_tail = ""
+
+    # ---------- Events ----------
+
+    def start(self, tag, attrib):
+        self._end_string()
+        if tag in _PRESERVE_TAGS:
+            self._preserve += 1
+        if self._hidden is not None:
+            if tag == self._hidden:
+                self._hidden_depth += 1
+            return
+        if tag in _HIDDEN_TAGS:
+            self._hidden = tag
+            self._hidden_depth = 1
+            if tag == "script":
+                self._start_script()
+
+    def end(self, tag):
+        self._end_string()
+        if tag in _PRESERVE_TAGS and self._preserve:
+            self._preserve -= 1
+        if self._hidden is None or tag != self._hidden:
+            return
+        self._hidden_depth -= 1
+        if self._hidden_depth == 0:
+            if tag == "script":
+                self._end_script()
+            self._hidden = None
+
+    def data(self, text):
+        if self.done:
+            return
+        if self._hidden == "script":
+            self._script_data(text)
+        elif self._hidden is None:
+            self._visible_data(text)
+
+    def comment(self, text):
+        self._end_string()
+
+    def pi(self, target, data=None):
+        self._end_string()
+
+    def doctype(self, *args):
+        pass
+
+    def close(self):
+        self._end_string()
+
+    # ---------- Visible text ----------
+
+    def _begin_string(self):
+        if self._strings:
+            self.visible.write("\n")
+        self._strings += 1
+
+    def _end_string(self):
+        if self._in_string and self._blank is not None and not self.done:
+            self._begin_string()
+            self.visible.write("\n" if "\n" in self._blank else " ")
+        self._in_string = False
+        self._blank = None
+
+    def _visible_data(self, text: str):
+        if not self._in_string:
+            self._in_string = True
+            self._blank = "" if not self._preserve else None
+            if self._blank is None:
+                self._begin_string()
+
+        if self._blank is not None:
+            if not text.strip(_ASCII_SPACES):
+                self._blank += text
+                return
+            self._begin_string()
+            self.visible.write(self._blank)
+            self._blank = None
+
+        self.visible.write(text)
+
+        # Everything after this point would be cut off anyway
+        if self.visible.content_length > self.max_chars + _SLACK:
+            self.done = True
+
+    # ---------- Scripts ----------
+
+    def _script_budget(self) -> int:
+        used = self.visible.content_length + self.scripts.length
+        return self.max_chars + _SLACK - used
+
+    def _start_script(self):
+        self._script_matched = False
+        self._script_tail = ""
+        self._script = _TextBuffer() if self._script_budget() > 0 else None
+
+    def _script_data(self, text: str):
+        if not self._script_matched:
+            window = self._script_tail + text.lower()
+            self._script_matched = PROFILE_KEYWORDS.search(window) is not None
+            self._script_tail = window[-_KEYWORD_OVERLAP:]
+
+        script = self._script
+        if script is not None and script.length <= self._script_budget():
+            script.write(text)
+
+    def _end_script(self):
+        if self._script is not None and self._script_matched:
+            self.scripts.write("\n\n")
+            self.scripts.write(self._script.getvalue())
+        self._script = None
+
+
+def _extract(html: str, max_chars: int) -> _ProfileTarget:
+    target = _ProfileTarget(max_chars)
+    parser = etree.HTMLParser(target=target, recover=True)
+
+    for offset in range(0, len(html), FEED_CHUNK_CHARS):
+        parser.feed(html[offset : offset + FEED_CHUNK_CHARS])
+        if target.done:
+            logger.debug(f"Budget filled after {offset + FEED_CHUNK_CHARS} chars")
+            break
+
+    try:
+        parser.close()
+    except etree.XMLSyntaxError:
+        pass  # truncated document after an early stop
+
+    return target
+
+
+def extract_profile_text(html: str, max_chars: int = MAX_PROFILE_CHARS) -> str:
+    """
+    Visible text plus the profile JSON embedded in <script> tags, cleaned
+    and cut to `max_chars`, in one streaming pass over the HTML.
+
+    Same output as parsing the page with BeautifulSoup, joining
+    `get_text()` with every keyword-matching script and truncating, but
+    without building a DOM, lowercasing each script body once per
+    keyword or materialising text past the budget; parsing stops once
+    the visible text alone fills it.
+    """
+    if not html:
+        return ""
+
+    target = _extract(html, max_chars)
+    text = target.visible.getvalue() + target.scripts.getvalue()
+    text = _NEWLINE_RUNS.sub("\n\n", text).strip()
+
+    if len(text) > max_chars:
+        text = text[:max_chars] + TRUNCATED_MARKER
+
+    return text
+
+
+def extract_profile_parts(
+    html: str, max_chars: int = MAX_PROFILE_CHARS
+) -> tuple[str, str]:
+    """
+    extract_profile_text's two halves, visible text and script payloads,
+    kept apart so page-text cleanup never runs over the JSON. Together
+    they stay near `max_chars`, but neither is cut.
+    """
+    if not html:
+        return "", ""
+
+    target = _extract(html, max_chars)
+    return (
+        target.visible.getvalue().strip(),
+        _NEWLINE_RUNS.sub("\n\n", target.scripts.getvalue()).strip(),
+    )
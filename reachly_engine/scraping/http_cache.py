@@ -0,0 +1,329 @@
+import hashlib
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+from urllib.parse import urlsplit
+
+import requests
+
+from reachly_engine.config import (
+    HTTP_CACHE_ENABLED,
+    HTTP_CACHE_PATH,
+    HTTP_CACHE_MAX_BYTES,
+    SCRAPE_OFFLINE,
+)
+from reachly_engine.logger import get_logger
+from reachly_engine.scraping.session import get_session
+from reachly_engine.scraping.urls import canonicalize_url
+
+logger = get_logger("http_cache")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    url TEXT PRIMARY KEY,
+    body BLOB NOT NULL,
+    encoding TEXT,
+    etag TEXT,
+    last_modified TEXT,
+    size INTEGER NOT NULL,
+    fetched_at REAL NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_pages_last_access ON pages(last_access);
+"""
+
+COMPRESS_LEVEL = 6
+
+# "Too many requests", and LinkedIn's own "request denied" throttle code
+# (999 is below 400, so raise_for_status() lets it through)
+RATE_LIMIT_STATUS = {429, 999}
+
+# Where LinkedIn sends visitors it will not show a profile to (the
+# redirect target still answers 200)
+AUTHWALL_PATHS = ("/authwall", "/login", "/uas/login", "/checkpoint")
+
+
+@dataclass
+class CachedPage:
+    url: str
+    body: bytes
+    encoding: Optional[str]
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fetched_at: float
+
+    @property
+    def text(self) -> str:
+        return self.body.decode(self.encoding or "utf-8", errors="replace")
+
+    def age(self, now: Optional[float] = None) -> float:
+        return (now or time.time()) - self.fetched_at
+
+    def validators(self) -> dict:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class HttpCache:
+    """
+    On-disk cache of fetched pages (SQLite, zlib-compressed bodies) keyed
+    by canonical URL, with size-bounded LRU eviction.
+    """
+
+    def __init__(
+        self,
+        path: Path = HTTP_CACHE_PATH,
+        max_bytes: int = HTTP_CACHE_MAX_BYTES,
+    ):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    # ---------- Lookup ----------
+
+    def get(self, url: str) -> Optional[CachedPage]:
+        with self._lock:
+            row = self._conn.execute(
+                """
+                SELECT body, encoding, etag, last_modified, fetched_at
+                FROM pages WHERE url = ?
+                """,
+                (url,),
+            ).fetchone()
+
+            if not row:
+                return None
+
+            self._conn.execute(
+                "UPDATE pages SET last_access = ? WHERE url = ?",
+                (time.time(), url),
+            )
+            self._conn.commit()
+
+        body, encoding, etag, last_modified, fetched_at = row
+        return CachedPage(
+            url=url,
+            body=zlib.decompress(body),
+            encoding=encoding,
+            etag=etag,
+            last_modified=last_modified,
+            fetched_at=fetched_at,
+        )
+
+    def put(self, url: str, response: requests.Response):
+        now = time.time()
+        body = zlib.compress(response.content, COMPRESS_LEVEL)
+
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO pages
+                (url, body, encoding, etag, last_modified, size, fetched_at, last_access)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    url,
+                    body,
+                    response.encoding or response.apparent_encoding,
+                    response.headers.get("ETag"),
+                    response.headers.get("Last-Modified"),
+                    len(body),
+                    now,
+                    now,
+                ),
+            )
+            self._evict()
+            self._conn.commit()
+
+    def touch(self, url: str):
+        """
+        A 304 revalidated the stored copy: it is fresh again.
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "UPDATE pages SET fetched_at = ?, last_access = ? WHERE url = ?",
+                (now, now, url),
+            )
+            self._conn.commit()
+
+    def record(self, outcome: str):
+        """
+        Count a lookup outcome: "hits", "revalidated" or "misses".
+        """
+        with self._lock:
+            setattr(self, outcome, getattr(self, outcome) + 1)
+
+    # ---------- Maintenance ----------
+
+    def _evict(self):
+        total = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM pages"
+        ).fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        rows = self._conn.execute(
+            "SELECT url, size FROM pages ORDER BY last_access ASC"
+        )
+        victims = []
+        for url, size in rows:
+            if total <= self.max_bytes:
+                break
+            victims.append((url,))
+            total -= size
+
+        self._conn.executemany("DELETE FROM pages WHERE url = ?", victims)
+        self.evictions += len(victims)
+        logger.info(f"Evicted {len(victims)} cached pages")
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM pages")
+            self._conn.commit()
+
+    def stats(self) -> dict:
+        with self._lock:
+            count, total = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM pages"
+            ).fetchone()
+
+        lookups = self.hits + self.revalidated + self.misses
+        return {
+            "entries": count,
+            "bytes": total,
+            "hits": self.hits,
+            "revalidated": self.revalidated,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": (self.hits + self.revalidated) / lookups if lookups else 0.0,
+        }
+
+
+_cache: Optional[HttpCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_http_cache() -> Optional[HttpCache]:
+    """
+    Process-wide page cache, or None when HTTP_CACHE is off.
+    """
+    global _cache
+
+    if not HTTP_CACHE_ENABLED:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = HttpCache()
+        return _cache
+
+
+def close_http_cache():
+    global _cache
+
+    with _cache_lock:
+        if _cache is not None:
+            _cache.close()
+            _cache = None
+
+
+def cache_key(url: str, headers: dict) -> str:
+    """
+    Canonical URL, marked with a short hash of the request's cookie: a
+    page is only served to fetches made as the same account (or, with no
+    cookie, anonymously). Canonical URLs have no fragment, so the mark
+    cannot clash.
+    """
+    key = canonicalize_url(url) or url
+    cookie = next(
+        (value for name, value in headers.items() if name.lower() == "cookie"), None
+    )
+    if cookie:
+        key += "#auth-" + hashlib.sha256(cookie.encode("utf-8")).hexdigest()[:12]
+    return key
+
+
+def is_authwall(response: requests.Response) -> bool:
+    """
+    The request was redirected to a sign-in page instead of the content.
+    """
+    path = urlsplit(response.url or "").path
+    return any(path.startswith(prefix) for prefix in AUTHWALL_PATHS)
+
+
+def cached_get(
+    url: str,
+    headers: dict,
+    timeout: float,
+    max_age: float,
+    cache: Optional[HttpCache] = None,
+    offline: bool = SCRAPE_OFFLINE,
+) -> str:
+    """
+    Page text for `url`: from the cache while younger than `max_age`
+    seconds, otherwise a conditional GET that reuses the stored body on
+    304. With `offline`, only the cache is consulted (any age) and a
+    miss raises RuntimeError. HTTP errors and rate limits
+    (RATE_LIMIT_STATUS) raise requests.HTTPError carrying the response.
+    Only plain 200 pages are stored, never a sign-in page.
+    """
+    cache = cache if cache is not None else get_http_cache()
+    key = cache_key(url, headers)
+    cached = cache.get(key) if cache is not None else None
+
+    if cached is not None and (offline or cached.age() < max_age):
+        cache.record("hits")
+        logger.info(f"Page cache hit ({cached.age() / 3600:.1f}h old): {key}")
+        return cached.text
+
+    if offline:
+        raise RuntimeError(f"Not in page cache (offline mode): {key}")
+
+    request_headers = dict(headers)
+    if cached is not None:
+        request_headers.update(cached.validators())
+
+    resp = get_session().get(url, headers=request_headers, timeout=timeout)
+
+    if resp.status_code == 304 and cached is not None:
+        cache.touch(key)
+        cache.record("revalidated")
+        logger.info(f"Page not modified: {key}")
+        return cached.text
+
+    if resp.status_code in RATE_LIMIT_STATUS:
+        raise requests.HTTPError(
+            f"{resp.status_code} Rate limited for url: {url}", response=resp
+        )
+    resp.raise_for_status()
+
+    if cache is None:
+        return resp.text
+
+    cache.record("misses")
+    if is_authwall(resp):
+        logger.warning(f"Redirected to a sign-in page, not cached: {key}")
+    elif resp.status_code == 200:
+        cache.put(key, resp)
+    return resp.text
@@ -1,8 +1,10 @@
 import re
-import requests
+import uuid
 from pathlib import Path
 from datetime import datetime
-from bs4 import BeautifulSoup
+from typing import Optional
+from urllib.parse import urlsplit
+
 from reachly_engine.auth.store import load_linkedin_cookie
 
 from reachly_engine.config import (
@@ -10,15 +12,19 @@ from reachly_engine.config import (
     LINKEDIN_COOKIE,
     PROFILES_DIR,
     MAX_PROFILE_CHARS,
+    HTTP_CACHE_LINKEDIN_MAX_AGE,
 )
 from reachly_engine.logger import get_logger
-from reachly_engine.scraping.cleaner import clean_html, aggressive_cleanup
+from reachly_engine.models.profile import Profile
+from reachly_engine.scraping.cleaner import clean_text
+from reachly_engine.scraping.extract import extract_profile_parts, TRUNCATED_MARKER
+from reachly_engine.scraping.linkedin_json import parse_linkedin_profile
+from reachly_engine.scraping.http_cache import cached_get
+from reachly_engine.scraping.urls import canonicalize_url
 
 logger = get_logger("linkedin_scraper")
 
 
-from reachly_engine.auth.store import load_linkedin_cookie
-
 def _build_headers() -> dict:
     headers = {
         "User-Agent": USER_AGENT,
@@ -33,62 +39,64 @@ def _build_headers() -> dict:
 
 
 
-def fetch_linkedin_profile_text(url: str) -> str:
+def _fetch_html(url: str) -> str:
     headers = _build_headers()
     logger.info(f"Fetching LinkedIn profile: {url}")
 
     try:
-        resp = requests.get(url, headers=headers, timeout=25)
-        resp.raise_for_status()
+        return cached_get(
+            url, headers=headers, timeout=25, max_age=HTTP_CACHE_LINKEDIN_MAX_AGE
+        )
     except Exception as e:
         logger.error(f"LinkedIn fetch failed: {e}")
         raise RuntimeError("Failed to fetch LinkedIn profile") from e
 
-    html = resp.text
-
-    # --- IMPORTANT ---
-    # LinkedIn stores profile data inside JSON in <script> tags.
-    # We must NOT remove scripts here.
-    soup = BeautifulSoup(html, "lxml")
-
-    texts = []
-
-    # 1. Visible text
-    texts.append(soup.get_text(separator="\n"))
-
-    # 2. Script JSON payloads (critical)
-    for script in soup.find_all("script"):
-        content = script.string or ""
 
-        if (
-            "profile" in content.lower()
-            or "experience" in content.lower()
-            or "education" in content.lower()
-            or "firstname" in content.lower()
-            or "lastname" in content.lower()
-        ):
-            texts.append(content)
-
-
-    combined_text = "\n\n".join(texts)
+def profile_text(html: str, max_chars: int = MAX_PROFILE_CHARS) -> str:
+    """
+    Cleaned profile text: UI noise and the repeated nav / experience
+    blocks dropped before the cut to `max_chars`. Extraction reads twice
+    the budget so the cut still lands near `max_chars` after dedup. The
+    embedded JSON is only whitespace-normalized: noise rules are for page
+    text, not for the values inside it.
+    """
+    visible, scripts = extract_profile_parts(html, max_chars=max_chars * 2)
+    text = "\n\n".join(
+        part
+        for part in (clean_text(visible), clean_text(scripts, noise=False))
+        if part
+    )
+    if len(text) > max_chars:
+        text = text[:max_chars] + TRUNCATED_MARKER
+    return text
 
-    # Light cleanup only
-    combined_text = re.sub(r"\n{3,}", "\n\n", combined_text)
-    combined_text = combined_text.strip()
 
-    if len(combined_text) > MAX_PROFILE_CHARS:
-        combined_text = combined_text[:MAX_PROFILE_CHARS] + "\n\n[TRUNCATED]"
+def fetch_linkedin_profile_text(url: str) -> str:
+    # LinkedIn stores profile data inside JSON in <script> tags, so those
+    # are kept alongside the visible text
+    return profile_text(_fetch_html(url))
 
-    return combined_text
 
+def fetch_linkedin_profile(url: str) -> Profile:
+    """
+    Profile with name, headline, positions and education decoded from the
+    page's embedded JSON, plus the extracted page text as `raw_text`.
+    """
+    html = _fetch_html(url)
+    text = profile_text(html)
+    return parse_linkedin_profile(html, raw_text=text, url=url)
 
 
-def save_profile_text(text: str, source: str = "linkedin") -> Path:
+def save_profile_text(
+    text: str, source: str = "linkedin", url: Optional[str] = None
+) -> Path:
     """
-    Persist raw profile text for traceability.
+    Persist raw profile text for traceability. The name carries the
+    profile's slug (or a random suffix without a URL), so profiles saved
+    within the same second do not overwrite each other.
     """
     timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-    filename = f"{source}_{timestamp}.txt"
+    filename = f"{source}_{timestamp}_{_file_slug(url)}.txt"
     path = PROFILES_DIR / filename
 
     path.write_text(text, encoding="utf-8")
@@ -96,3 +104,12 @@ def save_profile_text(text: str, source: str = "linkedin") -> Path:
     logger.info(f"Profile text saved: {path}")
     return path
 
+
+def _file_slug(url: Optional[str]) -> str:
+    if url:
+        last = urlsplit(canonicalize_url(url) or url).path.rstrip("/")
+        slug = re.sub(r"[^a-z0-9_-]+", "-", last.rsplit("/", 1)[-1].lower())
+        slug = slug.strip("-")[:64]
+        if slug:
+            return slug
+    return uuid.uuid4().hex[:8]
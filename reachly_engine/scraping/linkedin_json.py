@@ -0,0 +1,262 @@
+"""
+Structured parsing of the JSON LinkedIn embeds in its profile pages.
+
+Logged-in profile pages carry Voyager API responses in hidden
+<code> elements (usually wrapped in an HTML comment) or JSON <script>
+tags. Each has an "included" list of normalized entities, typed by
+"$type": the profile itself, its positions and its education (plus
+entities of other members the page mentions). Older
+("identity.profile.Position", timePeriod/startDate) and newer
+("dash.identity.profile.Position", dateRange/start) shapes are both read.
+"""
+import json
+import re
+from typing import Iterator, Optional
+
+from lxml import etree
+
+from reachly_engine.logger import get_logger
+from reachly_engine.models.profile import Education, Position, Profile
+
+logger = get_logger("linkedin_json")
+
+FEED_CHUNK_CHARS = 64 * 1024
+
+# Elements whose text may hold an API payload
+_PAYLOAD_TAGS = {"code", "script"}
+
+_PUBLIC_ID = re.compile(r"linkedin\.com/in/([^/?#]+)", re.IGNORECASE)
+# Profile key inside a position / education URN:
+# "urn:li:fsd_position:(ACoAAB...,1234)" -> "ACoAAB..."
+_URN_OWNER = re.compile(r":\(([^,()]+),")
+
+
+class _PayloadTarget:
+    """
+    lxml parser target collecting the text (and comments) of <code> and
+    <script> elements that look like JSON with included entities.
+    """
+
+    def __init__(self):
+        self.payloads: list[str] = []
+        self._parts: Optional[list[str]] = None
+
+    def start(self, tag, attrib):
+        if tag in _PAYLOAD_TAGS:
+            self._parts = []
+
+    def end(self, tag):
+        if tag in _PAYLOAD_TAGS and self._parts is not None:
+            text = "".join(self._parts).strip()
+            if text.startswith("{") and '"included"' in text:
+                self.payloads.append(text)
+            self._parts = None
+
+    def data(self, text):
+        if self._parts is not None:
+            self._parts.append(text)
+
+    def comment(self, text):
+        if self._parts is not None:
+            self._parts.append(text)
+
+    def close(self):
+        return self.payloads
+
+
+def iter_included(html: str) -> Iterator[dict]:
+    """
+    Every entity of every embedded payload, in page order.
+    """
+    if not html:
+        return
+
+    target = _PayloadTarget()
+    parser = etree.HTMLParser(target=target, recover=True)
+    for offset in range(0, len(html), FEED_CHUNK_CHARS):
+        parser.feed(html[offset : offset + FEED_CHUNK_CHARS])
+    parser.close()
+
+    for payload in target.payloads:
+        try:
+            data = json.loads(payload)
+        except json.JSONDecodeError as e:
+            logger.debug(f"Skipping undecodable payload: {e}")
+            continue
+
+        for entity in data.get("included") or []:
+            if isinstance(entity, dict):
+                yield entity
+
+
+def _entity_type(entity: dict) -> str:
+    # "com.linkedin.voyager.dash.identity.profile.Position" -> "Position"
+    return str(entity.get("$type", "")).rsplit(".", 1)[-1]
+
+
+def _text(value) -> Optional[str]:
+    if isinstance(value, dict):
+        # Localized values: {"text": ...} or {"en_US": ...}
+        value = value.get("text") or next(iter(value.values()), None)
+    if not isinstance(value, str):
+        return None
+    value = value.strip()
+    return value or None
+
+
+def _date(value) -> Optional[str]:
+    if not isinstance(value, dict) or not value.get("year"):
+        return None
+    if value.get("month"):
+        return f"{value['year']}-{int(value['month']):02d}"
+    return str(value["year"])
+
+
+def _period(entity: dict) -> tuple[Optional[str], Optional[str]]:
+    period = entity.get("dateRange") or entity.get("timePeriod") or {}
+    start = period.get("start") or period.get("startDate")
+    end = period.get("end") or period.get("endDate")
+    return _date(start), _date(end)
+
+
+def _position(entity: dict) -> Position:
+    start, end = _period(entity)
+    return Position(
+        title=_text(entity.get("title")),
+        company=_text(entity.get("companyName")),
+        location=_text(entity.get("locationName")),
+        start=start,
+        end=end,
+        description=_text(entity.get("description")),
+    )
+
+
+def _education(entity: dict) -> Education:
+    start, end = _period(entity)
+    return Education(
+        school=_text(entity.get("schoolName")),
+        degree=_text(entity.get("degreeName")),
+        field=_text(entity.get("fieldOfStudy")),
+        start=start,
+        end=end,
+    )
+
+
+def _pick_profile(candidates: list[dict], url: Optional[str]) -> Optional[dict]:
+    """
+    The page owner's entity: the one whose publicIdentifier is in the URL,
+    otherwise the most complete one (mini profiles of other people only
+    carry a name and a headline).
+    """
+    if not candidates:
+        return None
+
+    match = _PUBLIC_ID.search(url or "")
+    if match:
+        wanted = match.group(1).lower()
+        for entity in candidates:
+            if str(entity.get("publicIdentifier", "")).lower() == wanted:
+                return entity
+
+    return max(candidates, key=lambda e: sum(1 for v in e.values() if v))
+
+
+def _urn_id(urn) -> Optional[str]:
+    # "urn:li:fsd_profile:ACoAAB..." -> "ACoAAB..."
+    if not isinstance(urn, str) or not urn.startswith("urn:"):
+        return None
+    return urn.rsplit(":", 1)[-1] or None
+
+
+def _owner_key(entity: dict) -> Optional[str]:
+    """
+    Key of the profile a position / education entity belongs to: from its
+    profile reference, else from its own URN. None when it names neither.
+    """
+    for field in ("profileUrn", "*profile", "*profileUrn"):
+        key = _urn_id(entity.get(field))
+        if key:
+            return key
+    match = _URN_OWNER.search(str(entity.get("entityUrn", "")))
+    return match.group(1) if match else None
+
+
+def _owned_by(owner: dict, entities: list[dict]) -> list[dict]:
+    """
+    The entities of the page owner. "People also viewed" and similar
+    sections put other members' positions in the same payload; those name
+    another profile key and are dropped. Entities without any owner
+    reference are kept (nothing to tell them apart by).
+    """
+    keys = {_urn_id(owner.get("entityUrn")), owner.get("publicIdentifier")}
+    keys.discard(None)
+    if not keys:
+        return entities
+    return [e for e in entities if _owner_key(e) in keys or _owner_key(e) is None]
+
+
+def _dedupe(items: list, key) -> list:
+    seen = set()
+    unique = []
+    for item in items:
+        k = key(item)
+        if k not in seen and any(k):
+            seen.add(k)
+            unique.append(item)
+    return unique
+
+
+def parse_linkedin_profile(
+    html: str, raw_text: str, url: Optional[str] = None
+) -> Profile:
+    """
+    Profile with the structured fields filled from the embedded entities
+    (left empty when the page has none). `raw_text` is the extracted page
+    text, kept as the fallback prompt and for traceability.
+    """
+    profiles, positions, education = [], [], []
+
+    for entity in iter_included(html):
+        kind = _entity_type(entity)
+        if kind == "Profile" and (entity.get("firstName") or entity.get("lastName")):
+            profiles.append(entity)
+        elif kind == "Position":
+            positions.append(entity)
+        elif kind == "Education":
+            education.append(entity)
+
+    owner = _pick_profile(profiles, url) or {}
+
+    positions = [_position(e) for e in _owned_by(owner, positions)]
+    positions = _dedupe(positions, Position.key)
+    # Current roles first, then most recent start
+    positions.sort(key=lambda p: (p.end is None, p.start or ""), reverse=True)
+    education = [_education(e) for e in _owned_by(owner, education)]
+    education = _dedupe(education, Education.key)
+
+    name = " ".join(
+        n for n in (_text(owner.get("firstName")), _text(owner.get("lastName"))) if n
+    )
+    current = positions[0] if positions else None
+
+    profile = Profile(
+        source="linkedin",
+        source_url=url,
+        name=name or None,
+        role=current.title if current else None,
+        company=current.company if current else None,
+        industry=_text(owner.get("industryName")),
+        headline=_text(owner.get("headline")),
+        about=_text(owner.get("summary")),
+        location=_text(owner.get("geoLocationName") or owner.get("locationName")),
+        positions=positions,
+        education=education,
+        raw_text=raw_text,
+    )
+
+    if profile.structured:
+        logger.info(
+            f"Parsed profile JSON: {len(positions)} positions, "
+            f"{len(education)} education entries"
+        )
+    return profile
@@ -0,0 +1,44 @@
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from reachly_engine.config import SCRAPE_CONCURRENCY
+from reachly_engine.logger import get_logger
+
+logger = get_logger("http_session")
+
+_session: Optional[requests.Session] = None
+_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """
+    Process-wide requests.Session: keep-alive connections are reused
+    across fetches, with enough pooled connections per host for the bulk
+    ingestion workers. Headers are passed per request (the LinkedIn
+    cookie can change after authentication).
+    """
+    global _session
+
+    with _lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=8,
+                pool_maxsize=max(SCRAPE_CONCURRENCY, 1),
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session = session
+        return _session
+
+
+def close_session():
+    global _session
+
+    with _lock:
+        if _session is not None:
+            _session.close()
+            _session = None
@@ -0,0 +1,50 @@
+import re
+from typing import Optional
+from urllib.parse import parse_qsl, unquote, urlencode, urlsplit, urlunsplit
+
+_TRACKING_PARAMS = {"trk", "trackingid", "lipi", "midtoken", "midsig", "originalsubdomain"}
+
+_LINKEDIN_PROFILE_PATH = re.compile(r"^/in/([^/]+)", re.IGNORECASE)
+
+
+def canonicalize_url(url: str) -> Optional[str]:
+    """
+    One spelling per page: https, lowercase host, no fragment or tracking
+    parameters. LinkedIn profile URLs reduce to
+    https://www.linkedin.com/in/<slug>/ whatever the subdomain, query or
+    trailing path. Returns None for things that are not URLs.
+    """
+    url = url.strip()
+    if not url:
+        return None
+    if "://" not in url:
+        url = "https://" + url
+
+    parts = urlsplit(url)
+    host = (parts.hostname or "").lower()
+    if not host or "." not in host:
+        return None
+
+    if host == "linkedin.com" or host.endswith(".linkedin.com"):
+        match = _LINKEDIN_PROFILE_PATH.match(parts.path)
+        if match:
+            slug = unquote(match.group(1)).lower()
+            return f"https://www.linkedin.com/in/{slug}/"
+        host = "www.linkedin.com"
+
+    scheme = "http" if parts.scheme.lower() == "http" else "https"
+    netloc = host
+    if parts.port and parts.port != {"http": 80, "https": 443}[scheme]:
+        netloc = f"{host}:{parts.port}"
+
+    query = urlencode(
+        sorted(
+            (k, v)
+            for k, v in parse_qsl(parts.query, keep_blank_values=True)
+            if not k.lower().startswith("utm_")
+            and k.lower() not in _TRACKING_PARAMS
+        )
+    )
+    path = parts.path.rstrip("/") or "/"
+
+    return urlunsplit((scheme, netloc, path, query, ""))
@@ -1,8 +1,7 @@
-import requests
-
-from reachly_engine.config import USER_AGENT
+from reachly_engine.config import USER_AGENT, HTTP_CACHE_WEB_MAX_AGE
 from reachly_engine.logger import get_logger
-from reachly_engine.scraping.cleaner import clean_html, aggressive_cleanup
+from reachly_engine.scraping.cleaner import html_to_text, clean_text
+from reachly_engine.scraping.http_cache import cached_get
 
 logger = get_logger("web_scraper")
 
@@ -15,12 +14,12 @@ def fetch_web_text(url: str, timeout: int = 20) -> str:
     logger.info(f"Fetching web page: {url}")
 
     try:
-        resp = requests.get(url, headers=headers, timeout=timeout)
-        resp.raise_for_status()
+        html = cached_get(
+            url, headers=headers, timeout=timeout, max_age=HTTP_CACHE_WEB_MAX_AGE
+        )
     except Exception as e:
         logger.error(f"Failed to fetch {url}: {e}")
         raise RuntimeError(f"Failed to fetch URL: {url}") from e
 
-    cleaned = clean_html(resp.text)
-    return aggressive_cleanup(cleaned)
+    return clean_text(html_to_text(html))
 
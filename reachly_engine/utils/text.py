@@ -1,18 +1,22 @@
-import re
-
-
 def normalize_text(text: str) -> str:
     """
-    Normalize whitespace and line breaks.
+    Normalize whitespace and line breaks in one pass over the lines:
+    runs of spaces collapsed, lines stripped, at most one blank line.
     """
     if not text:
         return ""
 
-    text = text.replace("\r\n", "\n")
-    text = re.sub(r"[ \t]+", " ", text)
-    text = re.sub(r"\n{3,}", "\n\n", text)
-
-    return text.strip()
+    lines = []
+    blank = False
+    for line in text.splitlines():
+        line = " ".join(line.split())
+        if line:
+            if blank and lines:
+                lines.append("")
+            lines.append(line)
+        blank = not line
+
+    return "\n".join(lines)
 
 
 def safe_snippet(text: str, max_chars: int = 500) -> str:
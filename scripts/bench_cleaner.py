@@ -0,0 +1,142 @@
+"""
+Benchmark: text cleaning, multi-pass regexes vs the single-pass cleaner.
+
+"legacy" is the previous clean_html + aggressive_cleanup: a whitespace
+pass over the page text, nine noise re.sub passes, then another
+whitespace pass. "single-pass" is reachly_engine.scraping.cleaner
+(html_to_text + clean_text): one combined noise pattern per line,
+whitespace normalized in the same loop, repeated lines and paragraphs
+dropped by hash.
+
+Timings cover the text passes only (the HTML is parsed once up front).
+Input comes from --pages (saved *.html files) or synthetic profile-like
+text with the nav, sidebar and experience blocks repeated the way
+LinkedIn renders them.
+
+Usage:
+    python scripts/bench_cleaner.py [--pages DIR] [--blocks 200] [--repeat 5]
+"""
+import argparse
+import os
+import random
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# --- ensure project root is on PYTHONPATH ---
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+# -------------------------------------------
+
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+from reachly_engine.scraping.cleaner import html_to_text, clean_text
+
+LEGACY_NOISE = [
+    r"Sign in.*",
+    r"Join LinkedIn.*",
+    r"LinkedIn Member",
+    r"See more",
+    r"Show less",
+    r"Followers?\s*\d+",
+    r"Connections?\s*\d+",
+    r"Message",
+    r"Connect",
+]
+
+
+def legacy_clean(text: str) -> str:
+    text = re.sub(r"\n{2,}", "\n\n", text)
+    text = re.sub(r"[ \t]+", " ", text)
+    text = text.strip()
+
+    for pattern in LEGACY_NOISE:
+        text = re.sub(pattern, "", text, flags=re.IGNORECASE)
+
+    text = re.sub(r"\n{2,}", "\n\n", text)
+    return text.strip()
+
+
+def synthetic_text(blocks: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    words = (
+        "senior engineer data platform growth analytics lead team product "
+        "fintech payments remote hiring scaling"
+    ).split()
+
+    def sentence(n: int) -> str:
+        return " ".join(rng.choice(words) for _ in range(n))
+
+    nav = "Home\n  My Network  \nJobs\nMessaging\nNotifications\n\n\n"
+    sidebar = "\n".join(
+        f"People also viewed\n{sentence(2)}\n{sentence(6)}\nConnect\n"
+        for _ in range(5)
+    )
+    positions = [
+        f"{sentence(3)}\n{sentence(3)} · Full-time\n2019 - Present · 5 yrs\n"
+        f"{sentence(25)}\n...see more\n"
+        for _ in range(8)
+    ]
+
+    parts = []
+    for i in range(blocks):
+        parts.append(nav)
+        parts.append(f"Ada Lovelace\nAda Lovelace\n{sentence(8)}\t\t\n")
+        parts.append("Followers 1204   Connections 500\nMessage   Connect\n\n")
+        # The same experience entries are rendered several times over
+        parts.append(positions[i % len(positions)])
+        parts.append(positions[i % len(positions)])
+        parts.append("\n\n")
+        if i % 10 == 0:
+            parts.append(sidebar)
+    return "".join(parts)
+
+
+def measure(fn, text: str, repeat: int) -> tuple[float, str]:
+    times = []
+    result = ""
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(text)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times), result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=Path, default=None, help="dir of *.html")
+    parser.add_argument("--blocks", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    if args.pages:
+        inputs = [
+            (p.name, html_to_text(p.read_text(encoding="utf-8", errors="replace")))
+            for p in sorted(args.pages.glob("*.html"))
+        ]
+        if not inputs:
+            sys.exit(f"No *.html files in {args.pages}")
+    else:
+        inputs = [(f"synthetic-{args.blocks}", synthetic_text(args.blocks))]
+
+    print(f"{'input':<22} {'chars in':>9} {'path':<12} {'median ms':>10} "
+          f"{'chars out':>10}")
+
+    for name, text in inputs:
+        legacy_s, legacy_out = measure(legacy_clean, text, args.repeat)
+        new_s, new_out = measure(clean_text, text, args.repeat)
+
+        for label, seconds, out in (
+            ("legacy", legacy_s, legacy_out),
+            ("single-pass", new_s, new_out),
+        ):
+            print(f"{name:<22} {len(text):>9} {label:<12} "
+                  f"{seconds * 1000:>10.2f} {len(out):>10}")
+        print(f"{'':<22} {'':>9} {'speedup':<12} {legacy_s / new_s:>9.1f}x "
+              f"{len(legacy_out) / max(len(new_out), 1):>9.1f}x shorter")
+
+
+if __name__ == "__main__":
+    main()
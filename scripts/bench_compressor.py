@@ -0,0 +1,102 @@
+"""
+Benchmark: profile compression vs plain truncation.
+
+Synthetic profiles of growing length (long About, many positions,
+education, then a long activity feed) are fitted into the same token
+budget two ways: "truncate" is the old head cut (truncate_to_tokens), as
+the client did when a profile was too long; "compress" is
+reachly_engine.analysis.compressor.compress_profile.
+
+For each it reports the prompt tokens, how many of the facts a persona
+needs survived (headline, current role, positions, education) and the
+time taken. Tokens are the chars/token estimate.
+
+Usage:
+    python scripts/bench_compressor.py [--budget 1500] [--positions 4,12,30]
+                                       [--repeat 5]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# --- ensure project root is on PYTHONPATH ---
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+# -------------------------------------------
+
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+from reachly_engine.analysis.compressor import compress_profile
+from reachly_engine.llm.tokenizer import estimate_tokens, truncate_to_tokens
+
+
+def synthetic_profile(positions: int) -> tuple[str, list[str]]:
+    """
+    Profile text and the facts that should reach the model.
+    """
+    facts = ["Head of Payments at PayCo", "2021 - Present"]
+    about = " ".join(
+        f"I care about reliable payment rails, team health and shipping small "
+        f"changes often, lesson {i}." for i in range(40)
+    )
+    experience = ["Head of Payments at PayCo", "2021 - Present",
+                  "Leading 40 engineers across ledger, fraud and payouts."]
+    for i in range(positions):
+        title = f"Engineering Manager at Company{i}"
+        facts.append(title)
+        experience += [title, f"{2020 - i} - {2021 - i}",
+                       f"Owned the settlement service and on-call rotation {i}."]
+    facts += ["University of London", "BSc Mathematics"]
+    activity = "\n".join(
+        f"Ada reposted: thoughts on engineering culture, part {i}" for i in range(150)
+    )
+
+    text = (
+        "Ada Lovelace\nHead of Payments at PayCo\nLondon, United Kingdom\n\n"
+        f"About\n{about}\n\n"
+        "Experience\n" + "\n".join(experience) + "\n\n"
+        "Education\nUniversity of London\nBSc Mathematics\n\n"
+        f"Activity\n{activity}"
+    )
+    return text, facts
+
+
+def measure(fn, repeat: int) -> tuple[float, str]:
+    times = []
+    result = ""
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times), result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--budget", type=int, default=1500)
+    parser.add_argument("--positions", default="4,12,30")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'positions':>9} {'tokens in':>10} {'path':<9} {'tokens':>7} "
+          f"{'facts kept':>11} {'ms':>7}")
+
+    for n in (int(x) for x in args.positions.split(",")):
+        text, facts = synthetic_profile(n)
+
+        for label, fn in (
+            ("truncate", lambda: truncate_to_tokens(text, args.budget)),
+            ("compress", lambda: compress_profile(text, args.budget)),
+        ):
+            seconds, out = measure(fn, args.repeat)
+            kept = sum(fact in out for fact in facts)
+            print(f"{n:>9} {estimate_tokens(text):>10} {label:<9} "
+                  f"{estimate_tokens(out):>7} {f'{kept}/{len(facts)}':>11} "
+                  f"{seconds * 1000:>7.2f}")
+
+
+if __name__ == "__main__":
+    main()
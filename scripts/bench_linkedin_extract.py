@@ -0,0 +1,227 @@
+"""
+Benchmark: LinkedIn profile text extraction, BeautifulSoup vs streaming.
+
+"legacy" is the previous fetch_linkedin_profile_text body: full DOM,
+get_text() of the whole page, every <script> lowercased per keyword,
+then joined and truncated. "streaming" is
+reachly_engine.scraping.extract.extract_profile_text.
+
+Pages come from --pages (saved *.html files, e.g. "Save page as" from a
+browser) or are generated: multi-megabyte pages shaped like LinkedIn's,
+with large <code>/<script> JSON blobs and lots of markup.
+
+It also reports the persona prompt size: the full extracted text, the
+text cut to MAX_PROFILE_CHARS, and the compact rendering of the Profile
+parsed from the embedded JSON.
+
+Peak memory is the Python heap (tracemalloc); libxml2's own buffers are
+not included for either path.
+
+Usage:
+    python scripts/bench_linkedin_extract.py [--pages DIR] [--sizes-mb 1,4]
+                                             [--repeat 5]
+"""
+import argparse
+import json
+import os
+import random
+import re
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+# --- ensure project root is on PYTHONPATH ---
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+# -------------------------------------------
+
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+from reachly_engine.config import MAX_PROFILE_CHARS
+from reachly_engine.scraping.extract import extract_profile_text
+from reachly_engine.scraping.linkedin_json import parse_linkedin_profile
+
+
+def legacy_extract(html: str) -> str:
+    soup = BeautifulSoup(html, "lxml")
+
+    texts = [soup.get_text(separator="\n")]
+
+    for script in soup.find_all("script"):
+        content = script.string or ""
+
+        if (
+            "profile" in content.lower()
+            or "experience" in content.lower()
+            or "education" in content.lower()
+            or "firstname" in content.lower()
+            or "lastname" in content.lower()
+        ):
+            texts.append(content)
+
+    combined_text = "\n\n".join(texts)
+    combined_text = re.sub(r"\n{3,}", "\n\n", combined_text)
+    combined_text = combined_text.strip()
+
+    if len(combined_text) > MAX_PROFILE_CHARS:
+        combined_text = combined_text[:MAX_PROFILE_CHARS] + "\n\n[TRUNCATED]"
+
+    return combined_text
+
+
+def synthetic_page(size_mb: float, seed: int = 0) -> str:
+    """
+    A LinkedIn-like page: a head full of scripts (tracking code and
+    profile JSON), then nested layout markup with short visible strings.
+    """
+    rng = random.Random(seed)
+    words = (
+        "senior engineer data platform growth analytics lead team product "
+        "fintech payments remote hiring scaling"
+    ).split()
+
+    def sentence(n: int) -> str:
+        return " ".join(rng.choice(words) for _ in range(n))
+
+    profile_json = json.dumps(
+        {
+            "data": {"entityUrn": "urn:li:fsd_profile:ACoAAA"},
+            "included": [
+                {
+                    "$type": "com.linkedin.voyager.dash.identity.profile.Profile",
+                    "entityUrn": "urn:li:fsd_profile:ACoAAA",
+                    "publicIdentifier": "ada-lovelace",
+                    "firstName": "Ada",
+                    "lastName": "Lovelace",
+                    "headline": "Senior Engineer at PayCo",
+                    "summary": sentence(60),
+                    "geoLocationName": "London",
+                }
+            ]
+            + [
+                {
+                    "$type": "com.linkedin.voyager.dash.identity.profile.Position",
+                    "entityUrn": f"urn:li:fsd_profilePosition:(ACoAAA,{i})",
+                    "companyUrn": f"urn:li:fsd_company:{1000 + i}",
+                    "title": sentence(3),
+                    "companyName": f"Company {i}",
+                    "dateRange": {"start": {"year": 2010 + i, "month": 1}},
+                    "description": sentence(40),
+                }
+                for i in range(6)
+            ]
+            + [
+                {
+                    "$type": "com.linkedin.voyager.dash.identity.profile.Profile",
+                    "entityUrn": f"urn:li:fsd_profile:ACoBBB{i}",
+                    "firstName": f"Viewer{i}",
+                    "lastName": "Also",
+                    "headline": sentence(5),
+                }
+                for i in range(200)
+            ]
+        }
+    )
+    tracking = "window.__tracking=" + json.dumps([sentence(12) for _ in range(2000)])
+
+    head = (
+        "<!DOCTYPE html><html><head><title>Ada Lovelace | LinkedIn</title>"
+        "<style>" + ".c{color:red}" * 2000 + "</style>"
+        f"<script>{tracking}</script>"
+        f'<script type="application/json">{profile_json}</script>'
+        "</head><body>"
+    )
+
+    target = int(size_mb * 1024 * 1024)
+    body: list[str] = []
+    length = len(head)
+    i = 0
+    while length < target:
+        block = (
+            f'<div class="artdeco-card pv-profile-section" id="s{i}">'
+            f'<section><div><span aria-hidden="true">{sentence(6)}</span>'
+            f'<span class="visually-hidden">{sentence(6)}</span></div>'
+            f"<ul><li><p>{sentence(15)}</p></li><li><p>{sentence(15)}</p></li></ul>"
+            "<!-- ember-view --></section></div>\n"
+        )
+        if i % 200 == 0:
+            block += f"<code><!--{profile_json[:20000]}--></code>"
+        body.append(block)
+        length += len(block)
+        i += 1
+
+    return head + "".join(body) + "</body></html>"
+
+
+def measure(fn, html: str, repeat: int) -> tuple[float, int, str]:
+    times = []
+    result = ""
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(html)
+        times.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    fn(html)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return statistics.median(times), peak, result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=Path, default=None, help="dir of *.html")
+    parser.add_argument("--sizes-mb", default="1,4")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    if args.pages:
+        pages = [
+            (p.name, p.read_text(encoding="utf-8", errors="replace"))
+            for p in sorted(args.pages.glob("*.html"))
+        ]
+        if not pages:
+            sys.exit(f"No *.html files in {args.pages}")
+    else:
+        pages = [
+            (f"synthetic-{size}mb", synthetic_page(float(size)))
+            for size in args.sizes_mb.split(",")
+        ]
+
+    print(f"{'page':<22} {'size MB':>8} {'path':<10} {'median ms':>10} "
+          f"{'peak MB':>8} {'same':>5}")
+    prompt_sizes = []
+
+    for name, html in pages:
+        size = len(html.encode("utf-8")) / 1e6
+        legacy_s, legacy_peak, expected = measure(legacy_extract, html, args.repeat)
+        new_s, new_peak, got = measure(extract_profile_text, html, args.repeat)
+
+        for label, seconds, peak in (
+            ("legacy", legacy_s, legacy_peak),
+            ("streaming", new_s, new_peak),
+        ):
+            print(
+                f"{name:<22} {size:>8.2f} {label:<10} {seconds * 1000:>10.1f} "
+                f"{peak / 1e6:>8.1f} {'' if label == 'legacy' else got == expected!s:>5}"
+            )
+        print(f"{'':<22} {'':>8} {'speedup':<10} {legacy_s / new_s:>9.1f}x")
+
+        full = extract_profile_text(html, max_chars=len(html))
+        profile = parse_linkedin_profile(html, raw_text=got)
+        prompt_sizes.append((name, len(full), len(got), len(profile.prompt_text())))
+
+    print(f"\n{'page':<22} {'full text':>10} {'truncated':>10} "
+          f"{'structured':>11} {'ratio':>6}")
+    for name, full, cut, prompt in prompt_sizes:
+        print(f"{name:<22} {full:>10} {cut:>10} {prompt:>11} "
+              f"{full / max(prompt, 1):>5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""
+Benchmark: prospect listings, full load vs keyset pages.
+
+Fills a temporary database with synthetic prospects, then times:
+
+- "full": the old listing, every row with every column the CLI table
+  needed loaded into a list of dicts, sorted by created_at without an
+  index (what the persona screens did before paging)
+- "offset": one LIMIT/OFFSET page at increasing depths, also without the
+  created_at index (the schema had none)
+- "keyset": MemoryStore.iter_prospects pages at the same depths (the
+  anchor row's id, as the CLI passes it)
+
+Reports ms per call and tracemalloc peak memory.
+
+Usage:
+    python scripts/bench_listing.py [--rows 50000] [--page 20] [--repeat 5]
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+# --- ensure project root is on PYTHONPATH ---
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+# -------------------------------------------
+
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+from reachly_engine.memory.store import MemoryStore, ProspectFilters
+
+ROLES = ["Head of Data", "VP Analytics", "Backend Engineer", "CTO", "Founder"]
+
+
+def fill(store: MemoryStore, rows: int, seed: int = 0):
+    rng = random.Random(seed)
+    for start in range(0, rows, 1000):
+        store.save_prospects(
+            dict(
+                name=f"Prospect {i}",
+                role=rng.choice(ROLES),
+                company=f"Company {i % 500}",
+                industry="fintech",
+                seniority="lead",
+                summary="Builds data platforms for payments. " * 10,
+                style="- Tone: formal",
+                raw_profile="Profile text " * 300,
+                source="bench",
+            )
+            for i in range(start, min(start + 1000, rows))
+        )
+    # Spread creation times over a year, in id order
+    with store.transaction() as conn:
+        conn.execute(
+            "UPDATE prospects SET created_at = "
+            "datetime('2025-01-01', '+' || (id * 525600 / :rows) || ' minutes')",
+            {"rows": rows},
+        )
+
+
+def full_listing(store: MemoryStore) -> list:
+    rows = store.connection().execute(
+        """
+        SELECT id, name, role, company, industry, created_at
+        FROM prospects NOT INDEXED
+        ORDER BY created_at DESC
+        """
+    ).fetchall()
+    return [dict(row) for row in rows]
+
+
+def offset_page(store: MemoryStore, offset: int, size: int) -> list:
+    rows = store.connection().execute(
+        """
+        SELECT id, name, role, company, industry, created_at
+        FROM prospects NOT INDEXED
+        ORDER BY created_at DESC, id DESC
+        LIMIT ? OFFSET ?
+        """,
+        (size, offset),
+    ).fetchall()
+    return [dict(row) for row in rows]
+
+
+def measure(fn, repeat: int) -> tuple[float, float]:
+    """
+    Median seconds and tracemalloc peak (MB) of fn().
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return statistics.median(times), peak / 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--page", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = MemoryStore(Path(tmp) / "memory.db")
+        fill(store, args.rows)
+
+        ids = [row["id"] for row in store.iter_prospects()]  # listing order
+        print(f"{args.rows} prospects, {args.page} per page\n")
+        print(f"{'listing':<24} {'ms':>9} {'peak MB':>8}")
+
+        seconds, peak = measure(lambda: full_listing(store), args.repeat)
+        print(f"{'full':<24} {seconds * 1000:>9.2f} {peak:>8.2f}")
+
+        for depth in (0, args.rows // 2, args.rows - args.page):
+            anchor = ids[depth - 1] if depth else None
+            for label, fn in (
+                ("offset", lambda: offset_page(store, depth, args.page)),
+                ("keyset", lambda: list(
+                    store.iter_prospects(after_id=anchor, limit=args.page)
+                )),
+            ):
+                seconds, peak = measure(fn, args.repeat)
+                print(f"{f'{label} @ row {depth}':<24} {seconds * 1000:>9.2f} {peak:>8.2f}")
+
+        filters = ProspectFilters(role="data", company="Company 42")
+        seconds, peak = measure(
+            lambda: list(store.iter_prospects(limit=args.page, filters=filters)),
+            args.repeat,
+        )
+        print(f"{'keyset, filtered':<24} {seconds * 1000:>9.2f} {peak:>8.2f}")
+
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
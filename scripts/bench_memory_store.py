@@ -0,0 +1,163 @@
+"""
+Benchmark: MemoryStore throughput under concurrent writers.
+
+"legacy" is the previous store: a new sqlite3 connection per call with
+the default rollback journal. "pooled" is reachly_engine.memory.store
+MemoryStore: one long-lived connection per thread, WAL, synchronous =
+NORMAL, busy timeout and a statement cache.
+
+Each writer thread inserts prospects (and a message each) while reader
+threads fetch random prospects for the same wall time. Reports inserts/s,
+reads/s and "database is locked" errors. Runs in a temporary directory.
+
+Usage:
+    python scripts/bench_memory_store.py [--writers 1,4,8] [--readers 2]
+                                         [--rows 500]
+"""
+import argparse
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# --- ensure project root is on PYTHONPATH ---
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+# -------------------------------------------
+
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+from reachly_engine.memory.store import MemoryStore
+
+SCHEMA = Path(ROOT_DIR, "reachly_engine", "memory", "schema.sql").read_text()
+
+
+class LegacyStore:
+    """
+    The old access pattern: connect, run one statement, commit, close.
+    """
+
+    def __init__(self, db_path: Path):
+        self.db_path = db_path
+        with sqlite3.connect(db_path) as conn:
+            conn.executescript(SCHEMA)
+
+    def save_prospect(self, **fields) -> int:
+        with sqlite3.connect(self.db_path) as conn:
+            cur = conn.execute(
+                f"INSERT INTO prospects ({', '.join(fields)}) "
+                f"VALUES ({', '.join('?' for _ in fields)})",
+                tuple(fields.values()),
+            )
+            conn.commit()
+            return cur.lastrowid
+
+    def save_message(self, prospect_id: int, channel: str, content: str):
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(
+                "INSERT INTO messages (prospect_id, channel, content) VALUES (?, ?, ?)",
+                (prospect_id, channel, content),
+            )
+            conn.commit()
+
+    def get_prospect(self, prospect_id: int):
+        with sqlite3.connect(self.db_path) as conn:
+            conn.row_factory = sqlite3.Row
+            row = conn.execute(
+                "SELECT * FROM prospects WHERE id = ?", (prospect_id,)
+            ).fetchone()
+        return dict(row) if row else None
+
+    def close(self):
+        pass
+
+
+def prospect(worker: int, i: int) -> dict:
+    return dict(
+        name=f"Prospect {worker}-{i}",
+        role="Head of Data",
+        company="PayCo",
+        industry="fintech",
+        seniority="lead",
+        summary="Builds data platforms for payments. " * 5,
+        style="- Tone: formal",
+        raw_profile="Profile text " * 200,
+        source="linkedin",
+    )
+
+
+def run(store, writers: int, readers: int, rows: int) -> dict:
+    counts = {"inserts": 0, "reads": 0, "locked": 0}
+    lock = threading.Lock()
+    done = threading.Event()
+
+    def count(key: str, n: int = 1):
+        with lock:
+            counts[key] += n
+
+    def write(worker: int):
+        for i in range(rows):
+            try:
+                pid = store.save_prospect(**prospect(worker, i))
+                store.save_message(pid, "email", "Hello")
+                count("inserts")
+            except sqlite3.OperationalError:
+                count("locked")
+
+    def read():
+        rng = random.Random()
+        while not done.is_set():
+            try:
+                store.get_prospect(rng.randint(1, max(counts["inserts"], 1)))
+                count("reads")
+            except sqlite3.OperationalError:
+                count("locked")
+
+    reader_threads = [threading.Thread(target=read) for _ in range(readers)]
+    writer_threads = [
+        threading.Thread(target=write, args=(w,)) for w in range(writers)
+    ]
+
+    started = time.perf_counter()
+    for t in reader_threads + writer_threads:
+        t.start()
+    for t in writer_threads:
+        t.join()
+    elapsed = time.perf_counter() - started
+    done.set()
+    for t in reader_threads:
+        t.join()
+
+    return {
+        "inserts/s": counts["inserts"] / elapsed,
+        "reads/s": counts["reads"] / elapsed,
+        "locked": counts["locked"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--writers", default="1,4,8")
+    parser.add_argument("--readers", type=int, default=2)
+    parser.add_argument("--rows", type=int, default=500, help="per writer")
+    args = parser.parse_args()
+
+    print(f"{'writers':>7} {'store':<7} {'inserts/s':>10} {'reads/s':>10} "
+          f"{'locked':>7}")
+
+    for writers in (int(w) for w in args.writers.split(",")):
+        for label, factory in (("legacy", LegacyStore), ("pooled", MemoryStore)):
+            with tempfile.TemporaryDirectory() as tmp:
+                store = factory(Path(tmp) / "memory.db")
+                result = run(store, writers, args.readers, args.rows)
+                store.close()
+            print(f"{writers:>7} {label:<7} {result['inserts/s']:>10.0f} "
+                  f"{result['reads/s']:>10.0f} {result['locked']:>7}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Micro-benchmark: per-call HTTP overhead of OllamaClient.
+
+Compares the old behaviour (a fresh httpx.Client per call, new TCP
+connection every time) against the pooled keep-alive client. A tiny
+local server answers /api/chat instantly, so the numbers are pure
+client + connection overhead, not model time.
+
+Usage:
+    python scripts/bench_ollama_client.py [--calls 200]
+"""
+import argparse
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import httpx
+
+# --- ensure project root is on PYTHONPATH ---
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+# -------------------------------------------
+
+from reachly_engine.llm.ollama_client import OllamaClient
+
+MODEL = "bench-model"
+RESPONSE = json.dumps(
+    {"model": MODEL, "message": {"role": "assistant", "content": "ok"}, "done": True}
+).encode()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        self.rfile.read(length)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(RESPONSE)))
+        self.end_headers()
+        self.wfile.write(RESPONSE)
+
+    def log_message(self, *args):
+        pass
+
+
+def _fresh_client_call(base_url: str):
+    payload = {
+        "model": MODEL,
+        "messages": [{"role": "user", "content": "hi"}],
+        "stream": False,
+    }
+    with httpx.Client(timeout=30) as client:
+        client.post(f"{base_url}/api/chat", json=payload).raise_for_status()
+
+
+def _timed(fn, calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - start) / calls * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=200)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    try:
+        before = _timed(lambda: _fresh_client_call(base_url), args.calls)
+
+        with OllamaClient(base_url=base_url, model=MODEL) as client:
+            after = _timed(
+                lambda: client.generate("system", "hi", temperature=0.0),
+                args.calls,
+            )
+    finally:
+        server.shutdown()
+
+    print(f"calls per variant:         {args.calls}")
+    print(f"fresh client per call:     {before:.3f} ms/call")
+    print(f"pooled keep-alive client:  {after:.3f} ms/call")
+    print(f"speedup:                   {before / after:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
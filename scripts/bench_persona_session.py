@@ -0,0 +1,124 @@
+"""
+Benchmark: prompt evaluation cost of persona inference paths.
+
+Runs each path against a live Ollama and sums the server-reported
+prompt_eval_count / prompt_eval_duration of every /api/chat reply:
+
+- single-pass   infer_persona (one JSON-mode call)
+- independent   three-call path, profile embedded in every user prompt
+- session       three-call path over one ProfileSession prefix
+
+Every round prepends a unique marker to the profile, so no path benefits
+from a prefix another path (or an earlier round) left in the KV cache.
+
+Usage:
+    python scripts/bench_persona_session.py [--profile profile.txt] [--rounds 3]
+"""
+import argparse
+import json
+import sys
+import uuid
+from pathlib import Path
+
+import httpx
+
+# --- ensure project root is on PYTHONPATH ---
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+# -------------------------------------------
+
+from reachly_engine.analysis.persona import infer_persona, infer_persona_multi_call
+from reachly_engine.llm.ollama_client import OllamaClient
+
+SAMPLE_PROFILE = """
+Jane Roe
+VP Analytics at PayCo | Payments, data platforms, ML in production
+
+About
+I lead a 40-person analytics and data engineering org. We moved PayCo from
+nightly batch reports to a streaming risk platform that scores every
+transaction in under 50ms. Before PayCo I spent eight years in fraud
+analytics at two card issuers. I write about pragmatic ML, data contracts
+and hiring analysts who can ship.
+
+Experience
+VP Analytics - PayCo (2021 - present)
+Director, Risk Analytics - CardBank (2016 - 2021)
+Senior Fraud Analyst - IssuerOne (2012 - 2016)
+
+Activity
+"Data contracts are a team sport. If producers do not own the schema,
+nobody does." - posted 2 weeks ago
+"Hiring: senior analytics engineers, remote within EU." - posted 1 month ago
+"""
+
+
+class RecordingTransport(httpx.HTTPTransport):
+    """
+    Keeps the timing fields of every /api/chat reply.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def handle_request(self, request):
+        response = super().handle_request(request)
+        if request.url.path.endswith("/api/chat"):
+            response.read()
+            data = json.loads(response.content)
+            self.records.append(
+                {
+                    "prompt_eval_count": data.get("prompt_eval_count", 0),
+                    "prompt_eval_duration": data.get("prompt_eval_duration", 0),
+                    "total_duration": data.get("total_duration", 0),
+                }
+            )
+        return response
+
+
+PATHS = {
+    "single-pass": lambda text, llm: infer_persona(text, llm),
+    "independent": lambda text, llm: infer_persona_multi_call(
+        text, llm, use_session=False
+    ),
+    "session": lambda text, llm: infer_persona_multi_call(
+        text, llm, use_session=True
+    ),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--profile", type=Path, default=None)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    profile = args.profile.read_text() if args.profile else SAMPLE_PROFILE
+
+    transport = RecordingTransport()
+    with OllamaClient(transport=transport) as llm:
+        if not llm.health_check():
+            raise SystemExit("Ollama not reachable or model missing")
+
+        # Load the model before timing anything
+        llm.generate("Reply with OK.", "OK?", temperature=0, max_tokens=1)
+
+        print(f"{'path':<12} {'calls':>6} {'prompt tok':>11} "
+              f"{'prompt eval ms':>15} {'total ms':>10}")
+
+        for name, run in PATHS.items():
+            transport.records.clear()
+            for _ in range(args.rounds):
+                run(f"[run {uuid.uuid4().hex[:8]}]\n{profile}", llm)
+
+            records = transport.records
+            tokens = sum(r["prompt_eval_count"] for r in records)
+            eval_ms = sum(r["prompt_eval_duration"] for r in records) / 1e6
+            total_ms = sum(r["total_duration"] for r in records) / 1e6
+            print(f"{name:<12} {len(records):>6} {tokens:>11} "
+                  f"{eval_ms:>15.1f} {total_ms:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
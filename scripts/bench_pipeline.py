@@ -0,0 +1,169 @@
+"""
+End-to-end pipeline benchmark against the bundled fake Ollama server.
+
+For each synthetic profile: ingest (store raw text) → infer_persona →
+save prospect → CTA → generate_messages → save messages, with several
+prospects processed concurrently. Reports per-prospect p50/p95 latency
+and prospects/minute for each concurrency level.
+
+Everything runs in a temporary data directory; no real model or LinkedIn
+access is needed. Use --url to point at an already running (fake or real)
+server instead; --model must then name a model it serves.
+
+Usage:
+    python scripts/bench_pipeline.py [--prospects 24] [--concurrency 1,4,8]
+                                     [--token-ms 5] [--parallel 4]
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# --- ensure project root is on PYTHONPATH ---
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+# -------------------------------------------
+
+# Standard library only: safe to import before the config is read
+from reachly_engine.llm.fake_server import FakeOllamaConfig, FakeOllamaServer
+
+ROLES = ["Backend Engineer", "VP Analytics", "Head of Growth", "Data Scientist"]
+COMPANIES = ["PayCo", "FinTechCorp", "ShopWave", "MedLabs"]
+
+
+def synthetic_profile(i: int) -> str:
+    role = ROLES[i % len(ROLES)]
+    company = COMPANIES[(i // len(ROLES)) % len(COMPANIES)]
+    return f"""
+Prospect {i}
+Senior {role} at {company}
+
+About
+I work on distributed systems, data platforms and developer tooling at
+{company}. Previously {i % 7 + 2} years in consulting. I write about
+pragmatic engineering, hiring and shipping small, reliable services.
+
+Experience
+{role} - {company} (2020 - present)
+Engineer - Consultancy {i} (2015 - 2020)
+
+Activity
+"Boring technology wins, again." - posted {i % 5 + 1} weeks ago
+""".strip()
+
+
+def percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * q), len(ordered) - 1)]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--prospects", type=int, default=24)
+    parser.add_argument("--concurrency", default="1,4,8")
+    parser.add_argument("--url", default=None, help="use a running server")
+    parser.add_argument("--model", default="fake-model")
+    parser.add_argument("--prompt-ms", type=float, default=0.05)
+    parser.add_argument("--token-ms", type=float, default=5.0)
+    parser.add_argument("--reply-tokens", type=int, default=40)
+    parser.add_argument("--parallel", type=int, default=4,
+                        help="fake server decode slots (OLLAMA_NUM_PARALLEL)")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--mode", default="channels", choices=["channels", "bundle"])
+    args = parser.parse_args()
+
+    server = None
+    url = args.url
+    if url is None:
+        server = FakeOllamaServer(
+            FakeOllamaConfig(
+                model=args.model,
+                prompt_ms_per_token=args.prompt_ms,
+                token_ms=args.token_ms,
+                reply_tokens=args.reply_tokens,
+                parallel=args.parallel,
+                error_rate=args.error_rate,
+                seed=0,
+            )
+        ).start()
+        url = server.url
+
+    data_dir = tempfile.mkdtemp(prefix="reachly-bench-")
+    os.environ.update(
+        {
+            "OLLAMA_BASE_URL": url,
+            "OLLAMA_BASE_URLS": url,
+            "OLLAMA_MODEL": args.model,
+            "REACHLY_DATA_DIR": data_dir,
+            "GENERATION_MODE": args.mode,
+            "OLLAMA_RETRY_BASE_DELAY": "0.05",
+        }
+    )
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+    from reachly_engine.app import ReachlyApp
+    from reachly_engine.llm.metrics import METRICS
+    from reachly_engine.scraping.linkedin import save_profile_text
+
+    levels = [int(c) for c in args.concurrency.split(",")]
+
+    with ReachlyApp(num_parallel=args.parallel) as app:
+
+        def run_prospect(i: int) -> float:
+            start = time.perf_counter()
+
+            text = synthetic_profile(i)
+            save_profile_text(text, "bench")
+
+            persona = app.analyze_persona(text)
+            prospect_id = app.save_persona_only(
+                persona=persona, raw_profile=text, source="bench"
+            )
+            prospect = app.memory.get_prospect(prospect_id)
+            persona_block = (
+                f"SUMMARY:\n{prospect['summary']}\n\nSTYLE:\n{prospect['style']}"
+            )
+
+            cta = app.resolve_cta(prospect, persona_block)
+            messages = app.generate_messages(persona_block, cta=cta)
+            app.memory.save_messages(prospect_id, messages)
+
+            return time.perf_counter() - start
+
+        print(f"server: {url}  mode: {args.mode}  prospects/level: {args.prospects}")
+        print(f"{'concurrency':>11} {'p50 s':>8} {'p95 s':>8} "
+              f"{'prospects/min':>14} {'llm calls':>10} {'retries':>8}")
+
+        offset = 0
+        for level in levels:
+            calls_before = METRICS.total("llm_calls_total")
+            retries_before = METRICS.total("llm_retries_total")
+
+            ids = range(offset, offset + args.prospects)
+            offset += args.prospects
+
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=level) as pool:
+                latencies = list(pool.map(run_prospect, ids))
+            elapsed = time.perf_counter() - start
+
+            print(
+                f"{level:>11} "
+                f"{statistics.median(latencies):>8.3f} "
+                f"{percentile(latencies, 0.95):>8.3f} "
+                f"{args.prospects / elapsed * 60:>14.1f} "
+                f"{METRICS.total('llm_calls_total') - calls_before:>10} "
+                f"{METRICS.total('llm_retries_total') - retries_before:>8}"
+            )
+
+    if server is not None:
+        print(f"fake server peak in-flight: {server.peak_in_flight}")
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""
+Benchmark: full-text search vs scanning the tables.
+
+Fills a temporary database with synthetic prospects (and a message
+each), then times the same queries as "scan" (load summary, style,
+raw_profile and message text, match in Python, as the CLI had to) and
+"fts" (MemoryStore.search: FTS5 MATCH ranked by bm25, with snippets).
+
+Usage:
+    python scripts/bench_search.py [--rows 20000] [--repeat 5]
+"""
+import argparse
+import itertools
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# --- ensure project root is on PYTHONPATH ---
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+# -------------------------------------------
+
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+from reachly_engine.memory.store import MemoryStore
+
+DOMAIN = (
+    "payments ledger fintech analytics growth platform data hiring remote "
+    "compliance risk fraud lending crypto retail logistics marketplace "
+    "healthcare insurance devops kubernetes python pricing churn"
+).split()
+
+
+def vocabulary(size: int = 8000, seed: int = 1) -> list[str]:
+    """
+    Random words with the domain terms spread over the mid-frequency ranks.
+    """
+    rng = random.Random(seed)
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    words = [
+        "".join(rng.choice(letters) for _ in range(rng.randint(3, 10)))
+        for _ in range(size)
+    ]
+    for i, word in enumerate(DOMAIN):
+        words.insert(200 + 40 * i, word)
+    return words
+
+
+WORDS = vocabulary()
+# Zipf-like: a few words are everywhere, most are rare (as in real text)
+CUM_WEIGHTS = list(itertools.accumulate(1 / (rank + 1) for rank in range(len(WORDS))))
+ROLES = ["Head of Data", "VP Analytics", "Backend Engineer", "CTO", "Founder"]
+QUERIES = ["fraud", "kubernetes pricing", "head data", "compl", "marketplace churn risk"]
+
+
+def sentence(rng: random.Random, n: int) -> str:
+    return " ".join(rng.choices(WORDS, cum_weights=CUM_WEIGHTS, k=n))
+
+
+def fill(store: MemoryStore, rows: int, seed: int = 0):
+    rng = random.Random(seed)
+    batch = []
+    for i in range(rows):
+        batch.append(
+            dict(
+                name=f"Prospect {i}",
+                role=rng.choice(ROLES),
+                company=f"Company {i % 500}",
+                industry=None,
+                seniority="lead",
+                summary=sentence(rng, 40),
+                style="- Tone: formal",
+                raw_profile=sentence(rng, 400),
+                source="bench",
+            )
+        )
+        if len(batch) == 1000:
+            ids = store.save_prospects(batch)
+            with store.transaction():
+                for pid in ids:
+                    store.save_messages(pid, {"email": sentence(rng, 60)})
+            batch = []
+    if batch:
+        for pid in store.save_prospects(batch):
+            store.save_messages(pid, {"email": sentence(rng, 60)})
+
+
+def scan(store: MemoryStore, query: str, limit: int = 20) -> list:
+    words = query.lower().split()
+    conn = store.connection()
+    hits = []
+    for row in conn.execute(
+        "SELECT id, name, role, company, summary, style, raw_profile FROM prospects"
+    ):
+        text = " ".join(str(v or "") for v in tuple(row)[1:]).lower()
+        if all(w in text for w in words):
+            hits.append(row["id"])
+    for row in conn.execute("SELECT prospect_id, content FROM messages"):
+        if all(w in row["content"].lower() for w in words):
+            hits.append(row["prospect_id"])
+    return hits[:limit]
+
+
+def measure(fn, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = MemoryStore(Path(tmp) / "memory.db")
+
+        start = time.perf_counter()
+        fill(store, args.rows)
+        print(f"{args.rows} prospects + messages indexed in "
+              f"{time.perf_counter() - start:.1f}s\n")
+
+        print(f"{'query':<24} {'scan ms':>9} {'fts ms':>8} {'speedup':>8} {'hits':>5}")
+        for query in QUERIES:
+            scan_s = measure(lambda: scan(store, query), args.repeat)
+            fts_s = measure(lambda: store.search(query), args.repeat)
+            hits = len(store.search(query))
+            print(f"{query:<24} {scan_s * 1000:>9.1f} {fts_s * 1000:>8.2f} "
+                  f"{scan_s / fts_s:>7.0f}x {hits:>5}")
+
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
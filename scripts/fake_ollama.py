@@ -0,0 +1,67 @@
+"""
+Run the bundled fake Ollama server in the foreground.
+
+Point the app at it with OLLAMA_BASE_URL=http://127.0.0.1:<port> and
+OLLAMA_MODEL=<model> to exercise the whole pipeline without a real model.
+
+Usage:
+    python scripts/fake_ollama.py [--port 11435] [--token-ms 10]
+                                  [--prompt-ms 0.2] [--parallel 4]
+                                  [--error-rate 0.0]
+"""
+import argparse
+import sys
+from pathlib import Path
+
+# --- ensure project root is on PYTHONPATH ---
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+# -------------------------------------------
+
+from reachly_engine.llm.fake_server import FakeOllamaConfig, FakeOllamaServer
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=11435)
+    parser.add_argument("--model", default="fake-model")
+    parser.add_argument("--prompt-ms", type=float, default=0.2,
+                        help="prompt evaluation per token (ms)")
+    parser.add_argument("--token-ms", type=float, default=10.0,
+                        help="decoding per output token (ms)")
+    parser.add_argument("--load-ms", type=float, default=0.0,
+                        help="one-off model load on the first request (ms)")
+    parser.add_argument("--reply-tokens", type=int, default=60)
+    parser.add_argument("--parallel", type=int, default=4)
+    parser.add_argument("--max-queue", type=int, default=64)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    config = FakeOllamaConfig(
+        model=args.model,
+        prompt_ms_per_token=args.prompt_ms,
+        token_ms=args.token_ms,
+        load_ms=args.load_ms,
+        reply_tokens=args.reply_tokens,
+        parallel=args.parallel,
+        max_queue=args.max_queue,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        seed=args.seed,
+    )
+    server = FakeOllamaServer(config, host=args.host, port=args.port)
+    print(f"Fake Ollama serving {args.model} on {server.url} (Ctrl+C to stop)")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
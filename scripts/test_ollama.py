@@ -10,19 +10,18 @@ from reachly_engine.llm.ollama_client import OllamaClient
 
 
 def main():
-    client = OllamaClient()
-
-    print("Checking Ollama health...")
-    if not client.health_check():
-        raise RuntimeError("Ollama not reachable or model not found")
-
-    print("Ollama OK. Running test generation...\n")
-
-    response = client.generate(
-        system_prompt="You are a helpful assistant.",
-        user_prompt="Write one short sentence explaining what cold outreach is.",
-        temperature=0.3,
-    )
+    with OllamaClient() as client:
+        print("Checking Ollama health...")
+        if not client.health_check():
+            raise RuntimeError("Ollama not reachable or model not found")
+
+        print("Ollama OK. Running test generation...\n")
+
+        response = client.generate(
+            system_prompt="You are a helpful assistant.",
+            user_prompt="Write one short sentence explaining what cold outreach is.",
+            temperature=0.3,
+        )
 
     print("LLM response:")
     print("-" * 40)
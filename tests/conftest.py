@@ -0,0 +1,31 @@
+import pytest
+
+
+class FakeLLM:
+    """
+    Stand-in for OllamaClient: structured calls (with `format`) get
+    `structured`, free-text calls and chats get `text`. `calls` records
+    each call's format, `chats` each chat's messages.
+    """
+
+    def __init__(self, structured: str = "", text: str = "- free text"):
+        self.structured = structured
+        self.text = text
+        self.calls = []
+        self.chats = []
+
+    def generate(self, system_prompt, user_prompt, temperature=0.7, **kwargs):
+        self.calls.append(kwargs.get("format"))
+        if kwargs.get("format") is not None:
+            return self.structured
+        return self.text
+
+    def chat(self, messages, temperature=0.7, **kwargs):
+        self.calls.append(None)
+        self.chats.append(messages)
+        return self.text
+
+
+@pytest.fixture
+def fake_llm():
+    return FakeLLM
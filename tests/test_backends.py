@@ -0,0 +1,114 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from reachly_engine.llm.backends import BackendPool
+from reachly_engine.llm.metrics import Metrics
+from reachly_engine.llm.ollama_client import OllamaClient
+from reachly_engine.llm.resilience import Resilience, RetryPolicy
+
+
+class _StubOllama(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def _reply(self, status: int, body: dict):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if self.server.status != 200:
+            self._reply(self.server.status, {"error": "overloaded"})
+            return
+        self._reply(200, {"models": [{"name": m} for m in self.server.models]})
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.server.hits += 1
+        time.sleep(self.server.delay)
+        if self.server.status != 200:
+            self._reply(self.server.status, {"error": "overloaded"})
+        else:
+            self._reply(200, {"message": {"content": self.server.name}})
+
+    def log_message(self, *args):
+        pass
+
+
+def _start(name: str, delay: float = 0.0, models=("m",)) -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubOllama)
+    server.name, server.delay, server.models = name, delay, list(models)
+    server.status, server.hits = 200, 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _url(server: ThreadingHTTPServer) -> str:
+    return f"http://127.0.0.1:{server.server_port}"
+
+
+def _wait_for(condition, timeout: float = 2.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_pool_prefers_faster_backend_and_spreads_load():
+    fast, slow = _start("fast"), _start("slow", delay=0.05)
+
+    with OllamaClient(base_urls=[_url(slow), _url(fast)], model="m") as llm:
+        assert llm.health_check()
+        replies = [llm.generate("sys", "user") for _ in range(10)]
+
+    assert slow.hits >= 1  # every backend gets measured
+    assert replies.count("fast") >= 8
+
+    for server in (fast, slow):
+        server.shutdown()
+
+
+def test_failing_backend_is_ejected_retried_elsewhere_and_probed_back():
+    good, flaky = _start("good"), _start("flaky")
+    flaky.status = 503
+    metrics = Metrics()
+
+    pool = BackendPool(
+        [_url(flaky), _url(good)], model="m", eject_after=1, probe_interval=0.05
+    )
+    resilience = Resilience(RetryPolicy(base_delay=0), metrics=metrics)
+    with OllamaClient(model="m", pool=pool, resilience=resilience) as llm:
+        assert llm.generate("sys", "user") == "good"
+
+        assert flaky.hits == 1
+        assert metrics.get("llm_retries_total", stage="default", reason="503") == 1
+        assert [b.url for b in pool.healthy()] == [_url(good)]
+
+        flaky.status = 200
+        assert _wait_for(lambda: len(pool.healthy()) == 2)
+
+    pool.close()
+    for server in (good, flaky):
+        server.shutdown()
+
+
+def test_health_check_ejects_backend_without_model():
+    ready, empty = _start("ready"), _start("empty", models=())
+
+    pool = BackendPool([_url(empty), _url(ready)], model="m", probe_interval=60)
+    with OllamaClient(model="m", pool=pool) as llm:
+        assert llm.health_check()
+        assert [b.url for b in pool.healthy()] == [_url(ready)]
+        assert llm.generate("sys", "user") == "ready"
+        assert empty.hits == 0
+
+    pool.close()
+    for server in (ready, empty):
+        server.shutdown()
@@ -0,0 +1,186 @@
+import threading
+
+import requests
+
+from reachly_engine import app as reachly_app
+from reachly_engine.app import ReachlyApp
+from reachly_engine.llm.resilience import RetryPolicy
+from reachly_engine.models.profile import Profile
+from reachly_engine.scraping import http_cache, linkedin
+from reachly_engine.scraping.bulk import (
+    HostRateLimiter,
+    TokenBucket,
+    canonicalize_url,
+    dedupe_urls,
+    iter_bulk_profiles,
+)
+
+
+def test_canonicalize_and_dedupe_urls():
+    assert (
+        canonicalize_url("in.linkedin.com/in/Ada-Lovelace/details/?trk=x#top")
+        == "https://www.linkedin.com/in/ada-lovelace/"
+    )
+    assert (
+        canonicalize_url("HTTPS://Example.com/About/?utm_source=x&b=2&a=1")
+        == "https://example.com/About?a=1&b=2"
+    )
+    assert canonicalize_url("not a url") is None
+
+    urls = dedupe_urls(
+        [
+            "# prospects",
+            "https://www.linkedin.com/in/ada-lovelace",
+            "",
+            "linkedin.com/in/ada-lovelace/?originalSubdomain=uk",
+            "https://www.linkedin.com/in/grace-hopper/",
+        ]
+    )
+    assert urls == [
+        "https://www.linkedin.com/in/ada-lovelace/",
+        "https://www.linkedin.com/in/grace-hopper/",
+    ]
+
+
+def test_token_bucket_allows_burst_then_paces():
+    now = [100.0]
+    bucket = TokenBucket(rate=2.0, burst=2, clock=lambda: now[0])
+
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0.5
+    assert bucket.reserve() == 1.0
+
+    # A 429 pauses the host, without a burst right after
+    now[0] = 110.0
+    bucket.block_until(120.0)
+    assert bucket.reserve() == 10.0
+    assert bucket.reserve() == 10.5
+
+
+def _rate_limited(url: str) -> RuntimeError:
+    response = requests.Response()
+    response.status_code = 429
+    response.headers["Retry-After"] = "0"
+    error = RuntimeError("Failed to fetch LinkedIn profile")
+    error.__cause__ = requests.HTTPError(response=response)
+    return error
+
+
+def test_bulk_streams_results_and_backs_off_on_429():
+    calls: dict[str, int] = {}
+    release_slow = threading.Event()
+    lock = threading.Lock()
+
+    def fetch(url: str) -> Profile:
+        with lock:
+            calls[url] = calls.get(url, 0) + 1
+            attempt = calls[url]
+        if url.endswith("/slow/"):
+            release_slow.wait(5)
+        if url.endswith("/limited/") and attempt == 1:
+            raise _rate_limited(url)
+        if url.endswith("/missing/"):
+            raise RuntimeError("Failed to fetch LinkedIn profile")
+        return Profile(source="linkedin", source_url=url, raw_text=url)
+
+    urls = [
+        "https://www.linkedin.com/in/slow",
+        "https://www.linkedin.com/in/limited",
+        "https://www.linkedin.com/in/limited/?trk=dup",
+        "https://www.linkedin.com/in/missing",
+    ]
+    results = iter_bulk_profiles(
+        urls,
+        concurrency=3,
+        limiter=HostRateLimiter(rate=1000, burst=10),
+        policy=RetryPolicy(retries=2, base_delay=0, max_delay=0),
+        fetch=fetch,
+    )
+
+    # Fast results arrive while the slow fetch is still running
+    first_two = {next(results).url, next(results).url}
+    assert first_two == {
+        "https://www.linkedin.com/in/limited/",
+        "https://www.linkedin.com/in/missing/",
+    }
+    release_slow.set()
+    rest = list(results)
+
+    assert [r.url for r in rest] == ["https://www.linkedin.com/in/slow/"]
+    assert calls["https://www.linkedin.com/in/limited/"] == 2  # deduped, retried
+
+
+def test_bulk_retries_999_responses_and_never_yields_them_ok(monkeypatch):
+    # 999 is not an HTTP error status: the fetch path must still treat
+    # LinkedIn's throttle page as a rate limit, not as an empty profile
+    calls: dict[str, int] = {}
+    lock = threading.Lock()
+
+    def response(url: str, status: int, body: str) -> requests.Response:
+        r = requests.Response()
+        r.status_code = status
+        r.url = url
+        r.encoding = "utf-8"
+        r._content = body.encode("utf-8")
+        return r
+
+    class Session:
+        def get(self, url, headers, timeout):
+            with lock:
+                calls[url] = calls.get(url, 0) + 1
+                attempt = calls[url]
+            if url.endswith("/throttled/") or attempt == 1:
+                return response(url, 999, "<html>Request denied</html>")
+            return response(url, 200, "<html><h1>Ada Lovelace</h1></html>")
+
+    monkeypatch.setattr(http_cache, "get_session", Session)
+    monkeypatch.setattr(http_cache, "get_http_cache", lambda: None)
+    monkeypatch.setattr(linkedin, "load_linkedin_cookie", lambda: None)
+
+    results = {
+        r.url: r
+        for r in iter_bulk_profiles(
+            [
+                "https://www.linkedin.com/in/ada",
+                "https://www.linkedin.com/in/throttled",
+            ],
+            limiter=HostRateLimiter(rate=1000, burst=10),
+            policy=RetryPolicy(retries=2, base_delay=0, max_delay=0),
+        )
+    }
+
+    ada = results["https://www.linkedin.com/in/ada/"]
+    assert ada.ok and ada.attempts == 2
+    assert "Ada Lovelace" in ada.profile.raw_text
+
+    throttled = results["https://www.linkedin.com/in/throttled/"]
+    assert not throttled.ok
+    assert throttled.error == "HTTP 999"
+    assert calls["https://www.linkedin.com/in/throttled/"] == 3
+
+
+def test_bulk_ingest_saves_one_profile_file_each(tmp_path, monkeypatch):
+    def fetch(url: str) -> Profile:
+        return Profile(source="linkedin", source_url=url, raw_text=f"text of {url}")
+
+    def bulk(urls, concurrency):
+        return iter_bulk_profiles(
+            urls,
+            concurrency=concurrency,
+            limiter=HostRateLimiter(rate=1000, burst=10),
+            fetch=fetch,
+        )
+
+    monkeypatch.setattr(linkedin, "PROFILES_DIR", tmp_path)
+    monkeypatch.setattr(reachly_app, "load_linkedin_cookie", lambda: "token")
+    monkeypatch.setattr(reachly_app, "iter_bulk_profiles", bulk)
+
+    urls = [f"https://www.linkedin.com/in/person-{i}" for i in range(5)]
+    # All saved within the same second
+    results = list(ReachlyApp.ingest_linkedin_bulk(None, urls, concurrency=5))
+
+    assert all(r.ok for r in results)
+    files = sorted(tmp_path.glob("linkedin_*.txt"))
+    assert len(files) == 5
+    assert {f.read_text() for f in files} == {f"text of {u}/" for u in urls}
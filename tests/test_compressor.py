@@ -0,0 +1,42 @@
+from reachly_engine.analysis.compressor import compress_profile
+
+
+def _long_profile() -> str:
+    about = " ".join(
+        f"I have spent years building payment systems, part {i}." for i in range(60)
+    )
+    positions = "\n".join(
+        f"Engineering Manager at Company{i}\n{2022 - i} - {2023 - i}\n"
+        f"Ran the ledger team number {i}."
+        for i in range(1, 20)
+    )
+    activity = "\n".join(f"Liked a post about topic {i}" for i in range(80))
+    return (
+        "Ada Lovelace\nHead of Payments at PayCo\nLondon\n\n"
+        f"About\n{about}\n\n"
+        "Experience\nHead of Payments at PayCo\n2023 - Present\n"
+        f"{positions}\n\n"
+        "Education\nUniversity of London\nBSc Mathematics\n\n"
+        f"Activity\n{activity}"
+    )
+
+
+def test_compress_profile_leaves_short_text_alone():
+    text = "Ada Lovelace\nEngineer"
+    assert compress_profile(text, max_tokens=100) == text
+
+
+def test_compress_profile_keeps_salient_sections_within_budget():
+    text = _long_profile()
+    def count(s: str) -> int:
+        return len(s.split())  # a tokenizer that is not chars / 4
+
+    out = compress_profile(text, max_tokens=250, count=count)
+
+    assert count(out) <= 250
+    assert out.startswith("Ada Lovelace\nHead of Payments at PayCo\nLondon")
+    assert "Experience\nHead of Payments at PayCo\n2023 - Present" in out
+    assert "\n\nEducation\nUniversity of London" in out
+    assert "topic 79" not in out
+    # Original order is kept
+    assert out.index("About") < out.index("Experience") < out.index("Education")
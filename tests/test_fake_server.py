@@ -0,0 +1,64 @@
+import httpx
+
+from reachly_engine.analysis.persona import infer_persona, infer_persona_multi_call
+from reachly_engine.llm.fake_server import FakeOllamaConfig, FakeOllamaServer
+from reachly_engine.llm.metrics import Metrics
+from reachly_engine.llm.ollama_client import OllamaClient
+from reachly_engine.llm.resilience import Resilience, RetryPolicy
+from reachly_engine.llm.telemetry import Telemetry
+
+PROFILE = "Jane Roe\nVP Analytics at PayCo\n" + "Builds data platforms. " * 80
+
+
+def _client(server: FakeOllamaServer, **kwargs) -> OllamaClient:
+    return OllamaClient(base_url=server.url, model="fake-model", **kwargs)
+
+
+def test_fake_server_serves_chat_stream_schema_and_embeddings():
+    config = FakeOllamaConfig(token_ms=0, prompt_ms_per_token=0)
+    with FakeOllamaServer(config) as server, _client(server) as llm:
+        assert llm.health_check()
+
+        persona = infer_persona(PROFILE, llm)
+        assert persona.summary and persona.seniority
+
+        streamed = "".join(llm.stream("sys", "user"))
+        assert streamed == llm.generate("sys", "user")
+
+        r = httpx.post(
+            f"{server.url}/api/embed",
+            json={"model": "fake-model", "input": ["a b", "c"]},
+        )
+        assert [len(e) for e in r.json()["embeddings"]] == [384, 384]
+
+
+def test_fake_server_reuses_cached_prefix_for_profile_session():
+    config = FakeOllamaConfig(token_ms=0, prompt_ms_per_token=0, parallel=1)
+    telemetry = Telemetry(metrics=Metrics(), jsonl_path=None)
+
+    with FakeOllamaServer(config) as server:
+        with _client(server, telemetry=telemetry) as llm:
+            infer_persona_multi_call(PROFILE, llm, use_session=False)
+            independent = sum(r.prompt_eval_count for r in telemetry.recent)
+
+            telemetry.recent.clear()
+            infer_persona_multi_call("Other " + PROFILE, llm, use_session=True)
+            session = sum(r.prompt_eval_count for r in telemetry.recent)
+
+    assert session < independent / 2
+
+
+def test_fake_server_injected_errors_are_retried():
+    config = FakeOllamaConfig(token_ms=0, error_rate=0.5, seed=1)
+    metrics = Metrics()
+    resilience = Resilience(
+        RetryPolicy(retries=10, base_delay=0), metrics=metrics
+    )
+
+    with FakeOllamaServer(config) as server:
+        with _client(server, resilience=resilience) as llm:
+            for _ in range(5):
+                assert llm.generate("sys", "user")
+
+    assert server.errors > 0
+    assert metrics.total("llm_retries_total", reason="503") == server.errors
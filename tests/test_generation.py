@@ -1,5 +1,10 @@
+import json
+
 from reachly_engine.generation.email import generate_email
 from reachly_engine.generation.whatsapp import generate_whatsapp
+from reachly_engine.generation.bundle import generate_bundle, bundle_schema
+from reachly_engine.generation.cta import get_cta, adapt_cta
+from reachly_engine.constants import CHANNEL_EMAIL, CHANNEL_WHATSAPP
 from reachly_engine.llm.ollama_client import OllamaClient
 
 
@@ -19,3 +24,36 @@ def test_message_generation():
     assert whatsapp
     assert len(email) > len(whatsapp)
 
+
+def test_bundle_generation_falls_back_for_missing_channels(fake_llm):
+    reply = json.dumps(
+        {
+            "cta": "Open to a quick chat?",
+            "email": "Subject: Hi\n\nHello there.",
+            "whatsapp": "Hey!",
+            "linkedin_dm": "",
+        }
+    )
+    llm = fake_llm(reply, text="fallback")
+
+    bundle = generate_bundle("persona", llm)
+
+    assert bundle["email"].startswith("Subject")
+    assert bundle["whatsapp"] == "Hey!"
+    assert bundle["linkedin_dm"] == "fallback"
+    assert bundle["instagram_dm"] == "fallback"
+    assert bundle["cta"] == "Open to a quick chat?"
+    assert llm.calls.count(bundle_schema()) == 1
+
+
+def test_cta_is_memoized_per_persona_and_adapted_without_llm(fake_llm):
+    llm = fake_llm()
+    persona = "Head of Data at a payments startup"
+
+    cta = get_cta(persona, llm)
+    assert get_cta(persona, llm) == cta
+    assert len(llm.calls) == 1
+
+    shared = '"Would you be open to a quick chat? Happy to share notes."'
+    assert adapt_cta(shared, CHANNEL_EMAIL) == shared.strip('"')
+    assert adapt_cta(shared, CHANNEL_WHATSAPP) == "Open to a quick chat?"
@@ -0,0 +1,141 @@
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from reachly_engine.scraping.http_cache import HttpCache, cached_get
+
+
+class _Page(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        if self.path.startswith("/in/private/"):
+            self.send_response(302)
+            self.send_header("Location", "/authwall?sessionRedirect=x")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if self.path.startswith("/authwall"):
+            body = b"<p>Sign in to view this profile</p>"
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+
+        self.server.requests.append(self.headers.get("If-None-Match"))
+        if self.headers.get("If-None-Match") == self.server.etag:
+            self.send_response(304)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        body = self.server.body.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("ETag", self.server.etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def page_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Page)
+    server.body, server.etag, server.requests = "<p>Ada – v1</p>", '"v1"', []
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_cache_fresh_hit_revalidation_and_offline(tmp_path, page_server):
+    cache = HttpCache(path=tmp_path / "http.db")
+    url = f"http://127.0.0.1:{page_server.server_port}/in/ada/?utm_source=x"
+
+    def get(max_age=3600, offline=False):
+        return cached_get(
+            url, headers={}, timeout=5, max_age=max_age, cache=cache, offline=offline
+        )
+
+    assert get() == "<p>Ada – v1</p>"
+    assert get() == "<p>Ada – v1</p>"  # fresh: no request
+    assert page_server.requests == [None]
+
+    # Stale: conditional GET, 304 reuses the stored body
+    assert get(max_age=0) == "<p>Ada – v1</p>"
+    assert page_server.requests == [None, '"v1"']
+
+    # Changed upstream: full body replaces the cached one
+    page_server.body, page_server.etag = "<p>Ada – v2</p>", '"v2"'
+    assert get(max_age=0) == "<p>Ada – v2</p>"
+
+    # Offline: any age from cache, misses fail without a request
+    assert get(max_age=0, offline=True) == "<p>Ada – v2</p>"
+    with pytest.raises(RuntimeError):
+        cached_get(
+            url.replace("/in/ada/", "/in/other/"),
+            headers={},
+            timeout=5,
+            max_age=0,
+            cache=cache,
+            offline=True,
+        )
+    assert len(page_server.requests) == 3
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["revalidated"], stats["misses"]) == (2, 1, 2)
+    cache.close()
+
+
+def test_cache_skips_sign_in_pages_and_keys_on_auth_state(tmp_path, page_server):
+    cache = HttpCache(path=tmp_path / "http.db")
+    base = f"http://127.0.0.1:{page_server.server_port}"
+
+    def get(path, headers=None):
+        return cached_get(
+            base + path, headers=headers or {}, timeout=5, max_age=3600, cache=cache
+        )
+
+    # Redirected to the authwall: returned, but not kept for a week
+    assert "Sign in" in get("/in/private/")
+    assert "Sign in" in get("/in/private/")
+    assert cache.stats()["misses"] == 2
+
+    # An anonymous copy is not served once a cookie is sent, nor one
+    # account's copy to another account
+    get("/in/ada/")
+    get("/in/ada/", headers={"Cookie": "li_at=token"})
+    get("/in/ada/", headers={"Cookie": "li_at=token"})
+    get("/in/ada/", headers={"Cookie": "li_at=other-account"})
+    assert page_server.requests == [None, None, None]
+
+    stats = cache.stats()
+    assert (stats["entries"], stats["hits"]) == (3, 1)
+    cache.close()
+
+
+def test_cache_evicts_least_recently_used_by_size(tmp_path):
+    def response(body: bytes) -> requests.Response:
+        r = requests.Response()
+        r.status_code, r._content, r.encoding = 200, body, "utf-8"
+        return r
+
+    # Incompressible bodies of ~2 KB each, room for two
+    cache = HttpCache(path=tmp_path / "http.db", max_bytes=5000)
+    cache.put("a", response(os.urandom(2000)))
+    cache.put("b", response(os.urandom(2000)))
+    assert cache.get("a") is not None  # "b" is now least recently used
+    cache.put("c", response(os.urandom(2000)))
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    assert cache.stats()["evictions"] == 1
+    cache.close()
@@ -0,0 +1,116 @@
+import httpx
+
+from reachly_engine.generation.cta import get_cta
+from reachly_engine.llm.budget import ContextBudgeter
+from reachly_engine.llm.cache import ResponseCache, request_key
+from reachly_engine.llm.ollama_client import OllamaClient
+from reachly_engine.llm.tokenizer import Tokenizer
+
+
+def test_cache_hits_bypass_and_seed(tmp_path):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(200, json={"message": {"content": f"r{len(calls)}"}})
+
+    cache = ResponseCache(path=tmp_path / "cache.db")
+    llm = OllamaClient(
+        base_url="http://ollama.test",
+        model="m",
+        transport=httpx.MockTransport(handler),
+        cache=cache,
+        seed=7,
+    )
+
+    assert llm.generate("sys", "user", temperature=0.2) == "r1"
+    assert llm.generate("sys", "user", temperature=0.2) == "r1"
+    assert llm.generate("sys", "user", temperature=0.2, seed=8) == "r2"
+
+    # Bypass regenerates, and the fresh result replaces the cached one
+    assert llm.generate("sys", "user", temperature=0.2, use_cache=False) == "r3"
+    assert llm.generate("sys", "user", temperature=0.2) == "r3"
+
+    assert b'"seed":7' in calls[0].content
+    assert cache.stats()["hits"] == 2
+    assert cache.stats()["misses"] == 2
+    llm.close()
+
+
+def test_cache_lru_eviction(tmp_path):
+    cache = ResponseCache(path=tmp_path / "cache.db", max_entries=2)
+
+    cache.put("a", "1")
+    cache.put("b", "2")
+    assert cache.get("a") == "1"  # "b" is now least recently used
+    cache.put("c", "3")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
+    assert cache.get("c") == "3"
+    assert cache.stats()["evictions"] == 1
+
+
+def test_request_key_ignores_stream_flag():
+    payload = {"model": "m", "messages": [], "options": {}, "stream": False}
+    assert request_key(payload) == request_key({**payload, "stream": True})
+
+
+def test_cache_key_survives_num_ctx_raised_by_earlier_prompt(tmp_path):
+    chats = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/api/tokenize":
+            return httpx.Response(404)
+        if request.url.path == "/api/show":
+            return httpx.Response(
+                200, json={"model_info": {"llama.context_length": 8192}}
+            )
+        chats.append(request)
+        return httpx.Response(200, json={"message": {"content": f"r{len(chats)}"}})
+
+    transport = httpx.MockTransport(handler)
+    budgeter = ContextBudgeter(
+        Tokenizer("http://ollama.test", "m", transport=transport),
+        min_num_ctx=2048,
+        max_num_ctx=8192,
+    )
+    llm = OllamaClient(
+        base_url="http://ollama.test",
+        model="m",
+        transport=transport,
+        cache=ResponseCache(path=tmp_path / "cache.db"),
+        budgeter=budgeter,
+    )
+
+    assert llm.generate("sys", "short prompt") == "r1"
+    assert llm.generate("sys", "long prompt " * 3000) == "r2"  # raises num_ctx
+    assert llm.generate("sys", "short prompt") == "r1"
+
+    assert b'"num_ctx":2048' in chats[0].content
+    assert b'"num_ctx":2048' not in chats[1].content
+    assert len(chats) == 2
+    llm.close()
+
+
+def test_fresh_cta_bypasses_response_cache(tmp_path):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(200, json={"message": {"content": f"CTA {len(calls)}?"}})
+
+    llm = OllamaClient(
+        base_url="http://ollama.test",
+        model="m",
+        transport=httpx.MockTransport(handler),
+        cache=ResponseCache(path=tmp_path / "cache.db"),
+    )
+    persona = "SUMMARY:\nFresh CTA test persona"
+
+    assert get_cta(persona, llm) == "CTA 1?"
+    assert get_cta(persona, llm) == "CTA 1?"  # memo, no request
+    assert get_cta(persona, llm, fresh=True) == "CTA 2?"
+    assert len(calls) == 2
+    assert llm.cache.stats()["hits"] == 0  # the fresh call never read it
+    llm.close()
@@ -0,0 +1,291 @@
+import sqlite3
+import threading
+from datetime import date
+
+from reachly_engine.app import (
+    ReachlyApp,
+    PROFILE_NEW,
+    PROFILE_UPDATED,
+    PROFILE_UNCHANGED,
+)
+from reachly_engine.memory.fingerprint import content_fingerprint
+from reachly_engine.memory.retrieval import ProspectIndex
+from reachly_engine.memory.store import (
+    MemoryStore,
+    ProspectFilters,
+    SNIPPET_START,
+    SNIPPET_END,
+)
+from reachly_engine.models.persona import Persona
+from reachly_engine.models.profile import Profile
+
+
+def _prospect(**overrides) -> dict:
+    fields = dict(
+        name="Ada Lovelace",
+        role="Engineer",
+        company="PayCo",
+        industry="fintech",
+        seniority="senior",
+        summary="Ada builds payment systems.",
+        style="- Tone: formal",
+        raw_profile="Ada Lovelace\nEngineer at PayCo",
+        source="linkedin",
+    )
+    fields.update(overrides)
+    return fields
+
+
+def test_fingerprint_ignores_volatile_page_furniture():
+    a = "Ada Lovelace\n500+ connections\nPosted 2w ago\n\nEngineer at PayCo"
+    b = "ada   lovelace 501+ connections posted 3w ago engineer at payco [TRUNCATED]"
+
+    assert content_fingerprint(a) == content_fingerprint(b)
+    assert content_fingerprint(a) != content_fingerprint(a + " and MIT")
+
+
+def test_same_source_url_updates_in_place(tmp_path):
+    store = MemoryStore(db_path=tmp_path / "memory.db")
+    url = "https://www.linkedin.com/in/ada-lovelace/"
+
+    first = store.save_prospect(**_prospect(source_url=url, content_hash="h1"))
+    store.save_cta(first, "Open to a quick chat?")
+    second = store.save_prospect(
+        **_prospect(role="Staff Engineer", source_url=url, content_hash="h2")
+    )
+
+    assert second == first
+    row = store.get_prospect(first)
+    assert row["role"] == "Staff Engineer"
+    assert row["content_hash"] == "h2"
+    assert row["cta"] is None  # written for the old persona
+    assert row["updated_at"] is not None
+    assert len(store.list_prospects()) == 1
+
+    assert store.find_prospect(source_url=url)["id"] == first
+    assert store.find_prospect(content_hash="h2")["id"] == first
+    assert store.find_prospect(source_url="https://example.com/") is None
+
+
+def test_migration_adds_fingerprint_columns(tmp_path):
+    path = tmp_path / "memory.db"
+    with sqlite3.connect(path) as conn:
+        conn.execute(
+            """
+            CREATE TABLE prospects (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT, role TEXT, company TEXT, industry TEXT,
+                seniority TEXT, summary TEXT, style TEXT,
+                raw_profile TEXT, source TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+            """
+        )
+        conn.execute("INSERT INTO prospects (name) VALUES ('Old')")
+        conn.execute("INSERT INTO prospects (name) VALUES ('Older')")
+
+    store = MemoryStore(db_path=path)
+
+    with sqlite3.connect(path) as conn:
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(prospects)")}
+        indexes = {row[1] for row in conn.execute("PRAGMA index_list(prospects)")}
+    assert {"source_url", "content_hash", "updated_at"} <= columns
+    assert "idx_prospects_source_url" in indexes
+    assert len(store.list_prospects()) == 2
+
+
+def test_store_profile_skips_llm_for_unchanged_profile(tmp_path):
+    app = ReachlyApp.__new__(ReachlyApp)  # no Ollama needed
+    app.memory = MemoryStore(db_path=tmp_path / "memory.db")
+    app.similar = ProspectIndex(app.memory)
+    analyzed = []
+
+    def analyze(profile):
+        analyzed.append(profile.headline)
+        return Persona(summary=f"Summary {len(analyzed)}", style="-", analysis="-")
+
+    app.analyze_persona = analyze
+
+    def profile(headline: str, connections: int) -> Profile:
+        return Profile(
+            source="linkedin",
+            source_url="https://www.linkedin.com/in/ada-lovelace/",
+            name="Ada Lovelace",
+            headline=headline,
+            raw_text=f"Ada\n{connections} connections",
+        )
+
+    first = app.store_profile(profile("Engineer", 500))
+    again = app.store_profile(profile("Engineer", 501))
+    changed = app.store_profile(profile("Staff Engineer", 501))
+
+    assert [first.status, again.status, changed.status] == [
+        PROFILE_NEW,
+        PROFILE_UNCHANGED,
+        PROFILE_UPDATED,
+    ]
+    assert again.summary == "Summary 1"
+    assert first.prospect_id == again.prospect_id == changed.prospect_id
+    assert analyzed == ["Engineer", "Staff Engineer"]
+
+
+def test_concurrent_writers_share_store_without_lock_errors(tmp_path):
+    store = MemoryStore(db_path=tmp_path / "memory.db")
+
+    connections = set()
+    errors = []
+
+    def work(worker: int):
+        try:
+            for i in range(25):
+                pid = store.save_prospect(**_prospect(name=f"P{worker}-{i}"))
+                store.save_message(pid, "email", "Hi")
+                assert store.get_prospect(pid)["name"] == f"P{worker}-{i}"
+            connections.add(id(store.connection()))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=work, args=(w,)) for w in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == []
+    assert len(connections) == 4  # one connection per thread
+    assert len(store.list_prospects()) == 100
+    mode = store.connection().execute("PRAGMA journal_mode").fetchone()[0]
+    assert mode == "wal"
+
+    store.close()
+    assert len(store.list_prospects()) == 100  # reopens on demand
+
+
+def test_batched_writes_upsert_in_one_transaction(tmp_path):
+    store = MemoryStore(db_path=tmp_path / "memory.db")
+    url = "https://www.linkedin.com/in/ada-lovelace/"
+    first = store.save_prospect(**_prospect(source_url=url))
+
+    ids = store.save_prospects(
+        [
+            _prospect(name="Grace", source_url="https://www.linkedin.com/in/grace/"),
+            _prospect(role="CTO", source_url=url),
+            _prospect(name="No URL"),
+            _prospect(name="Grace Hopper", source_url="https://www.linkedin.com/in/grace/"),
+        ]
+    )
+
+    assert ids[1] == first
+    assert ids[0] == ids[3] != ids[2]
+    assert store.get_prospect(first)["role"] == "CTO"
+    assert store.get_prospect(ids[0])["name"] == "Grace Hopper"
+    assert store.get_prospect(ids[2])["name"] == "No URL"
+    assert len(store.list_prospects()) == 3
+
+    store.save_messages(first, {"email": "Hi", "linkedin": "Hey"})
+    with sqlite3.connect(store.db_path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM messages").fetchone()[0] == 2
+
+    # Prospect + messages are atomic: a failing message rolls both back
+    try:
+        store.save_prospect_with_messages(
+            {"email": None}, **_prospect(name="Half saved")  # content NOT NULL
+        )
+    except sqlite3.IntegrityError:
+        pass
+    assert len(store.list_prospects()) == 3
+
+
+def test_search_ranks_prospects_and_messages_and_follows_updates(tmp_path):
+    store = MemoryStore(db_path=tmp_path / "memory.db")
+    ada = store.save_prospect(
+        **_prospect(summary="Ada scales payment ledgers.", source_url="u1")
+    )
+    grace = store.save_prospect(
+        **_prospect(
+            name="Grace Hopper",
+            company="Navy",
+            summary="Grace builds compilers.",
+            raw_profile="Mentions payments once.",
+            source_url="u2",
+        )
+    )
+    store.save_messages(grace, {"email": "Loved your talk on COBOL compilers"})
+
+    hits = store.search("payment")  # prefix match: payment, payments
+    assert [h["prospect_id"] for h in hits] == [ada, grace]
+    assert f"{SNIPPET_START}payment" in hits[0]["snippet"]
+
+    hits = store.search('compil* "')  # query syntax in input is inert
+    assert {(h["kind"], h["prospect_id"]) for h in hits} == {
+        ("prospect", grace),
+        ("message", grace),
+    }
+    assert hits[0]["snippet"].count(SNIPPET_END) >= 1
+
+    store.save_prospect(**_prospect(summary="Ada now runs data teams.", source_url="u1"))
+    assert [h["prospect_id"] for h in store.search("ledgers")] == []
+    assert [h["prospect_id"] for h in store.search("data teams")] == [ada]
+    assert store.search("  ") == []
+
+
+def test_search_indexes_rows_stored_before_upgrade(tmp_path):
+    path = tmp_path / "memory.db"
+    MemoryStore(db_path=path).save_prospect(**_prospect(summary="Quantum networking"))
+    with sqlite3.connect(path) as conn:
+        for table in ("prospects_fts", "messages_fts"):
+            conn.execute(f"DROP TABLE {table}")
+
+    assert len(MemoryStore(db_path=path).search("quantum")) == 1
+
+
+def test_iter_prospects_pages_by_keyset_with_filters(tmp_path):
+    store = MemoryStore(db_path=tmp_path / "memory.db")
+    store.save_prospects(
+        _prospect(
+            name=f"P{i}",
+            role="Head of Data" if i % 3 == 0 else "Engineer",
+            company="100%_Pay" if i % 2 else "PayCo",
+        )
+        for i in range(120)
+    )
+    with store.transaction() as conn:  # five creation days, ids interleaved
+        conn.execute(
+            "UPDATE prospects SET created_at = '2025-01-0' || (1 + id % 5) || ' 09:00:00'"
+        )
+
+    everything = list(store.iter_prospects())
+    assert len(everything) == 120 == len({row["id"] for row in everything})
+    assert everything == store.list_prospects()
+    assert set(everything[0]) == {"id", "name", "role", "company", "industry", "created_at"}
+    keys = [(row["created_at"], row["id"]) for row in everything]
+    assert keys == sorted(keys, reverse=True)  # newest first
+
+    pages, after_id = [], None
+    while page := list(store.iter_prospects(after_id=after_id, limit=25)):
+        pages.append(page)
+        after_id = page[-1]["id"]
+    assert [len(page) for page in pages] == [25, 25, 25, 25, 20]
+    assert [row for page in pages for row in page] == everything
+
+    filters = ProspectFilters(
+        company="100%_", role="HEAD", since=date(2025, 1, 2), until=date(2025, 1, 3)
+    )
+    matching = list(store.iter_prospects(filters=filters))
+    assert matching and len(matching) == store.count_prospects(filters)
+    assert all(
+        row["company"] == "100%_Pay"
+        and row["role"] == "Head of Data"
+        and row["created_at"][:10] in ("2025-01-02", "2025-01-03")
+        for row in matching
+    )
+    assert store.count_prospects(ProspectFilters(company="Pay_")) == 0  # literal _
+
+    plan = " ".join(
+        row[3] for row in store.connection().execute(
+            "EXPLAIN QUERY PLAN SELECT id FROM prospects "
+            "WHERE (created_at, id) < ('2025-01-03', 10) "
+            "ORDER BY created_at DESC, id DESC LIMIT 20"
+        )
+    )
+    assert "idx_prospects_created_at" in plan and "TEMP B-TREE" not in plan
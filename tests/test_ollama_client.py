@@ -0,0 +1,119 @@
+import asyncio
+import json
+
+import httpx
+
+from reachly_engine.generation.channels import ASYNC_CHANNEL_GENERATORS
+from reachly_engine.llm.backends import BackendPool
+from reachly_engine.llm.ollama_client import OllamaClient, AsyncOllamaClient
+
+
+def test_client_reuses_pool_and_closes():
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.url.path)
+        if request.url.path == "/api/tags":
+            return httpx.Response(200, json={"models": [{"name": "m"}]})
+        return httpx.Response(200, json={"message": {"content": " hi "}})
+
+    with OllamaClient(
+        base_url="http://ollama.test",
+        model="m",
+        transport=httpx.MockTransport(handler),
+    ) as llm:
+        assert llm.health_check()
+        assert llm.generate("sys", "user") == "hi"
+        assert llm.generate("sys", "user") == "hi"
+
+    assert llm.closed
+    assert seen == ["/api/tags", "/api/chat", "/api/chat"]
+
+
+def test_async_fanout_respects_concurrency_limit():
+    in_flight = 0
+    peak = 0
+    calls = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak, calls
+        calls += 1
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json={"message": {"content": "msg"}})
+
+    async def run():
+        async with AsyncOllamaClient(
+            base_url="http://ollama.test",
+            model="m",
+            max_concurrency=2,
+            transport=httpx.MockTransport(handler),
+        ) as llm:
+            return await asyncio.gather(
+                *(
+                    gen("persona", llm, cta="Open to a chat?")
+                    for gen in ASYNC_CHANNEL_GENERATORS.values()
+                )
+            )
+
+    results = asyncio.run(run())
+
+    assert results == ["msg"] * len(ASYNC_CHANNEL_GENERATORS)
+    assert peak == 2
+    assert calls == len(ASYNC_CHANNEL_GENERATORS)  # shared CTA: no extra calls
+
+
+def test_async_concurrency_limit_applies_per_backend():
+    in_flight = {"a.test": 0, "b.test": 0}
+    peak = dict(in_flight)
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        in_flight[host] += 1
+        peak[host] = max(peak[host], in_flight[host])
+        await asyncio.sleep(0.01)
+        in_flight[host] -= 1
+        return httpx.Response(200, json={"message": {"content": host}})
+
+    pool = BackendPool(["http://a.test", "http://b.test"], "m")
+    # "a" looks so much faster that the pool sends it everything
+    pool.backends[0].latency, pool.backends[1].latency = 0.001, 10.0
+
+    async def run():
+        async with AsyncOllamaClient(
+            model="m",
+            max_concurrency=2,
+            transport=httpx.MockTransport(handler),
+            pool=pool,
+        ) as llm:
+            return await asyncio.gather(
+                *(llm.agenerate("sys", f"user {i}") for i in range(8))
+            )
+
+    results = asyncio.run(run())
+    pool.close()
+
+    assert results == ["a.test"] * 8
+    assert peak["a.test"] == 2  # not the pool-wide 4
+
+
+def test_stream_parses_ndjson_deltas():
+    chunks = [
+        {"message": {"content": "Hel"}, "done": False},
+        {"message": {"content": "lo"}, "done": False},
+        {"message": {"content": ""}, "done": True},
+    ]
+    body = "\n".join(json.dumps(c) for c in chunks) + "\n"
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert json.loads(request.content)["stream"] is True
+        return httpx.Response(200, content=body.encode())
+
+    with OllamaClient(
+        base_url="http://ollama.test",
+        model="m",
+        transport=httpx.MockTransport(handler),
+    ) as llm:
+        assert list(llm.stream("sys", "user")) == ["Hel", "lo"]
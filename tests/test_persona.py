@@ -1,3 +1,5 @@
+import json
+
 from reachly_engine.analysis.persona import infer_persona
 from reachly_engine.llm.ollama_client import OllamaClient
 
@@ -19,3 +21,57 @@ def test_persona_inference():
     assert persona.style
     assert persona.raw_analysis
 
+
+def test_single_pass_persona_returns_typed_fields(fake_llm):
+    reply = json.dumps(
+        {
+            "summary": "- Jane Roe, VP Analytics at PayCo",
+            "name": "Jane Roe",
+            "role": "VP Analytics",
+            "company": "PayCo",
+            "industry": "Payments",
+            "seniority": "Executive",
+            "interests": ["data platforms", " ", "ML"],
+            "style": {
+                "tone": "formal",
+                "emoji_usage": "none",
+                "slang": False,
+                "sentence_length": "short",
+                "vibe": "direct",
+            },
+        }
+    )
+    llm = fake_llm(reply)
+
+    persona = infer_persona("profile", llm)
+
+    assert len(llm.calls) == 1
+    assert persona.name == "Jane Roe"
+    assert persona.industry == "Payments"
+    assert persona.seniority == "executive"
+    assert persona.interests == ["data platforms", "ML"]
+    assert "- Tone: formal" in persona.style
+    assert persona.raw_analysis
+
+
+def test_invalid_persona_json_falls_back_to_multi_call(fake_llm):
+    llm = fake_llm("not json")
+
+    persona = infer_persona("profile", llm)
+
+    assert len(llm.calls) == 4
+    assert persona.summary == "- free text"
+    assert persona.industry is None
+
+
+def test_multi_call_session_shares_profile_prefix(fake_llm):
+    llm = fake_llm("not json")
+    profile = "Jane Roe\nVP Analytics at PayCo"
+
+    infer_persona(profile, llm)
+
+    assert len(llm.chats) == 3
+    prefixes = {messages[0]["content"] for messages in llm.chats}
+    assert len(prefixes) == 1
+    assert profile in prefixes.pop()
+    assert all(profile not in messages[-1]["content"] for messages in llm.chats)
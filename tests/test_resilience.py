@@ -0,0 +1,145 @@
+import json
+import threading
+import time
+
+import httpx
+import pytest
+
+from reachly_engine.llm.metrics import Metrics
+from reachly_engine.llm.ollama_client import OllamaClient
+from reachly_engine.llm.resilience import (
+    CircuitOpenError,
+    Resilience,
+    RetryPolicy,
+)
+
+
+def _client(handler, resilience: Resilience) -> OllamaClient:
+    return OllamaClient(
+        base_url="http://ollama.test",
+        model="m",
+        transport=httpx.MockTransport(handler),
+        resilience=resilience,
+    )
+
+
+def test_retries_503_with_backoff_then_succeeds():
+    statuses = [503, 503, 200]
+    delays = []
+    metrics = Metrics()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        status = statuses.pop(0)
+        return httpx.Response(status, json={"message": {"content": "ok"}})
+
+    resilience = Resilience(
+        RetryPolicy(retries=3, base_delay=0.1, max_delay=1),
+        metrics=metrics,
+        sleep=delays.append,
+    )
+    with _client(handler, resilience) as llm:
+        assert llm.generate("sys", "user", stage="cta") == "ok"
+
+    assert metrics.get("llm_retries_total", stage="cta", reason="503") == 2
+    assert len(delays) == 2
+    assert 0 <= delays[0] <= 0.1 and 0 <= delays[1] <= 0.2
+
+
+def test_non_retryable_error_fails_fast():
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return httpx.Response(400, json={"error": "bad request"})
+
+    with _client(handler, Resilience(sleep=lambda s: None)) as llm:
+        with pytest.raises(RuntimeError, match="Ollama returned an error"):
+            llm.generate("sys", "user")
+
+    assert calls == 1
+
+
+def test_circuit_opens_after_repeated_backend_failures():
+    calls = 0
+    metrics = Metrics()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        raise httpx.ConnectError("refused", request=request)
+
+    resilience = Resilience(
+        RetryPolicy(retries=0),
+        breaker_threshold=2,
+        breaker_reset=60,
+        metrics=metrics,
+    )
+    with _client(handler, resilience) as llm:
+        for _ in range(2):
+            with pytest.raises(RuntimeError, match="Failed to connect"):
+                llm.generate("sys", "user")
+        with pytest.raises(CircuitOpenError):
+            llm.generate("sys", "user")
+
+    assert calls == 2
+    assert metrics.get("llm_circuit_opened_total", backend="http://ollama.test") == 1
+    assert metrics.get("llm_circuit_rejected_total", backend="http://ollama.test") == 1
+
+
+def test_slow_call_is_hedged_after_p95():
+    lock = threading.Lock()
+    calls = 0
+    metrics = Metrics()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        with lock:
+            calls += 1
+            first = calls == 1
+        if first:
+            time.sleep(0.5)  # straggler
+            return httpx.Response(200, json={"message": {"content": "slow"}})
+        return httpx.Response(200, json={"message": {"content": "fast"}})
+
+    resilience = Resilience(
+        hedging=True, hedge_stages=["cta"], hedge_min_samples=5, metrics=metrics
+    )
+    for _ in range(5):
+        resilience.latency.record("cta", 0.02)
+
+    with _client(handler, resilience) as llm:
+        assert llm.generate("sys", "user", stage="cta") == "fast"
+
+    assert calls == 2
+    assert metrics.get("llm_hedges_total", stage="cta", decision="sent") == 1
+    assert metrics.get("llm_hedge_wins_total", stage="cta") == 1
+
+
+def test_abandoned_stream_releases_half_open_trial():
+    calls = 0
+    body = json.dumps({"message": {"content": "Hel"}, "done": False}) + "\n"
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise httpx.ConnectError("refused", request=request)
+        return httpx.Response(200, content=body.encode())
+
+    resilience = Resilience(
+        RetryPolicy(retries=0), breaker_threshold=1, breaker_reset=0
+    )
+    with _client(handler, resilience) as llm:
+        with pytest.raises(RuntimeError, match="Failed to connect"):
+            llm.generate("sys", "user")
+
+        # Half-open trial: the caller stops reading after the first delta
+        deltas = llm.stream("sys", "user")
+        assert next(deltas) == "Hel"
+        deltas.close()
+
+        # Not stuck behind the abandoned trial
+        assert next(llm.stream("sys", "user")) == "Hel"
+
+    assert calls == 3
@@ -0,0 +1,100 @@
+import httpx
+import numpy as np
+
+from reachly_engine.llm.ollama_client import OllamaClient
+from reachly_engine.memory.embeddings import EmbeddingIndex, OllamaEmbedder
+from reachly_engine.memory.retrieval import ProspectIndex, find_similar_prospects
+from reachly_engine.memory.store import MemoryStore
+
+
+def _prospect(name: str, role: str, company: str, industry: str) -> dict:
+    return dict(
+        name=name,
+        role=role,
+        company=company,
+        industry=industry,
+        seniority=None,
+        summary=None,
+        style=None,
+        raw_profile="",
+        source="test",
+    )
+
+
+def test_similar_prospects_match_related_roles_and_industries(tmp_path):
+    store = MemoryStore(db_path=tmp_path / "memory.db")
+    ids = store.save_prospects([
+        _prospect("Ana", "VP Analytics", "PayCo", "payments"),
+        _prospect("Bo", "Backend Engineer", "ShopIt", "retail"),
+        _prospect("Cy", "Recruiter", "TalentX", "staffing"),
+    ])  # stored before indexing: picked up by the first search
+
+    hits = find_similar_prospects(
+        role="Head of Data", industry="fintech", store=store
+    )
+    assert hits[0]["name"] == "Ana"
+    assert all(hit["name"] != "Cy" for hit in hits)
+
+    index = ProspectIndex(store)
+    new_id = store.save_prospect(**_prospect("Di", "Data Lead", "LendCo", "lending"))
+    index.add(new_id)
+    assert index.similar(prospect_id=ids[0], limit=1)[0]["name"] == "Di"
+    index.close()
+
+    # Index files lost: rebuilt from the stored vectors
+    for path in (tmp_path / "embeddings").rglob("*.f32"):
+        path.unlink()
+    reopened = ProspectIndex(store)
+    assert len(reopened.index) == 4
+    assert reopened.similar(prospect_id=new_id, limit=1)[0]["name"] == "Ana"
+    reopened.close()
+    store.close()
+
+
+def test_embedding_index_updates_in_place_and_ivf_matches_exact(tmp_path):
+    rng = np.random.default_rng(0)
+    centers = rng.normal(size=(40, 32))
+    data = centers[rng.integers(0, 40, 4000)] + 0.2 * rng.normal(size=(4000, 32))
+
+    exact = EmbeddingIndex(tmp_path / "exact", "m", 32, ivf_min_rows=10**9)
+    ivf = EmbeddingIndex(tmp_path / "ivf", "m", 32, ivf_min_rows=1000, ivf_probes=8)
+    for index in (exact, ivf):
+        index.add_many(list(range(4000)), data)
+
+    for query in data[:20]:
+        expected = {pid for pid, _ in exact.search(query, 5)}
+        assert len(expected & {pid for pid, _ in ivf.search(query, 5)}) >= 4
+
+    ivf.add(3, data[10])  # re-embedded prospect: same row, new vector
+    assert len(ivf) == 4000
+    assert {pid for pid, _ in ivf.search(data[10], 2)} == {3, 10}
+    assert [pid for pid, _ in ivf.search(data[10], 1, exclude={10})] == [3]
+
+    ivf.close()
+    assert len(EmbeddingIndex(tmp_path / "ivf", "m", 32)) == 4000
+    assert len(EmbeddingIndex(tmp_path / "ivf", "m", 16)) == 0  # other dim: reset
+
+
+def test_ollama_embedder_batches_one_request():
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = request.read().decode()
+        seen.append((request.url.path, body))
+        return httpx.Response(
+            200, json={"embeddings": [[3.0, 4.0], [0.0, 2.0]]}
+        )
+
+    with OllamaClient(
+        base_url="http://ollama.test",
+        model="m",
+        transport=httpx.MockTransport(handler),
+    ) as llm:
+        embedder = OllamaEmbedder(llm, model="nomic-embed-text")
+        vectors = embedder.embed(["a", "b"])
+
+    assert seen[0][0] == "/api/embed"
+    assert '"nomic-embed-text"' in seen[0][1]
+    assert len(seen) == 1
+    assert embedder.dim == 2
+    assert np.allclose(vectors, [[0.6, 0.8], [0.0, 1.0]])
@@ -1,4 +1,9 @@
-from reachly_engine.scraping.cleaner import clean_html, aggressive_cleanup
+import json
+
+from reachly_engine.scraping.cleaner import clean_html, clean_text, aggressive_cleanup
+from reachly_engine.scraping.extract import extract_profile_text
+from reachly_engine.scraping.linkedin import profile_text
+from reachly_engine.scraping.linkedin_json import parse_linkedin_profile
 
 
 def test_html_cleaning():
@@ -20,3 +25,185 @@ def test_html_cleaning():
     assert "This is a test" in text
     assert "alert" not in text
 
+
+def test_extract_profile_text_streams_visible_text_and_profile_json():
+    html = """
+    <html>
+        <head>
+            <title>Ada Lovelace | LinkedIn</title>
+            <style>.x { color: red }</style>
+            <script>window.track("pageview")</script>
+            <script type="application/json">{"firstName": "Ada", "headline": "Engineer"}</script>
+        </head>
+        <body>
+            <h1>Ada Lovelace</h1>
+            <p>Senior Engineer<!-- ember -->at PayCo</p>
+        </body>
+    </html>
+    """
+
+    text = extract_profile_text(html)
+
+    assert text.startswith("Ada Lovelace | LinkedIn")
+    assert "Senior Engineer\nat PayCo" in text
+    assert text.endswith('{"firstName": "Ada", "headline": "Engineer"}')
+    assert "pageview" not in text
+    assert "color" not in text
+
+    # Budget: cut to max_chars, the rest of the page is never parsed
+    long_page = "<body>" + "<p>experience line</p>" * 10000 + "</body>"
+    text = extract_profile_text(long_page, max_chars=100)
+
+    assert len(text) == 100 + len("\n\n[TRUNCATED]")
+    assert text.endswith("[TRUNCATED]")
+
+
+def test_parse_linkedin_profile_from_included_entities():
+    payload = {
+        "included": [
+            {
+                "$type": "com.linkedin.voyager.dash.identity.profile.Profile",
+                "entityUrn": "urn:li:fsd_profile:ACoAAAda",
+                "publicIdentifier": "ada-lovelace",
+                "firstName": "Ada",
+                "lastName": "Lovelace",
+                "headline": "Engineer at PayCo",
+                "summary": "I build payment systems.",
+            },
+            {
+                "$type": "com.linkedin.voyager.dash.identity.profile.Profile",
+                "entityUrn": "urn:li:fsd_profile:ACoAAOther",
+                "publicIdentifier": "someone-else",
+                "firstName": "Other",
+                "lastName": "Person",
+                "headline": "Recruiter",
+                "summary": "Also viewed.",
+                "industryName": "Staffing",
+            },
+            {
+                "$type": "com.linkedin.voyager.identity.profile.Position",
+                "entityUrn": "urn:li:fs_position:(ACoAAAda,11)",
+                "title": "Intern",
+                "companyName": "BankCo",
+                "timePeriod": {"startDate": {"year": 2015}, "endDate": {"year": 2016}},
+            },
+            {
+                "$type": "com.linkedin.voyager.dash.identity.profile.Position",
+                "title": "Senior Engineer",
+                "companyName": "PayCo",
+                "dateRange": {"start": {"year": 2020, "month": 3}},
+            },
+            {
+                "$type": "com.linkedin.voyager.dash.identity.profile.Position",
+                "title": "Senior Engineer",
+                "companyName": "PayCo",
+                "dateRange": {"start": {"year": 2020, "month": 3}},
+            },
+            {
+                "$type": "com.linkedin.voyager.dash.identity.profile.Position",
+                "entityUrn": "urn:li:fsd_position:(ACoAAOther,31)",
+                "title": "Talent Partner",
+                "companyName": "StaffCo",
+                "dateRange": {"start": {"year": 2023}},
+            },
+            {
+                "$type": "com.linkedin.voyager.dash.identity.profile.Education",
+                "profileUrn": "urn:li:fsd_profile:ACoAAOther",
+                "schoolName": "Other University",
+            },
+            {
+                "$type": "com.linkedin.voyager.dash.identity.profile.Education",
+                "schoolName": "MIT",
+                "degreeName": "BSc",
+                "fieldOfStudy": "Computer Science",
+            },
+        ]
+    }
+    html = (
+        "<html><body><h1>Ada Lovelace</h1>"
+        f"<code style='display: none'><!--{json.dumps(payload)}--></code>"
+        "</body></html>"
+    )
+
+    profile = parse_linkedin_profile(
+        html, raw_text="raw", url="https://www.linkedin.com/in/ada-lovelace/"
+    )
+
+    assert profile.name == "Ada Lovelace"
+    assert profile.role == "Senior Engineer"
+    assert profile.company == "PayCo"
+    assert len(profile.positions) == 2  # duplicate entity dropped
+    assert profile.positions[0].start == "2020-03"
+
+    text = profile.prompt_text()
+    assert text.startswith("Name: Ada Lovelace\nHeadline: Engineer at PayCo")
+    assert "- Senior Engineer at PayCo (2020-03 – present)" in text
+    assert "- Intern at BankCo (2015 – 2016)" in text
+    assert "- BSc, Computer Science — MIT" in text
+    assert "Recruiter" not in text
+    # Other members' positions and education in the same payload
+    assert "StaffCo" not in text
+    assert "Other University" not in text
+
+    # No embedded JSON: the page text is the prompt
+    plain = parse_linkedin_profile("<p>Just text</p>", raw_text="Just text")
+    assert not plain.structured
+    assert plain.prompt_text() == "Just text"
+
+
+def test_clean_text_golden_output():
+    text = (
+        "Home\n My Network \nJobs\n\n\n"
+        "Ada Lovelace\nAda Lovelace\n"
+        "Senior Engineer at PayCo  ·  London\t\n"
+        "Connect   Message  More\n"
+        "Followers 1,204\n\n"
+        "Experience\nEngineer\nFull-time\n\n"
+        "Analyst\nFull-time\n\n"
+        "Home\nMy Network\nJobs\n\n"
+        "Led the payments platform migration to a new ledger.\n"
+        "See more\n"
+        "led the payments platform   migration to a new ledger.\n\n"
+        "Sign in to view Ada's full profile"
+    )
+
+    assert clean_text(text) == (
+        "Home\nMy Network\nJobs\n\n"
+        "Ada Lovelace\n"
+        "Senior Engineer at PayCo · London\n"
+        "More\n\n"
+        "Experience\nEngineer\nFull-time\n\n"
+        "Analyst\nFull-time\n\n"
+        "Led the payments platform migration to a new ledger."
+    )
+
+
+def test_noise_rules_match_whole_words_and_skip_profile_json():
+    text = (
+        "Based in Connecticut\n"
+        "Connected with data teams\n"
+        "Messaging and disconnected systems\n"
+        "Connect · Message\n"
+        "Connections 500+ in fintech"
+    )
+    assert clean_text(text) == (
+        "Based in Connecticut\n"
+        "Connected with data teams\n"
+        "Messaging and disconnected systems\n"
+        "·\n"
+        "in fintech"
+    )
+
+    html = (
+        "<body><h1>Ada</h1><p>Sign in to see more</p></body>"
+        '<script>{"firstName": "Ada", "summary": "Sign in flows; Connect APIs"}</script>'
+    )
+    assert profile_text(html) == (
+        'Ada\n\n{"firstName": "Ada", "summary": "Sign in flows; Connect APIs"}'
+    )
+
+
+def test_clean_html_keeps_repeats_and_noise():
+    html = "<p>Connect</p><p>Connect</p><footer>x</footer><p>a \t b</p>"
+
+    assert clean_html(html) == "Connect\nConnect\na b"
@@ -0,0 +1,54 @@
+import json
+
+import httpx
+
+from reachly_engine.llm.metrics import Metrics
+from reachly_engine.llm.ollama_client import OllamaClient
+from reachly_engine.llm.telemetry import Telemetry
+
+TIMINGS = {
+    "model": "m",
+    "total_duration": 3_000_000_000,
+    "load_duration": 2_000_000_000,  # cold load
+    "prompt_eval_count": 400,
+    "prompt_eval_duration": 200_000_000,
+    "eval_count": 50,
+    "eval_duration": 500_000_000,
+}
+
+
+def test_generate_and_stream_record_timings(tmp_path):
+    def handler(request: httpx.Request) -> httpx.Response:
+        if json.loads(request.content)["stream"]:
+            chunks = [
+                {"message": {"content": "Hi"}, "done": False},
+                {"message": {"content": ""}, "done": True, **TIMINGS},
+            ]
+            body = "\n".join(json.dumps(c) for c in chunks) + "\n"
+            return httpx.Response(200, content=body.encode())
+        return httpx.Response(200, json={"message": {"content": "ok"}, **TIMINGS})
+
+    telemetry = Telemetry(metrics=Metrics(), jsonl_path=tmp_path / "calls.jsonl")
+    with OllamaClient(
+        base_url="http://ollama.test",
+        model="m",
+        transport=httpx.MockTransport(handler),
+        telemetry=telemetry,
+    ) as llm:
+        llm.generate("sys", "user", stage="cta")
+        assert "".join(llm.stream("sys", "user", stage="email")) == "Hi"
+
+    cta, email = telemetry.recent
+    assert (cta.stage, email.stage) == ("cta", "email")
+    assert email.streamed and email.eval_count == 50
+    assert cta.prompt_tokens_per_sec == 2000
+    assert cta.eval_tokens_per_sec == 100
+    assert cta.cold_load
+
+    rows = {row["stage"]: row for row in telemetry.summary()}
+    assert rows["cta"]["calls"] == 1
+    assert rows["cta"]["cold_loads"] == 1
+    assert round(rows["cta"]["prompt_eval_share"], 2) == 0.29
+
+    lines = (tmp_path / "calls.jsonl").read_text().splitlines()
+    assert [json.loads(line)["stage"] for line in lines] == ["cta", "email"]
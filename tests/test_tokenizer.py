@@ -0,0 +1,86 @@
+import httpx
+
+from reachly_engine.llm.budget import ContextBudgeter
+from reachly_engine.llm.tokenizer import Tokenizer
+
+
+def _ollama(tokenize: bool, context_length: int = 4096):
+    calls = {"tokenize": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/api/tokenize":
+            calls["tokenize"] += 1
+            if not tokenize:
+                return httpx.Response(404)
+            words = request.read().decode().split()
+            return httpx.Response(200, json={"tokens": list(range(len(words)))})
+
+        return httpx.Response(
+            200,
+            json={
+                "model_info": {
+                    "llama.context_length": context_length,
+                    "tokenizer.ggml.model": "llama",
+                    "tokenizer.ggml.tokens": ["▁hello", "▁world", "▁", "h", "i"],
+                }
+            },
+        )
+
+    return httpx.MockTransport(handler), calls
+
+
+def test_tokenizer_uses_server_and_caches():
+    transport, calls = _ollama(tokenize=True)
+    tok = Tokenizer("http://ollama.test", "m", transport=transport)
+
+    assert tok.count("a b c") > 0
+    assert tok.count("a b c") == tok.count("a b c")
+    assert calls["tokenize"] == 1
+
+
+def test_tokenizer_falls_back_to_model_vocab():
+    transport, _ = _ollama(tokenize=False)
+    tok = Tokenizer("http://ollama.test", "m", transport=transport)
+
+    assert tok.count("hello world") == 2
+    assert tok.count("hi") == 3  # "▁", "h", "i"
+
+
+def test_tokenizer_survives_transient_tokenize_errors():
+    transport, _ = _ollama(tokenize=True)
+    failures = ["timeout", "503"]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/api/tokenize" and failures:
+            failure = failures.pop(0)
+            if failure == "timeout":
+                raise httpx.ReadTimeout("slow start", request=request)
+            return httpx.Response(503)
+        return transport.handle_request(request)
+
+    tok = Tokenizer("http://ollama.test", "m", transport=httpx.MockTransport(handler))
+
+    # Both failures fall back to the vocab for that call only
+    assert tok.count("hello world") == 2
+    assert tok.count("hello world") == 2
+    # Then the server counts again (one token per word here)
+    assert tok.count("a b c d") == 4
+    assert tok.count("hello world hello") == 3
+
+
+def test_budgeter_buckets_num_ctx_and_truncates_to_window():
+    transport, _ = _ollama(tokenize=False, context_length=4096)
+    tok = Tokenizer("http://ollama.test", "m", transport=transport)
+    budgeter = ContextBudgeter(tok, min_num_ctx=2048, max_num_ctx=8192)
+
+    small = budgeter.plan("system", "hello world", output_tokens=256)
+    assert small.num_ctx == 2048
+    assert not small.truncated
+
+    big = budgeter.plan("system", "hello world " * 3000, output_tokens=256)
+    assert big.truncated
+    assert big.num_ctx == 4096
+    assert big.prompt_tokens + big.output_tokens <= 4096
+
+    # A small request after a big one keeps the larger num_ctx (no reload)
+    assert budgeter.plan("system", "hello", output_tokens=64).num_ctx == 4096